@@ -1,9 +1,60 @@
-import json
-
-from typing import Any, Optional, Tuple, Union
-
-from .exceptions import JenkinsNotFoundError
-from .utils import parse_build_url
+import asyncio
+import codecs
+import os
+import re
+
+from contextlib import ExitStack
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote
+
+from .exceptions import JenkinsError, JenkinsNotFoundError
+from .records import BuildRecord
+from .transfer import (
+    construct_multipart,
+    fetch_temp_file,
+    get_artifact_dest,
+    is_file,
+    open_output,
+    search_lines,
+)
+from .utils import (
+    TreeSpec,
+    _iter_concurrently,
+    construct_tree,
+    parse_build_url,
+)
+
+
+class StartResult(NamedTuple):
+    position: int
+    name: str
+    queue_id: Optional[int]
+    error: Optional[Exception]
+
+
+class DownloadResult(NamedTuple):
+    path: str
+    dest: str
+    size: Optional[int]
+    error: Optional[Exception]
+
+
+class OutputMatch(NamedTuple):
+    name: str
+    build_id: Union[int, str]
+    line_number: int
+    line: Any
+    error: Optional[Exception] = None
 
 
 class Builds:
@@ -35,7 +86,7 @@ class Builds:
         """
         return parse_build_url(build_url)
 
-    async def get_all(self, name: str) -> list:
+    async def get_all(self, name: str, *, typed: bool = False) -> list:
         """
         Get list of builds for specified job.
 
@@ -52,6 +103,9 @@ class Builds:
             name (str):
                 Job name or path (if in folder).
 
+            typed (bool):
+                Return compact `records.BuildRecord` objects instead of dicts.
+
         Returns:
             List: list of build for specified job.
         """
@@ -62,9 +116,111 @@ class Builds:
             f'/{folder_name}/job/{job_name}/api/json?tree=allBuilds[number,url]'
         )
 
-        return (await response.json())['allBuilds']
+        builds = (await self.jenkins._read_json(response))['allBuilds']
+        if typed:
+            return [BuildRecord.from_json(build) for build in builds]
+
+        return builds
+
+    @staticmethod
+    def _construct_builds_tree(fields: Optional[TreeSpec]) -> str:
+        if fields is None:
+            return 'number,url'
+
+        tree = construct_tree(fields)
+
+        depth = 0
+        top_fields: List[str] = ['']
+        for char in tree:
+            if char == '[':
+                depth += 1
+            elif char == ']':
+                depth -= 1
+            elif char == ',' and depth == 0:
+                top_fields.append('')
+            elif depth == 0:
+                top_fields[-1] += char
+
+        if 'number' not in top_fields:
+            tree = 'number,' + tree
+
+        return tree
+
+    async def iter_all(self,
+                       name: str,
+                       *,
+                       page_size: int = 100,
+                       fields: Optional[TreeSpec] = None,
+                       newer_than: Optional[int] = None
+                       ) -> AsyncIterator[dict]:
+        """
+        Iterate over builds of specified job page by page, from newest to
+        oldest, so huge build history isn't requested at once.
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            page_size (int):
+                Count of builds requested at once, default is 100.
+
+            fields (Optional[TreeSpec]):
+                Build fields, default is `number` and `url`, note that
+                `number` is always included.
+
+                Example:
+
+                .. code-block:: python
+
+                    ['url', 'result', 'timestamp']
+
+            newer_than (Optional[int]):
+                Stop iteration on specified build number, useful to get only
+                new builds since last synchronization.
+
+        Returns:
+            AsyncIterator[dict]: build properties.
+
+        Example:
+
+        .. code-block:: python
+
+            async for build in jenkins.builds.iter_all('job', newer_than=10):
+                print(build['number'])
+
+        """
+        if page_size <= 0:
+            raise JenkinsError('Invalid `page_size` must be > 0')
 
-    async def get_info(self, name: str, build_id: Union[int, str]) -> dict:
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+        tree = self._construct_builds_tree(fields)
+
+        start = 0
+        while True:
+            response = await self.jenkins._request(
+                'GET',
+                f'/{folder_name}/job/{job_name}/api/json',
+                params={'tree': f'allBuilds[{tree}]{{{start},{start + page_size}}}'}
+            )
+
+            builds = (await self.jenkins._read_json(response))['allBuilds']
+            for build in builds:
+                if newer_than is not None and build['number'] <= newer_than:
+                    return
+                yield build
+
+            if len(builds) < page_size:
+                return
+
+            start += page_size
+
+    async def get_info(self,
+                       name: str,
+                       build_id: Union[int, str],
+                       *,
+                       tree: Optional[TreeSpec] = None,
+                       depth: Optional[int] = None
+                       ) -> dict:
         """
         Get detailed information about specified build number of job.
 
@@ -75,6 +231,12 @@ class Builds:
             build_id (int):
                 Build number or some of standard tags like `lastBuild`.
 
+            tree (Optional[TreeSpec]):
+                Fields to return instead of all, see `utils.construct_tree()`.
+
+            depth (Optional[int]):
+                Depth of returned nested objects.
+
         Returns:
             Dict: information about build.
         """
@@ -83,11 +245,17 @@ class Builds:
         response = await self.jenkins._request(
             'GET',
             f'/{folder_name}/job/{job_name}/{build_id}/api/json',
+            params=self.jenkins._get_api_params(tree, depth),
         )
 
-        return await response.json()
+        return await self.jenkins._read_json(response)
 
-    async def get_url_info(self, build_url: str) -> dict:
+    async def get_url_info(self,
+                           build_url: str,
+                           *,
+                           tree: Optional[TreeSpec] = None,
+                           depth: Optional[int] = None
+                           ) -> dict:
         """
         Extract job name and build number from url and return info about build.
 
@@ -95,11 +263,17 @@ class Builds:
             build_url (str):
                 Job name or path (if in folder).
 
+            tree (Optional[TreeSpec]):
+                Fields to return instead of all, see `utils.construct_tree()`.
+
+            depth (Optional[int]):
+                Depth of returned nested objects.
+
         Returns:
             Dict: information about build.
         """
         job_name, build_id = self.parse_url(build_url)
-        return await self.get_info(job_name, build_id)
+        return await self.get_info(job_name, build_id, tree=tree, depth=depth)
 
     async def get_output(self, name: str, build_id: Union[int, str]) -> str:
         """
@@ -124,6 +298,239 @@ class Builds:
 
         return await response.text()
 
+    async def save_output(self,
+                          name: str,
+                          build_id: Union[int, str],
+                          dest: str,
+                          *,
+                          compression: Optional[str] = None,
+                          chunk_size: int = 65536) -> int:
+        """
+        Save build output to file, raw bytes are streamed to `dest.part` file
+        by chunks without decoding, so whole output isn't kept in memory.
+        Temporary file is renamed to `dest` on success, so existing `dest` is
+        kept if output isn't received.
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+            dest (str):
+                Path of destination file.
+
+            compression (Optional[str]):
+                Compress output on the fly: `gzip` or `zstd`, last one requires
+                `zstandard` package.
+
+            chunk_size (int):
+                Size of chunks which are read from network and written to file.
+
+        Returns:
+            int: count of bytes written to file.
+        """
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+
+        part_dest = os.fspath(dest) + '.part'
+
+        # check arguments before request
+        file = open_output(part_dest, compression)
+
+        try:
+            with file:
+                response = await self.jenkins._request(
+                    'GET',
+                    f'/{folder_name}/job/{job_name}/{build_id}/consoleText',
+                    coalesce=False,
+                )
+                try:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        file.write(chunk)
+                finally:
+                    response.release()
+        except BaseException:
+            os.remove(part_dest)
+            raise
+
+        os.replace(part_dest, os.fspath(dest))
+        return os.path.getsize(dest)
+
+    async def _search_build_output(self,
+                                   name: str,
+                                   build_id: Union[int, str],
+                                   pattern: Pattern,
+                                   first_only: bool,
+                                   chunk_size: int) -> List[OutputMatch]:
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+
+        response = await self.jenkins._request(
+            'GET',
+            f'/{folder_name}/job/{job_name}/{build_id}/consoleText',
+            coalesce=False,
+        )
+
+        try:
+            return [
+                OutputMatch(name, build_id, line_number, line)
+                async for line_number, line in search_lines(
+                    response.content.iter_chunked(chunk_size),
+                    pattern,
+                    first_only,
+                )
+            ]
+        finally:
+            response.release()
+
+    async def search_output(self,
+                            pattern: Union[str, bytes, Pattern],
+                            builds: Iterable[Tuple[str, Union[int, str]]],
+                            *,
+                            concurrency: int = 5,
+                            first_only: bool = False,
+                            chunk_size: int = 65536
+                            ) -> AsyncIterator[OutputMatch]:
+        """
+        Search regular expression in outputs of many builds concurrently,
+        outputs are streamed and matched line by line, so whole output isn't
+        kept in memory. Matches are yielded when output of build is searched.
+
+        Args:
+            pattern (Union[str, bytes, Pattern]):
+                Regular expression, bytes pattern is matched against raw
+                output without decoding.
+
+            builds (Iterable[Tuple[str, Union[int, str]]]):
+                Pairs of job name and build number (or tag like `lastBuild`).
+
+            concurrency (int):
+                Maximum count of outputs streamed at the same time.
+
+            first_only (bool):
+                Stop reading output of build after first match.
+
+            chunk_size (int):
+                Size of chunks which are read from network.
+
+        Returns:
+            AsyncIterator[OutputMatch]: named tuple with job name, build id,
+            line number (starting from 1) and line. Build which output isn`t
+            received is reported by one item with error, line number 0 and
+            empty line.
+
+        Example:
+
+        .. code-block:: python
+
+            builds = [('job', b['number']) for b in (await jenkins.builds.get_all('job'))[:20]]
+
+            async for match in jenkins.builds.search_output('OutOfMemoryError', builds):
+                print(match.build_id, match.line_number, match.line)
+
+        """
+        if isinstance(pattern, (str, bytes)):
+            compiled = re.compile(pattern)  # type: Pattern
+        else:
+            compiled = pattern
+
+        async def search(build: Tuple[str, Union[int, str]]) -> List[OutputMatch]:
+            name, build_id = build
+            return await self._search_build_output(
+                name,
+                build_id,
+                compiled,
+                first_only,
+                chunk_size,
+            )
+
+        empty = b'' if isinstance(compiled.pattern, bytes) else ''
+
+        async for _, (name, build_id), matches, error in _iter_concurrently(
+                search, builds, concurrency, self.jenkins._spawn_hook):
+            if error:
+                yield OutputMatch(name, build_id, 0, empty, error)
+                continue
+
+            for match in matches:
+                yield match
+
+    async def iter_output(self,
+                          name: str,
+                          build_id: Union[int, str],
+                          start: int = 0,
+                          *,
+                          follow: bool = False,
+                          interval: float = 1.0,
+                          chunk_size: int = 65536
+                          ) -> AsyncIterator[str]:
+        """
+        Iterate over console output of specified build by chunks, without
+        loading entire output into memory.
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+            start (int):
+                Offset in bytes from which output is requested.
+
+            follow (bool):
+                Wait for new output until build is completed, default is
+                false, means only currently available output is returned.
+
+            interval (float):
+                Delay between checks of new output in follow mode, default is
+                1 second.
+
+            chunk_size (int):
+                Maximum size of chunk in bytes.
+
+        Returns:
+            AsyncIterator[str]: chunks of build output.
+
+        Example:
+
+        .. code-block:: python
+
+            async for chunk in jenkins.builds.iter_output('job', 1, follow=True):
+                print(chunk, end='')
+
+        """
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+        path = f'/{folder_name}/job/{job_name}/{build_id}/logText/progressiveText'
+
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        while True:
+            response = await self.jenkins._request(
+                'GET',
+                path,
+                params={'start': start},
+                coalesce=False,
+            )
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    text = decoder.decode(chunk)
+                    if text:
+                        yield text
+            finally:
+                response.release()
+
+            start = int(response.headers.get('X-Text-Size', start))
+
+            if not follow or response.headers.get('X-More-Data') != 'true':
+                break
+
+            await asyncio.sleep(interval)
+
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
     async def is_exists(self, name: str, build_id: Union[int, str]) -> bool:
         """
         Check if specified build id of job exists.
@@ -139,19 +546,46 @@ class Builds:
             bool: exists or not.
         """
         try:
-            await self.get_info(name, build_id)
+            await self.get_info(name, build_id, tree='number')
         except JenkinsNotFoundError:
             return False
 
         return True
 
+    async def wait_for_completion(self, name: str, build_id: int) -> dict:
+        """
+        Wait until specified build is completed. Builds of the same job are
+        refreshed together, see `jenkins.watcher`, poll interval can be
+        changed using `jenkins.watcher.interval`.
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number.
+
+        Returns:
+            Dict: build number, building, result and duration.
+
+        Example:
+
+        .. code-block:: python
+
+            job_name, build_id = await jenkins.queue.wait_for_build(queue_id)
+            build = await jenkins.builds.wait_for_completion(job_name, build_id)
+            print(build['result'])
+
+        """
+        return await self.jenkins.watcher.wait(name, build_id)
+
     async def get_queue_id_info(self, queue_id: int) -> dict:
         response = await self.jenkins._request(
             'GET',
             f'/queue/item/{queue_id}/api/json'
         )
 
-        return await response.json()
+        return await self.jenkins._read_json(response)
 
     async def start(self,
                     name: str,
@@ -173,6 +607,12 @@ class Builds:
                 Parameters of triggering build as dict or argument, also
                 parameters can be passed as kwargs.
 
+                Values of file parameters are `pathlib.Path`, binary file
+                objects or async iterators of bytes, they are streamed as
+                multipart form without reading whole file into memory.
+                Streamed body can't be sent again, so such request isn't
+                repeated if CSRF crumb is expired (JenkinsError is raised).
+
                 Examples:
 
                 .. code-block:: python
@@ -181,6 +621,7 @@ class Builds:
                     start(..., a=1, b='string')
                     start(..., parameters=1)
                     start(..., parameters(a=1, b='string'), c=3)
+                    start(..., bundle=pathlib.Path('bundle.tar.gz'))
 
             delay (int):
                 Delay before start, default is 0, no delay.
@@ -202,14 +643,15 @@ class Builds:
                 parameters.update(**kwargs)
 
             formatted_parameters = [
-                {'name': k, 'value': str(v)} for k, v in parameters.items()
+                {'name': k, 'file': k} if is_file(v) else {'name': k, 'value': str(v)}
+                for k, v in parameters.items()
             ]  # type: Any
 
             if len(formatted_parameters) == 1:
                 formatted_parameters = formatted_parameters[0]
 
             data = {
-                'json': json.dumps({
+                'json': self.jenkins._dump_json({
                     'parameter': formatted_parameters,
                     'statusCode': '303',
                     'redirectTo': '.',
@@ -222,18 +664,22 @@ class Builds:
         folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
         path = f'/{folder_name}/job/{job_name}'
 
-        data = format_data(parameters, kwargs)
+        data = format_data(parameters, kwargs)  # type: Any
         if data:
             path += '/buildWithParameters'
         else:
             path += '/build'
 
-        response = await self.jenkins._request(
-            'POST',
-            path,
-            params={'delay': f'{delay}sec'},
-            data=data,
-        )
+        with ExitStack() as stack:
+            if data and any(is_file(v) for v in data.values()):
+                data = construct_multipart(data, stack)
+
+            response = await self.jenkins._request(
+                'POST',
+                path,
+                params={'delay': f'{delay}sec'},
+                data=data,
+            )
 
         try:
             # no queue id returned on Jenkins 1.554
@@ -243,6 +689,59 @@ class Builds:
         except (KeyError, ValueError):
             return None
 
+    async def start_many(self,
+                         items: Iterable[Union[str, tuple]],
+                         concurrency: int = 10
+                         ) -> AsyncIterator[StartResult]:
+        """
+        Enqueue many builds concurrently, results are yielded as soon as each
+        build is enqueued, failure of one build doesn't abort others.
+
+        Args:
+            items (Iterable[Union[str, tuple]]):
+                Job names or tuples of job name, parameters and delay, same as
+                arguments of `start()`, parameters and delay are optional.
+
+                Example:
+
+                .. code-block:: python
+
+                    [
+                        'job',
+                        ('job', {'arg': 1}),
+                        ('folder/job', {'arg': 2}, 10),
+                    ]
+
+            concurrency (int):
+                Maximum count of builds enqueued at the same time.
+
+        Returns:
+            AsyncIterator[StartResult]: named tuple with position of item, job
+            name, queue id (as returned by `start()`) and exception if build
+            isn't enqueued.
+
+        Example:
+
+        .. code-block:: python
+
+            async for result in jenkins.builds.start_many(items):
+                if result.error:
+                    print(result.name, result.error)
+
+        """
+        async def start(item: Union[str, tuple]) -> Optional[int]:
+            if isinstance(item, str):
+                item = (item,)
+
+            parameters = item[1] if len(item) > 1 else None
+            delay = item[2] if len(item) > 2 else 0
+            return await self.start(item[0], parameters, delay)
+
+        async for index, item, queue_id, error in _iter_concurrently(
+                start, items, concurrency, self.jenkins._spawn_hook):
+            name = item if isinstance(item, str) else item[0]
+            yield StartResult(index, name, queue_id, error)
+
     async def stop(self, name: str, build_id: Union[int, str]) -> None:
         """
         Stop specified build.
@@ -284,3 +783,152 @@ class Builds:
             'POST',
             f'/{folder_name}/job/{job_name}/{build_id}/doDelete'
         )
+
+    async def list_artifacts(self, name: str, build_id: Union[int, str]) -> List[dict]:
+        """
+        Get list of build artifacts.
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+        Returns:
+            List[dict]: artifacts with fileName, relativePath (path which is
+            used for download) and displayPath.
+        """
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+
+        response = await self.jenkins._request(
+            'GET',
+            f'/{folder_name}/job/{job_name}/{build_id}/api/json',
+            params={'tree': 'artifacts[displayPath,fileName,relativePath]'},
+        )
+
+        return (await self.jenkins._read_json(response))['artifacts']
+
+    async def download_artifact(self,
+                                name: str,
+                                build_id: Union[int, str],
+                                path: str,
+                                dest: str,
+                                *,
+                                parts: int = 1,
+                                chunk_size: int = 65536,
+                                retries: int = 3) -> int:
+        """
+        Download build artifact to file. Artifact is streamed to `dest.part`
+        file, which is renamed to `dest` after size is verified, so download
+        which is interrupted can be resumed by next call with the same `dest`.
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+            path (str):
+                Relative path of artifact, see `list_artifacts()`.
+
+            dest (str):
+                Path of destination file.
+
+            parts (int):
+                Count of parallel range requests for artifact, which may speed
+                up download of large artifacts. Partial download isn't resumed
+                in this mode.
+
+            chunk_size (int):
+                Size of chunks which are read from network and written to file.
+
+            retries (int):
+                Count of attempts to continue transfer from last received byte
+                when connection is broken.
+
+        Returns:
+            int: size of artifact.
+        """
+        if parts <= 0:
+            raise JenkinsError('Invalid `parts` must be > 0')
+
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+        url = f'/{folder_name}/job/{job_name}/{build_id}/artifact/{quote(path)}'
+
+        temp_dest, size = await fetch_temp_file(
+            self.jenkins,
+            url,
+            os.fspath(dest),
+            parts,
+            chunk_size,
+            retries,
+        )
+
+        received = os.path.getsize(temp_dest)
+        if size is not None and received != size:
+            os.remove(temp_dest)
+            raise JenkinsError(
+                f'Size of artifact `{path}` is {received} bytes, expected {size}'
+            )
+
+        os.replace(temp_dest, os.fspath(dest))
+        return received
+
+    async def download_artifacts(self,
+                                 name: str,
+                                 build_id: Union[int, str],
+                                 dest: str,
+                                 *,
+                                 concurrency: int = 4,
+                                 **kwargs: Any
+                                 ) -> AsyncIterator[DownloadResult]:
+        """
+        Download all build artifacts concurrently to directory, relative
+        paths of artifacts are kept. Results are yielded as soon as each
+        artifact is downloaded, failure of one artifact doesn't abort others.
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+            dest (str):
+                Path of destination directory.
+
+            concurrency (int):
+                Maximum count of artifacts downloaded at the same time.
+
+            kwargs (Any):
+                Options of `download_artifact()`: `parts`, `chunk_size` and
+                `retries`.
+
+        Returns:
+            AsyncIterator[DownloadResult]: named tuple with relative path of
+            artifact, path of file, size and exception if it isn't downloaded.
+        """
+        artifacts = await self.list_artifacts(name, build_id)
+
+        async def download(artifact: dict) -> int:
+            file_path = get_artifact_dest(dest, artifact['relativePath'])
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            return await self.download_artifact(
+                name,
+                build_id,
+                artifact['relativePath'],
+                file_path,
+                **kwargs,
+            )
+
+        async for _, artifact, size, error in _iter_concurrently(
+                download, artifacts, concurrency, self.jenkins._spawn_hook):
+            yield DownloadResult(
+                path=artifact['relativePath'],
+                dest=os.path.join(dest, *artifact['relativePath'].split('/')),
+                size=size,
+                error=error,
+            )
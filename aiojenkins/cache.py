@@ -0,0 +1,167 @@
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from .exceptions import JenkinsError
+
+CACHE_ENDPOINTS = ('nodes', 'plugins', 'status', 'views')
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+class ConfigCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    saved_bytes: int
+
+
+def validate_cache_argument(cache: dict) -> None:
+    for key in cache:
+        if key not in ('maxsize', 'ttl', 'configs'):
+            raise JenkinsError('Unknown key in cache argument: ' + key)
+
+    if cache.get('maxsize', 1) <= 0:
+        raise JenkinsError('Invalid `maxsize` in cache argument must be > 0')
+
+    if cache.get('configs', 0) < 0:
+        raise JenkinsError('Invalid `configs` in cache argument must be >= 0')
+
+    for endpoint in cache.get('ttl', {}):
+        if endpoint not in CACHE_ENDPOINTS:
+            raise JenkinsError('Unknown endpoint in cache ttl argument: ' + endpoint)
+
+
+class ResponseCache:
+    """
+    Size bounded LRU cache of parsed responses with TTL per endpoint.
+    """
+
+    def __init__(self, options: dict) -> None:
+        self.maxsize = options.get('maxsize', 256)
+        self.ttl: Dict[str, float] = options.get('ttl', {})
+
+        self.hits = 0
+        self.misses = 0
+
+        self._items: OrderedDict = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    def is_enabled(self, endpoint: str) -> bool:
+        return self.ttl.get(endpoint, 0) > 0
+
+    def generation(self, endpoint: str) -> int:
+        return self._generations.get(endpoint, 0)
+
+    def get(self, endpoint: str, key: Hashable) -> Tuple[bool, Any]:
+        item = self._items.get((endpoint, key))
+        if item is None:
+            self.misses += 1
+            return False, None
+
+        expires, value = item
+        if expires < time.monotonic():
+            del self._items[(endpoint, key)]
+            self.misses += 1
+            return False, None
+
+        self._items.move_to_end((endpoint, key))
+        self.hits += 1
+        return True, value
+
+    def set(self, endpoint: str, key: Hashable, value: Any, generation: int) -> None:
+        # endpoint was invalidated while response has been requested
+        if generation != self.generation(endpoint):
+            return
+
+        self._items[(endpoint, key)] = (time.monotonic() + self.ttl[endpoint], value)
+        self._items.move_to_end((endpoint, key))
+
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def invalidate(self, *endpoints: str) -> None:
+        for endpoint in endpoints:
+            self._generations[endpoint] = self.generation(endpoint) + 1
+
+        for key in [k for k in self._items if k[0] in endpoints]:
+            del self._items[key]
+
+    def clear(self) -> None:
+        self.invalidate(*CACHE_ENDPOINTS)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses, size=len(self._items))
+
+
+class ValidatorCache:
+    """
+    Size bounded LRU cache of response bodies with their validators, used
+    for conditional requests (`If-None-Match`, `If-Modified-Since`).
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self.saved_bytes = 0
+
+        self._items: OrderedDict = OrderedDict()
+
+    def get_headers(self, key: Hashable) -> dict:
+        item = self._items.get(key)
+        if item is None:
+            return {}
+
+        etag, last_modified, _, _ = item
+
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        return headers
+
+    def hit(self, key: Hashable) -> Optional[str]:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        self.saved_bytes += item[3]
+
+        return item[2]
+
+    def miss(self,
+             key: Hashable,
+             etag: Optional[str],
+             last_modified: Optional[str],
+             body: str,
+             size: int) -> None:
+        self.misses += 1
+
+        if not (etag or last_modified):
+            self._items.pop(key, None)
+            return
+
+        self._items[key] = (etag, last_modified, body, size)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def stats(self) -> ConfigCacheStats:
+        return ConfigCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._items),
+            saved_bytes=self.saved_bytes,
+        )
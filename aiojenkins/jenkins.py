@@ -1,8 +1,21 @@
 import asyncio
+import json
 
 from contextlib import AbstractAsyncContextManager
 from http import HTTPStatus
-from typing import Any, NamedTuple, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from aiohttp import (
     BasicAuth,
@@ -10,15 +23,36 @@ from aiohttp import (
     ClientResponse,
     ClientSession,
     ClientTimeout,
+    CookieJar,
+    FormData,
 )
+from yarl import URL
 
 from .builds import Builds
+from .cache import (
+    CacheStats,
+    ConfigCacheStats,
+    ResponseCache,
+    ValidatorCache,
+    validate_cache_argument,
+)
 from .exceptions import JenkinsError, JenkinsNotFoundError
 from .jobs import Jobs
+from .limiter import RateLimiter
+from .metrics import Metrics, MetricsSnapshot
 from .nodes import Nodes
 from .plugins import Plugins
+from .profiler import Profiler
 from .queue import Queue
+from .session import (
+    ConnectionPoolStats,
+    RetryClientSession,
+    create_connector,
+    validate_connector_argument,
+)
+from .utils import TreeSpec, construct_tree, spawn
 from .views import Views
+from .watcher import EVENT_KINDS, MAX_PENDING_EVENTS, BuildWatcher, EventFeed
 
 
 class JenkinsVersion(NamedTuple):
@@ -28,57 +62,27 @@ class JenkinsVersion(NamedTuple):
     build: int
 
 
-class RetryClientSession:
-
-    def __init__(self, options: dict) -> None:
-        self._validate_retry_argument(options)
-
-        self.total = options['total']
-        self.factor = options.get('factor', 1)
-        self.statuses = options.get('statuses', [])
-
-        self.session = ClientSession()
-
-    @staticmethod
-    def _validate_retry_argument(retry: dict) -> None:
-        for key in retry:
-            if key not in ('total', 'factor', 'statuses'):
-                raise JenkinsError('Unknown key in retry argument: ' + key)
-
-        if retry.get('total', 0) <= 0:
-            raise JenkinsError('Invalid `total` in retry argument must be > 0')
-
-    async def request(self, *args: Any, **kwargs: Any) -> ClientResponse:
-        for total in range(self.total):
-            try:
-                response = await self.session.request(*args, **kwargs)
-            except (ClientError, asyncio.TimeoutError) as e:
-                if total + 1 == self.total:
-                    raise JenkinsError from e
-            else:
-                if response.status not in self.statuses:
-                    break
-
-            await asyncio.sleep(self.factor * (2 ** (total - 1)))
-
-        return response
-
-    async def close(self) -> None:
-        await self.session.close()
-
-
 class Jenkins(AbstractAsyncContextManager):
 
     _session = None
 
-    def __init__(self,
+    def __init__(self,  # pylint: disable=too-many-locals
                  host: str,
                  user: Optional[str] = None,
                  password: Optional[str] = None,
                  *,
                  verify: bool = True,
                  timeout: Optional[float] = None,
-                 retry: Optional[dict] = None
+                 retry: Optional[dict] = None,
+                 connector: Optional[dict] = None,
+                 cache: Optional[dict] = None,
+                 prefetch_crumb: bool = False,
+                 rate_limit: Optional[dict] = None,
+                 coalesce: bool = False,
+                 json_loads: Optional[Callable[[bytes], Any]] = None,
+                 json_dumps: Optional[Callable[[Any], Union[str, bytes]]] = None,
+                 metrics: Optional[dict] = None,
+                 profile: bool = False
                  ) -> None:
         """
         Core library class.
@@ -105,9 +109,21 @@ class Jenkins(AbstractAsyncContextManager):
                 to enable.
 
                 - total: ``int`` Total retries count.
-                - factor: ``int`` Sleep between retries (default 1)
-                    {factor} * (2 ** ({number of total retries} - 1))
+                - factor: ``int`` Sleep between retries (default 1), random
+                    value from 0 to {factor} * (2 ** {number of retry}).
+                - max_delay: ``float`` Maximum sleep between retries, also
+                    limits `Retry-After` header of response (default 60).
                 - statuses: ``List[int]`` HTTP statues retries on. (default [])
+                - methods: ``List[str]`` HTTP methods to retry (default
+                    idempotent: GET, HEAD, OPTIONS, PUT, DELETE, TRACE).
+                    Requests which aren't sent due connection error are
+                    retried regardless of method.
+                - breaker: ``dict`` Circuit breaker options, which fails
+                    requests fast while server is considered down: threshold
+                    (consecutive failures to open, default 5) and timeout
+                    (seconds before probe request, default 30). Instance of
+                    `session.CircuitBreaker` can be passed to share it
+                    between clients. Disabled by default.
 
                 Example:
 
@@ -116,19 +132,163 @@ class Jenkins(AbstractAsyncContextManager):
                     retry = dict(
                         total=10,
                         factor=1,
-                        statuses=[500]
+                        max_delay=30,
+                        statuses=[500, 502, 503],
+                        breaker=dict(threshold=5, timeout=30),
+                    )
+
+            connector (Optional[dict]):
+                Connection pool options of underlying HTTP session, useful to
+                reuse keep-alive connections under high load. Default aiohttp
+                settings are used if not set.
+
+                - limit: ``int`` Total simultaneous connections, 0 means
+                    unlimited (default 100).
+                - limit_per_host: ``int`` Simultaneous connections to the
+                    same host, 0 means unlimited (default 0).
+                - keepalive_timeout: ``float`` Seconds to keep idle
+                    connection open (default 15).
+                - ttl_dns_cache: ``int`` Seconds to cache resolved DNS
+                    records, ``None`` means forever (default 10).
+                - ssl_context: ``ssl.SSLContext`` Pre-built SSL context
+                    shared by all connections.
+
+                Example:
+
+                .. code-block:: python
+
+                    connector = dict(
+                        limit=50,
+                        limit_per_host=50,
+                        keepalive_timeout=60,
+                        ttl_dns_cache=300,
+                    )
+
+            cache (Optional[dict]):
+                In-process cache of read-mostly endpoints, disabled by default.
+                Cached values are shared between callers, so they must not be
+                modified. Cache of endpoint is invalidated when mutating method
+                of that endpoint is called by same client, for example
+                `nodes.create()`.
+
+                - maxsize: ``int`` Maximum count of cached responses, least
+                    recently used are evicted (default 256).
+                - ttl: ``Dict[str, float]`` Seconds to keep response per
+                    endpoint, only listed endpoints are cached. Available
+                    endpoints: `nodes` (nodes.get_all), `plugins`
+                    (plugins.get_all), `status` (get_status) and `views`
+                    (views.get_all).
+                - configs: ``int`` Maximum count of cached XML configs of
+                    jobs, nodes and views, which are requested again using
+                    `If-None-Match` / `If-Modified-Since` headers, so body is
+                    transferred only if config is changed (default 0,
+                    disabled).
+
+                Example:
+
+                .. code-block:: python
+
+                    cache = dict(
+                        maxsize=64,
+                        ttl=dict(nodes=5, plugins=60, status=1, views=10),
+                        configs=1000,
+                    )
+
+            prefetch_crumb (bool):
+                Request CSRF protection crumb on entering async context
+                manager instead of first request (default false).
+
+            rate_limit (Optional[dict]):
+                Client side limit of requests to prevent server overloading,
+                disabled by default. Rate is temporary lowered on 429 and 503
+                responses. With retry every attempt is limited separately,
+                so retried requests also take tokens and throttling responses
+                which are retried lower rate too.
+
+                - rate: ``float`` Requests per second.
+                - burst: ``int`` Requests which can be sent at once before
+                    rate is applied (default is rate).
+                - max_in_flight: ``int`` Maximum count of requests sent at
+                    the same time.
+                - methods: ``Dict[str, dict]`` Separate limits per HTTP
+                    method with the same keys, other methods use common
+                    limits.
+
+                Example:
+
+                .. code-block:: python
+
+                    rate_limit = dict(
+                        rate=50,
+                        max_in_flight=20,
+                        methods=dict(POST=dict(rate=5, max_in_flight=2)),
+                    )
+
+            coalesce (bool):
+                Share one response between identical GET requests (same URL,
+                parameters and headers) which are sent at the same time by
+                different coroutines (default false).
+
+            json_loads (Optional[Callable[[bytes], Any]]):
+                Function used to decode all JSON responses, receives raw body
+                as bytes, default is `json.loads`.
+
+            json_dumps (Optional[Callable[[Any], Union[str, bytes]]]):
+                Function used to encode JSON in requests, default is
+                `json.dumps`.
+
+                Example:
+
+                .. code-block:: python
+
+                    import orjson
+
+                    Jenkins(host, json_loads=orjson.loads, json_dumps=orjson.dumps)
+
+            metrics (Optional[dict]):
+                Collect metrics of requests per endpoint template, see
+                `get_metrics()`. Possible keys: `exporter` - callable which
+                receives `RequestMetric` of each finished request, `buckets` -
+                upper bounds of latency histogram in seconds.
+
+                Example:
+
+                .. code-block:: python
+
+                    metrics = dict(
+                        exporter=lambda m: print(m.endpoint, m.elapsed),
+                        buckets=(0.1, 0.5, 1, 5),
                     )
 
+            profile (bool):
+                Record timeline of requests to `profiler` attribute, which
+                can be saved as HAR file or flame graph summary, last 10000
+                requests are kept (default false).
+
+                Example:
+
+                .. code-block:: python
+
+                    async with Jenkins(host, profile=True) as jenkins:
+                        await jenkins.jobs.get_all()
+                        jenkins.profiler.save_har('jobs.har')
+
         Returns:
             Jenkins instance
         """
         self.host = host.rstrip('/')
         self.verify = verify
         self.retry = retry
+        self.connector = connector
 
         self.auth = None  # type: Any
         self.timeout = None  # type: Any
         self.crumb = None  # type: Any
+        self.prefetch_crumb = prefetch_crumb
+
+        self._crumb_lock = None  # type: Optional[asyncio.Lock]
+        self._crumb_cookie = None  # type: Optional[str]
+        self._crumb_refreshes = 0
 
         if user and password:
             self.auth = BasicAuth(user, password)
@@ -136,24 +296,114 @@ class Jenkins(AbstractAsyncContextManager):
         if timeout:
             self.timeout = ClientTimeout(total=timeout)
 
+        if connector:
+            validate_connector_argument(connector)
+
+        self._limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        self._inflight = {} if coalesce else None  # type: Optional[Dict[Hashable, asyncio.Future]]
+        self._coalesced_requests = 0
+
+        self._json_loads = json_loads or json.loads
+        self._json_dumps = json_dumps or json.dumps
+
+        self._metrics = None  # type: Optional[Metrics]
+        if metrics is not None:
+            self._metrics = Metrics(metrics, prefix=URL(self.host).path)
+
+        self.profiler = None  # type: Optional[Profiler]
+        if profile:
+            self.profiler = Profiler(prefix=URL(self.host).path)
+            self.profiler.start()
+
+        # tasks created by client inherit operation of profiler
+        self._spawn_hook = None  # type: Optional[Callable[[], None]]
+        if self.profiler:
+            self._spawn_hook = self.profiler.inherit_operation
+
+        self._cache = None  # type: Optional[ResponseCache]
+        self._config_cache = None  # type: Optional[ValidatorCache]
+
+        if cache:
+            validate_cache_argument(cache)
+            self._cache = ResponseCache(cache)
+
+            if cache.get('configs'):
+                self._config_cache = ValidatorCache(cache['configs'])
+
         self.builds = Builds(self)
         self.jobs = Jobs(self)
         self.nodes = Nodes(self)
         self.plugins = Plugins(self)
         self.queue = Queue(self)
         self.views = Views(self)
+        self.watcher = BuildWatcher(self)
+        self._feeds: Dict[float, EventFeed] = {}
 
     async def _get_session(self):
         if self._session:
             return self._session
 
+        connector = create_connector(self.connector)
+        trace_configs = [
+            tracer.trace_config
+            for tracer in (self._metrics, self.profiler)
+            if tracer is not None
+        ]
+
         if self.retry:
-            self._session = RetryClientSession(self.retry)
+            self._session = RetryClientSession(
+                self.retry,
+                connector,
+                trace_configs=trace_configs,
+                on_retry=self._metrics.record_retry if self._metrics else None,
+                limiter=self._limiter,
+            )
         else:
-            self._session = ClientSession()
+            self._session = ClientSession(
+                connector=connector,
+                cookie_jar=CookieJar(unsafe=True),
+                trace_configs=trace_configs,
+            )
 
         return self._session
 
+    def _get_session_cookie(self) -> Optional[str]:
+        if not self._session:
+            return None
+
+        cookies = self._session.cookie_jar.filter_cookies(URL(self.host))
+        for name, cookie in cookies.items():
+            if name.startswith('JSESSIONID'):
+                return cookie.value
+
+        return None
+
+    def get_connection_pool_stats(self) -> ConnectionPoolStats:
+        """
+        Get statistics of HTTP connection pool, all zeros before first request.
+
+        Returns:
+            ConnectionPoolStats: named tuple with limit, limit_per_host,
+            acquired (connections in use) and idle (keep-alive connections
+            ready for reuse) counters.
+        """
+        if not self._session or not self._session.connector:
+            return ConnectionPoolStats(0, 0, 0, 0)
+
+        connector = self._session.connector
+
+        # aiohttp doesn't provide public API for pool state
+        acquired = len(getattr(connector, '_acquired', ()))
+        idle = sum(len(c) for c in getattr(connector, '_conns', {}).values())
+
+        return ConnectionPoolStats(
+            limit=connector.limit,
+            limit_per_host=connector.limit_per_host,
+            acquired=acquired,
+            idle=idle,
+        )
+
     async def _http_request(self,
                             method: str,
                             path: str,
@@ -169,20 +419,30 @@ class Jenkins(AbstractAsyncContextManager):
             kwargs['headers'].update(self.crumb)
 
         session = await self._get_session()
-        try:
-            if path.startswith('http'):
-                url = path
-            else:
-                url = self.host + path
 
+        # retrying session applies limiter to every attempt itself
+        limiter = None if isinstance(session, RetryClientSession) else self._limiter
+        if limiter:
+            await limiter.acquire(method)
+
+        url = path if path.startswith('http') else self.host + path
+
+        status = None
+        response = None
+        try:
             response = await session.request(
                 method,
                 url,
                 ssl=self.verify,
                 **kwargs,
             )
+            status = response.status
         except ClientError as e:
             raise JenkinsError from e
+        finally:
+            if limiter:
+                # request is in flight until body of response is received
+                limiter.release(method, status, response)
 
         if response.status == HTTPStatus.NOT_FOUND:
             text = await response.text()
@@ -209,35 +469,259 @@ class Jenkins(AbstractAsyncContextManager):
 
         return response
 
+    async def _read_json(self, response: ClientResponse) -> Any:
+        return self._json_loads(await response.read())
+
+    def _dump_json(self, obj: Any) -> str:
+        data = self._json_dumps(obj)
+        return data.decode() if isinstance(data, bytes) else data
+
     async def _get_crumb(self) -> Union[bool, dict]:
         try:
             response = await self._http_request('GET', '/crumbIssuer/api/json')
         except JenkinsNotFoundError:
             return False
 
-        content = await response.json()
+        content = await self._read_json(response)
+
+        self._crumb_refreshes += 1
+        if self._metrics:
+            self._metrics.record_crumb_refresh()
+        self._crumb_cookie = self._get_session_cookie()
+
         self.crumb = {content['crumbRequestField']: content['crumb']}
         return self.crumb
 
-    async def _request(self,
-                       method: str,
-                       path: str,
-                       **kwargs: Any) -> ClientResponse:
-        """
-        Core class method for endpoints, which wraps auto crumb detection
-        """
-        if self.crumb:
+    async def _refresh_crumb(self, stale: Any) -> None:
+        if self._crumb_lock is None:
+            self._crumb_lock = asyncio.Lock()
+
+        async with self._crumb_lock:
+            # crumb is already refreshed by another coroutine
+            if self.crumb is not stale:
+                return
+
+            self.crumb = await self._get_crumb()
+
+    async def _crumb_request(self,
+                             method: str,
+                             path: str,
+                             **kwargs: Any) -> ClientResponse:
+        crumb = self.crumb
+
+        # crumb is valid only within session where it was issued
+        if crumb and self._crumb_cookie != self._get_session_cookie():
+            await self._refresh_crumb(crumb)
+            crumb = self.crumb
+
+        if crumb:
             try:
                 return await self._http_request(method, path, **kwargs)
             except JenkinsError as e:
                 if e.status != HTTPStatus.FORBIDDEN:
                     raise
 
-        if self.crumb is not False:
-            self.crumb = await self._get_crumb()
+                # streamed body can't be sent again, only crumb is refreshed
+                if isinstance(kwargs.get('data'), FormData):
+                    await self._refresh_crumb(crumb)
+                    raise
+
+        if crumb is not False:
+            await self._refresh_crumb(crumb)
 
         return await self._http_request(method, path, **kwargs)
 
+    @staticmethod
+    def _freeze(value: Any) -> Hashable:
+        if isinstance(value, dict):
+            return tuple(sorted((k, Jenkins._freeze(v)) for k, v in value.items()))
+
+        if isinstance(value, (list, tuple)):
+            return tuple(Jenkins._freeze(v) for v in value)
+
+        try:
+            hash(value)
+        except TypeError:
+            return repr(value)
+
+        return value
+
+    async def _coalesced_request(self, path: str, **kwargs: Any) -> ClientResponse:
+        inflight = self._inflight
+        assert inflight is not None
+
+        key = (path, self._freeze(kwargs))
+
+        task = inflight.get(key)
+        if task is None:
+            async def request() -> ClientResponse:
+                response = await self._crumb_request('GET', path, **kwargs)
+                # body is read once and shared by all waiters
+                await response.read()
+                return response
+
+            task = spawn(request(), self._spawn_hook)
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+            inflight[key] = task
+        else:
+            self._coalesced_requests += 1
+
+        # request continues for other waiters if one is cancelled
+        return await asyncio.shield(task)
+
+    async def _request(self,
+                       method: str,
+                       path: str,
+                       *,
+                       coalesce: bool = True,
+                       **kwargs: Any) -> ClientResponse:
+        """
+        Core class method for endpoints, which wraps auto crumb detection and
+        coalescing of identical GET requests (if enabled), streaming requests
+        must disable coalescing because body is read in advance.
+        """
+        if (coalesce and
+                self._inflight is not None and
+                method == 'GET' and
+                'data' not in kwargs):
+            return await self._coalesced_request(path, **kwargs)
+
+        return await self._crumb_request(method, path, **kwargs)
+
+    @property
+    def crumb_refreshes(self) -> int:
+        """
+        Count of CSRF protection crumbs received from server.
+        """
+        return self._crumb_refreshes
+
+    @property
+    def coalesced_requests(self) -> int:
+        """
+        Count of GET requests which were deduplicated by coalescing.
+        """
+        return self._coalesced_requests
+
+    async def _cached(self,
+                      endpoint: str,
+                      key: Hashable,
+                      fetch: Callable[[], Awaitable[Any]]) -> Any:
+        if not (self._cache and self._cache.is_enabled(endpoint)):
+            return await fetch()
+
+        found, value = self._cache.get(endpoint, key)
+        if found:
+            return value
+
+        generation = self._cache.generation(endpoint)
+        value = await fetch()
+        self._cache.set(endpoint, key, value, generation)
+
+        return value
+
+    async def _get_config(self, path: str) -> str:
+        if not self._config_cache:
+            response = await self._request('GET', path)
+            return await response.text()
+
+        response = await self._request(
+            'GET',
+            path,
+            headers=self._config_cache.get_headers(path),
+        )
+
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            response.release()
+
+            body = self._config_cache.hit(path)
+            if body is not None:
+                return body
+
+            response = await self._request('GET', path)
+
+        size = len(await response.read())
+        body = await response.text()
+
+        self._config_cache.miss(
+            path,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            body,
+            size,
+        )
+
+        return body
+
+    def _invalidate_cache(self, *endpoints: str) -> None:
+        if self._cache:
+            self._cache.invalidate(*endpoints)
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached responses.
+
+        Returns:
+            None
+        """
+        if self._cache:
+            self._cache.clear()
+
+    def get_cache_stats(self) -> CacheStats:
+        """
+        Get statistics of responses cache, all zeros if cache is disabled.
+
+        Returns:
+            CacheStats: named tuple with hits, misses and size (count of
+            cached responses).
+        """
+        if not self._cache:
+            return CacheStats(0, 0, 0)
+
+        return self._cache.stats()
+
+    def get_config_cache_stats(self) -> ConfigCacheStats:
+        """
+        Get statistics of XML configs cache, all zeros if cache is disabled.
+
+        Returns:
+            ConfigCacheStats: named tuple with hits (not modified responses),
+            misses, size (count of cached configs) and saved_bytes (size of
+            bodies which weren't transferred).
+        """
+        if not self._config_cache:
+            return ConfigCacheStats(0, 0, 0, 0)
+
+        return self._config_cache.stats()
+
+    def get_metrics(self) -> MetricsSnapshot:
+        """
+        Get metrics of requests, all zeros if metrics are disabled.
+
+        Returns:
+            MetricsSnapshot: named tuple with latency histogram buckets,
+            endpoints (statistics per method and endpoint template, e.g.
+            `/job/{name}/{build}/api/json`), new and reused connections,
+            crumb refreshes and retries.
+        """
+        if not self._metrics:
+            return MetricsSnapshot((), (), 0, 0, 0, 0)
+
+        return self._metrics.snapshot()
+
+    @staticmethod
+    def _get_api_params(tree: Optional[TreeSpec] = None,
+                        depth: Optional[int] = None
+                        ) -> Optional[dict]:
+        params = {}  # type: dict
+
+        if tree is not None:
+            params['tree'] = construct_tree(tree)
+
+        if depth is not None:
+            params['depth'] = depth
+
+        return params or None
+
     @staticmethod
     def _get_folder_and_job_name(name: str) -> Tuple[str, str]:
         parts = name.split('/')
@@ -257,18 +741,93 @@ class Jenkins(AbstractAsyncContextManager):
         Returns:
             None
         """
+        await self.watcher.close()
+
+        if self.profiler:
+            self.profiler.stop()
+
+        for feed in self._feeds.values():
+            await feed.close()
+
         if self._session:
             await self._session.close()
 
-    async def get_status(self) -> dict:
+    async def get_status(self,
+                         *,
+                         tree: Optional[TreeSpec] = None,
+                         depth: Optional[int] = None
+                         ) -> dict:
         """
         Get server status.
 
+        Args:
+            tree (Optional[TreeSpec]):
+                Fields to return instead of all, see `utils.construct_tree()`.
+
+                Example:
+
+                .. code-block:: python
+
+                    get_status(tree=['mode', {'views': ['name']}])
+
+            depth (Optional[int]):
+                Depth of returned nested objects.
+
         Returns:
             dict: jenkins server details.
         """
-        response = await self._request('GET', '/api/json')
-        return await response.json()
+        params = self._get_api_params(tree, depth)
+
+        async def fetch() -> dict:
+            response = await self._request('GET', '/api/json', params=params)
+            return await self._read_json(response)
+
+        key = tuple(sorted(params.items())) if params else None
+        return await self._cached('status', key, fetch)
+
+    def watch(self,
+              interval: float = 5.0,
+              kinds: Iterable[str] = EVENT_KINDS,
+              max_events: int = MAX_PENDING_EVENTS
+              ) -> AsyncIterator[Any]:
+        """
+        Iterate over server events. Compact snapshots of jobs, nodes and queue
+        are polled and compared, all consumers with the same interval share
+        one poller. First snapshot is used as baseline, so only changes
+        after subscription are yielded.
+
+        Args:
+            interval (float):
+                Delay between snapshots, default is 5 seconds.
+
+            kinds (Iterable[str]):
+                Kinds of events, all by default:
+
+                - jobs: ``BuildStarted``, ``BuildFinished``
+                - nodes: ``NodeOffline``, ``NodeOnline``
+                - queue: ``QueueItemAdded``, ``QueueItemLeft``
+
+            max_events (int):
+                Maximum count of events which are received, but not consumed
+                yet, default is 1000. Iteration of slower consumer is
+                finished by JenkinsError.
+
+        Returns:
+            AsyncIterator[Any]: named tuples of events from `watcher` module.
+
+        Example:
+
+        .. code-block:: python
+
+            async for event in jenkins.watch(kinds=['jobs']):
+                if isinstance(event, BuildFinished):
+                    print(event.job, event.number, event.result)
+
+        """
+        if interval not in self._feeds:
+            self._feeds[interval] = EventFeed(self, interval)
+
+        return self._feeds[interval].subscribe(kinds, max_events)
 
     async def get_version(self) -> JenkinsVersion:
         """
@@ -296,7 +855,7 @@ class Jenkins(AbstractAsyncContextManager):
             bool: ready state.
         """
         try:
-            status = await self.get_status()
+            status = await self.get_status(tree='mode')
             return 'mode' in status
         except JenkinsError:
             return False
@@ -323,6 +882,7 @@ class Jenkins(AbstractAsyncContextManager):
             None
         """
         await self._request('POST', '/quietDown')
+        self._invalidate_cache('status')
 
     async def cancel_quiet_down(self) -> None:
         """
@@ -332,6 +892,7 @@ class Jenkins(AbstractAsyncContextManager):
             None
         """
         await self._request('POST', '/cancelQuietDown')
+        self._invalidate_cache('status')
 
     async def restart(self) -> None:
         """
@@ -341,6 +902,7 @@ class Jenkins(AbstractAsyncContextManager):
             None
         """
         await self._request('POST', '/restart')
+        self._invalidate_cache('status')
 
     async def safe_restart(self) -> None:
         """
@@ -350,6 +912,7 @@ class Jenkins(AbstractAsyncContextManager):
             None
         """
         await self._request('POST', '/safeRestart')
+        self._invalidate_cache('status')
 
     @staticmethod
     def _build_token_url(do: str) -> str:
@@ -375,7 +938,7 @@ class Jenkins(AbstractAsyncContextManager):
             params=params
         )
 
-        content = await response.json()
+        content = await self._read_json(response)
         if content['status'] != 'ok':
             raise JenkinsError('Non OK status returned: ' + str(content))
 
@@ -419,6 +982,15 @@ class Jenkins(AbstractAsyncContextManager):
 
         return await response.text()
 
+    async def __aenter__(self) -> 'Jenkins':
+        """
+        Prefetch crumb if enabled, when being used as an async context manager.
+        """
+        if self.prefetch_crumb and self.crumb is None:
+            await self._refresh_crumb(None)
+
+        return self
+
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """
         Automatically close the client when being used as an async context manager.
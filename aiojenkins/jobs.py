@@ -1,7 +1,10 @@
-from typing import Any, Dict
+import asyncio
 
-from .exceptions import JenkinsNotFoundError
-from .utils import construct_job_config
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import JenkinsError, JenkinsNotFoundError
+from .records import JobRecord
+from .utils import TreeSpec, construct_job_config, construct_tree, spawn
 
 
 class Jobs:
@@ -9,27 +12,163 @@ class Jobs:
     def __init__(self, jenkins) -> None:
         self.jenkins = jenkins
 
-    async def _get_all_jobs(self, url: str, parent: str) -> Dict[str, dict]:
-        all_jobs = {}
-
-        response = await self.jenkins._request('GET', url + '/api/json')
-        jobs = (await response.json())['jobs']
+    @staticmethod
+    def _is_folder(job: dict) -> bool:
+        return 'Folder' in job.get('_class', '')
 
+    @staticmethod
+    def _construct_jobs_tree(tree_depth: Optional[int],
+                             fields: Optional[TreeSpec]
+                             ) -> Optional[str]:
+        if fields is not None and tree_depth is None:
+            tree_depth = 0
+
+        if tree_depth is None:
+            return None
+
+        if tree_depth < 0:
+            raise JenkinsError('Invalid `tree_depth` must be >= 0')
+
+        tree = construct_tree(['_class', 'name', 'url', *([fields] if fields else [])])
+
+        nested = f'jobs[{tree}]'
+        for _ in range(tree_depth):
+            nested = f'jobs[{tree},{nested}]'
+
+        return nested
+
+    async def _get_folder_jobs(self,
+                               url: str,
+                               parent: str,
+                               tree: Optional[str] = None
+                               ) -> Tuple[str, List[dict]]:
+        params = {'tree': tree} if tree else None
+        response = await self.jenkins._request('GET', url + '/api/json', params=params)
+        return parent, (await self.jenkins._read_json(response))['jobs']
+
+    def _flatten_jobs(self,
+                      jobs: List[dict],
+                      parent: str,
+                      unlisted: List[Tuple[str, str]]
+                      ) -> Iterator[Tuple[str, dict]]:
         for job in jobs:
-            all_jobs[parent + job['name']] = job
+            name = parent + job['name']
+            nested = job.pop('jobs', None)
+
+            yield name, job
 
-            if 'Folder' in job.get('_class', ''):
-                all_jobs.update(await self._get_all_jobs(
-                    job['url'],
-                    parent + job['name'] + '/'
-                ))
+            if not self._is_folder(job):
+                continue
 
-        return all_jobs
+            if nested is None:
+                unlisted.append((job['url'], name + '/'))
+            else:
+                yield from self._flatten_jobs(nested, name + '/', unlisted)
 
-    async def get_all(self) -> Dict[str, dict]:
+    async def iter_all(self,
+                       concurrency: int = 10,
+                       tree_depth: Optional[int] = None,
+                       fields: Optional[TreeSpec] = None
+                       ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Iterate over all existed jobs in system, including jobs in folder.
+        Folders are listed concurrently and jobs are yielded as soon as their
+        folder is received, so order is not defined.
+
+        Args:
+            concurrency (int):
+                Maximum count of folders requested at the same time.
+
+            tree_depth (Optional[int]):
+                Enables `tree` query mode, when nested folders up to specified
+                depth are received within one request, deeper folders are
+                requested separately. For example 0 means only selected fields
+                of each folder, 2 means folder and two levels of subfolders.
+
+            fields (Optional[TreeSpec]):
+                Job fields in addition to `_class`, `name` and `url` for `tree`
+                query mode, it's enabled with depth 0 if only fields are set.
+
+                Example:
+
+                .. code-block:: python
+
+                    ['color', {'lastBuild': ['number', 'result']}]
+
+        Returns:
+            AsyncIterator[Tuple[str, dict]]: full job name and job properties.
+
+        Example:
+
+        .. code-block:: python
+
+            async for name, job in jenkins.jobs.iter_all():
+                print(name, job['url'])
+
+        """
+        if concurrency <= 0:
+            raise JenkinsError('Invalid `concurrency` must be > 0')
+
+        tree = self._construct_jobs_tree(tree_depth, fields)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def list_folder(url: str, parent: str) -> Tuple[str, List[dict]]:
+            async with semaphore:
+                return await self._get_folder_jobs(url, parent, tree)
+
+        pending = {spawn(list_folder('', ''), self.jenkins._spawn_hook)}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    parent, jobs = task.result()
+
+                    unlisted = []  # type: List[Tuple[str, str]]
+                    flatten = list(self._flatten_jobs(jobs, parent, unlisted))
+
+                    pending.update(
+                        spawn(list_folder(*folder), self.jenkins._spawn_hook)
+                        for folder in unlisted
+                    )
+
+                    for item in flatten:
+                        yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def get_all(self,
+                      concurrency: int = 10,
+                      tree_depth: Optional[int] = None,
+                      fields: Optional[TreeSpec] = None,
+                      *,
+                      typed: bool = False
+                      ) -> Dict[str, Any]:
         """
         Get dict of all existed jobs in system, including jobs in folder.
 
+        Args:
+            concurrency (int):
+                Maximum count of folders requested at the same time.
+
+            tree_depth (Optional[int]):
+                Enables `tree` query mode, see `iter_all()`. For example
+                whole inventory with two levels of folders is received within
+                one request using `tree_depth=2`.
+
+            fields (Optional[TreeSpec]):
+                Additional job fields for `tree` query mode, see `iter_all()`.
+
+            typed (bool):
+                Return compact `records.JobRecord` objects instead of dicts,
+                can`t be used with `fields`.
+
         Returns: Dict[str, dict] - name and job properties.
 
         Example:
@@ -48,9 +187,21 @@ class Jobs:
             }
 
         """
-        return await self._get_all_jobs('', '')
+        if typed and fields is not None:
+            raise JenkinsError('Argument `fields` can`t be used with `typed`')
+
+        jobs = self.iter_all(concurrency, tree_depth, fields)
+        if typed:
+            return {name: JobRecord.from_json(job) async for name, job in jobs}
+
+        return {name: job async for name, job in jobs}
 
-    async def get_info(self, name: str) -> dict:
+    async def get_info(self,
+                       name: str,
+                       *,
+                       tree: Optional[TreeSpec] = None,
+                       depth: Optional[int] = None
+                       ) -> dict:
         """
         Get detailed information of specified job.
 
@@ -58,6 +209,12 @@ class Jobs:
             name (str):
                 Job name.
 
+            tree (Optional[TreeSpec]):
+                Fields to return instead of all, see `utils.construct_tree()`.
+
+            depth (Optional[int]):
+                Depth of returned nested objects.
+
         Returns:
             dict: job details.
         """
@@ -65,10 +222,11 @@ class Jobs:
 
         response = await self.jenkins._request(
             'GET',
-            f'/{folder_name}/job/{job_name}/api/json'
+            f'/{folder_name}/job/{job_name}/api/json',
+            params=self.jenkins._get_api_params(tree, depth),
         )
 
-        return await response.json()
+        return await self.jenkins._read_json(response)
 
     async def get_config(self, name: str) -> str:
         """
@@ -83,12 +241,7 @@ class Jobs:
         """
         folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
 
-        response = await self.jenkins._request(
-            'GET',
-            f'/{folder_name}/job/{job_name}/config.xml'
-        )
-
-        return await response.text()
+        return await self.jenkins._get_config(f'/{folder_name}/job/{job_name}/config.xml')
 
     async def is_exists(self, name: str) -> bool:
         """
@@ -102,7 +255,7 @@ class Jobs:
             bool: job exists or not
         """
         try:
-            await self.get_info(name)
+            await self.get_info(name, tree='name')
         except JenkinsNotFoundError:
             return False
 
@@ -143,6 +296,7 @@ class Jobs:
             data=config,
             headers=headers
         )
+        self.jenkins._invalidate_cache('status')
 
     async def reconfigure(self, name: str, config: str) -> None:
         """
@@ -168,6 +322,7 @@ class Jobs:
             data=config,
             headers={'Content-Type': 'text/xml'},
         )
+        self.jenkins._invalidate_cache('status')
 
     async def delete(self, name: str) -> None:
         """
@@ -186,6 +341,7 @@ class Jobs:
             'POST',
             f'/{folder_name}/job/{job_name}/doDelete',
         )
+        self.jenkins._invalidate_cache('status')
 
     async def copy(self, name: str, new_name: str) -> None:
         """
@@ -214,6 +370,7 @@ class Jobs:
             f'/{folder_name}/createItem',
             params=params
         )
+        self.jenkins._invalidate_cache('status')
 
     async def rename(self, name: str, new_name: str) -> None:
         """
@@ -240,6 +397,7 @@ class Jobs:
             f'/{folder_name}/job/{job_name}/doRename',
             params=params
         )
+        self.jenkins._invalidate_cache('status')
 
     async def enable(self, name: str) -> None:
         """
@@ -258,6 +416,7 @@ class Jobs:
             'POST',
             f'/{folder_name}/job/{job_name}/enable'
         )
+        self.jenkins._invalidate_cache('status')
 
     async def disable(self, name: str) -> None:
         """
@@ -276,3 +435,4 @@ class Jobs:
             'POST',
             f'/{folder_name}/job/{job_name}/disable'
         )
+        self.jenkins._invalidate_cache('status')
@@ -0,0 +1,140 @@
+import asyncio
+import time
+import weakref
+
+from http import HTTPStatus
+from typing import Dict, Optional
+
+from aiohttp import ClientResponse
+
+from .exceptions import JenkinsError
+
+THROTTLE_STATUSES = (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE)
+
+
+class TokenBucket:
+    """
+    Token bucket of requests rate with optional limit of requests in flight.
+    Rate is halved on throttling response and slowly restored after.
+    """
+
+    def __init__(self,
+                 rate: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 max_in_flight: Optional[int] = None) -> None:
+        self.rate = rate
+        self.current_rate = rate
+        self.burst = burst or max(1, int(rate or 1))
+        self.max_in_flight = max_in_flight
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def acquire(self) -> None:
+        while self.current_rate:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated) * self.current_rate
+            )
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                break
+
+            await asyncio.sleep((1 - self._tokens) / self.current_rate)
+
+        if self.max_in_flight:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            await self._semaphore.acquire()
+
+    def release_slot(self) -> None:
+        if self._semaphore:
+            self._semaphore.release()
+
+    def hold_slot(self, response: ClientResponse) -> None:
+        """
+        Keep slot of request in flight until body of response is read or
+        response is released, so streamed bodies are limited too.
+        """
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self.release_slot()
+
+        connection = response.connection
+        if connection is None:
+            # body is already received
+            release()
+            return
+
+        connection.add_callback(release)
+        # response which is never read or released
+        weakref.finalize(response, release)
+
+    def adjust_rate(self, status: Optional[int]) -> None:
+        if not (self.rate and self.current_rate):
+            return
+
+        if status in THROTTLE_STATUSES:
+            self.current_rate = max(self.rate * 0.1, self.current_rate / 2)
+        else:
+            self.current_rate = min(self.rate, self.current_rate + self.rate * 0.05)
+
+
+class RateLimiter:
+    """
+    Client side limiter of requests, with separate buckets per HTTP method.
+    """
+
+    def __init__(self, options: dict) -> None:
+        self._validate_rate_limit_argument(options)
+
+        self._default = self._create_bucket(options)
+        self._methods: Dict[str, TokenBucket] = {
+            method.upper(): self._create_bucket(method_options)
+            for method, method_options in options.get('methods', {}).items()
+        }
+
+    @staticmethod
+    def _create_bucket(options: dict) -> TokenBucket:
+        return TokenBucket(
+            rate=options.get('rate'),
+            burst=options.get('burst'),
+            max_in_flight=options.get('max_in_flight'),
+        )
+
+    @classmethod
+    def _validate_rate_limit_argument(cls, rate_limit: dict, nested: bool = False) -> None:
+        for key, value in rate_limit.items():
+            if key == 'methods' and not nested:
+                for method_options in value.values():
+                    cls._validate_rate_limit_argument(method_options, nested=True)
+            elif key not in ('rate', 'burst', 'max_in_flight'):
+                raise JenkinsError('Unknown key in rate_limit argument: ' + key)
+            elif value is not None and value <= 0:
+                raise JenkinsError(f'Invalid `{key}` in rate_limit argument must be > 0')
+
+    def get_bucket(self, method: str) -> TokenBucket:
+        return self._methods.get(method.upper(), self._default)
+
+    async def acquire(self, method: str) -> None:
+        await self.get_bucket(method).acquire()
+
+    def release(self,
+                method: str,
+                status: Optional[int],
+                response: Optional[ClientResponse] = None) -> None:
+        bucket = self.get_bucket(method)
+        bucket.adjust_rate(status)
+
+        if response is None or not bucket.max_in_flight:
+            bucket.release_slot()
+        else:
+            bucket.hold_slot(response)
@@ -0,0 +1,280 @@
+import logging
+import time
+
+from bisect import bisect_left
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from aiohttp import TraceConfig
+from yarl import URL
+
+from .exceptions import JenkinsError
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+BUILD_ALIASES = (
+    'lastBuild',
+    'lastCompletedBuild',
+    'lastFailedBuild',
+    'lastStableBuild',
+    'lastSuccessfulBuild',
+    'lastUnstableBuild',
+    'lastUnsuccessfulBuild',
+)
+
+# segment followed by name of object, which is replaced by placeholder
+PLACEHOLDERS = {
+    'job': '{name}',
+    'computer': '{node}',
+    'view': '{view}',
+    'item': '{id}',
+    'user': '{user}',
+}
+
+# segments after which rest of path is file path
+FILE_PATHS = ('artifact', 'ws')
+
+# actions of collections, which look like object names
+COLLECTION_ACTIONS = ('api', 'createItem', 'doCreateItem')
+
+
+class RequestMetric(NamedTuple):
+    method: str
+    endpoint: str
+    status: Optional[int]
+    elapsed: float
+    reused_connection: bool
+
+
+class EndpointMetrics(NamedTuple):
+    method: str
+    endpoint: str
+    requests: int
+    errors: int
+    retries: int
+    total_time: float
+    max_time: float
+    histogram: Tuple[int, ...]
+    response_bytes: int
+
+
+class MetricsSnapshot(NamedTuple):
+    buckets: Tuple[float, ...]
+    endpoints: Tuple[EndpointMetrics, ...]
+    new_connections: int
+    reused_connections: int
+    crumb_refreshes: int
+    retries: int
+
+
+def get_endpoint_template(path: str) -> str:
+    """
+    Replace names of jobs, nodes, views, builds etc in URL path by
+    placeholders, nested folders are merged into one job.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> get_endpoint_template('/job/folder/job/project/12/api/json')
+        '/job/{name}/{build}/api/json'
+    """
+    segments = [s for s in path.split('/') if s]
+    template: List[str] = []
+
+    i = 0
+    while i < len(segments):
+        segment = segments[i]
+        i += 1
+
+        if segment in FILE_PATHS:
+            template += [segment, '{path}'] if i < len(segments) else [segment]
+            break
+
+        if segment in BUILD_ALIASES or (segment.isdigit() and template[-1:] == ['{name}']):
+            template.append('{build}')
+            continue
+
+        placeholder = PLACEHOLDERS.get(segment)
+        if placeholder is None or i == len(segments) or segments[i] in COLLECTION_ACTIONS:
+            template.append(segment)
+            continue
+
+        i += 1
+        if template[-2:] != ['job', placeholder]:
+            template += [segment, placeholder]
+
+    return '/' + '/'.join(template)
+
+
+def validate_metrics_argument(metrics: dict) -> None:
+    for key in metrics:
+        if key not in ('exporter', 'buckets'):
+            raise JenkinsError('Unknown key in metrics argument: ' + key)
+
+    exporter = metrics.get('exporter')
+    if exporter is not None and not callable(exporter):
+        raise JenkinsError('Invalid `exporter` in metrics argument must be callable')
+
+    buckets = list(metrics.get('buckets', LATENCY_BUCKETS))
+    if not buckets or buckets != sorted(set(buckets)):
+        raise JenkinsError('Invalid `buckets` in metrics argument must be ascending')
+
+
+class _Endpoint:
+
+    def __init__(self, buckets_count: int) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.histogram = [0] * (buckets_count + 1)
+        self.response_bytes = 0
+
+
+class Metrics:
+    """
+    Collects metrics of requests with aiohttp tracing: latency histograms
+    and size of responses per endpoint template, connection reuse, crumb
+    refreshes and retries.
+    """
+
+    def __init__(self, options: dict, prefix: str = '') -> None:
+        validate_metrics_argument(options)
+
+        self.buckets = tuple(options.get('buckets', LATENCY_BUCKETS))
+        self.exporter: Optional[Callable[[RequestMetric], Any]] = options.get('exporter')
+
+        self._prefix = prefix.rstrip('/')
+        self._endpoints: Dict[Tuple[str, str], _Endpoint] = {}
+
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.crumb_refreshes = 0
+        self.retries = 0
+
+        self.trace_config = TraceConfig()
+
+        signals: List[Tuple[Any, Any]] = [
+            (self.trace_config.on_request_start, self._on_request_start),
+            (self.trace_config.on_connection_create_end, self._on_connection_create_end),
+            (self.trace_config.on_connection_reuseconn, self._on_connection_reuseconn),
+            (self.trace_config.on_response_chunk_received, self._on_response_chunk_received),
+            (self.trace_config.on_request_end, self._on_request_end),
+            (self.trace_config.on_request_exception, self._on_request_exception),
+        ]
+        for signal, callback in signals:
+            signal.append(callback)
+
+    def _get_template(self, url: URL) -> str:
+        path = url.path
+        if self._prefix and path.startswith(self._prefix):
+            path = path[len(self._prefix):]
+
+        return get_endpoint_template(path)
+
+    def _get_endpoint(self, method: str, template: str) -> _Endpoint:
+        key = (method.upper(), template)
+
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = _Endpoint(len(self.buckets))
+
+        return endpoint
+
+    def _finish(self, ctx: SimpleNamespace, status: Optional[int]) -> None:
+        elapsed = time.monotonic() - ctx.start
+
+        endpoint = ctx.endpoint
+        endpoint.requests += 1
+        endpoint.total_time += elapsed
+        endpoint.max_time = max(endpoint.max_time, elapsed)
+        endpoint.histogram[bisect_left(self.buckets, elapsed)] += 1
+
+        if status is None or status >= 400:
+            endpoint.errors += 1
+
+        if not self.exporter:
+            return
+
+        metric = RequestMetric(
+            method=ctx.method,
+            endpoint=ctx.template,
+            status=status,
+            elapsed=elapsed,
+            reused_connection=ctx.reused,
+        )
+
+        # called from trace callback, error must not break request
+        try:
+            self.exporter(metric)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Metrics exporter failed')
+
+    async def _on_request_start(self, _: Any, ctx: SimpleNamespace, params: Any) -> None:
+        ctx.start = time.monotonic()
+        ctx.reused = False
+        ctx.method = params.method.upper()
+        ctx.template = self._get_template(params.url)
+        ctx.endpoint = self._get_endpoint(ctx.method, ctx.template)
+
+    async def _on_connection_create_end(self, *_: Any) -> None:
+        self.new_connections += 1
+
+    async def _on_connection_reuseconn(self, _: Any, ctx: SimpleNamespace, __: Any) -> None:
+        ctx.reused = True
+        self.reused_connections += 1
+
+    async def _on_response_chunk_received(self,
+                                          _: Any,
+                                          ctx: SimpleNamespace,
+                                          params: Any) -> None:
+        ctx.endpoint.response_bytes += len(params.chunk)
+
+    async def _on_request_end(self, _: Any, ctx: SimpleNamespace, params: Any) -> None:
+        self._finish(ctx, params.response.status)
+
+    async def _on_request_exception(self, _: Any, ctx: SimpleNamespace, __: Any) -> None:
+        self._finish(ctx, None)
+
+    def record_retry(self, method: str, url: Any) -> None:
+        self.retries += 1
+        self._get_endpoint(method, self._get_template(URL(url))).retries += 1
+
+    def record_crumb_refresh(self) -> None:
+        self.crumb_refreshes += 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        endpoints = tuple(
+            EndpointMetrics(
+                method=method,
+                endpoint=template,
+                requests=e.requests,
+                errors=e.errors,
+                retries=e.retries,
+                total_time=e.total_time,
+                max_time=e.max_time,
+                histogram=tuple(e.histogram),
+                response_bytes=e.response_bytes,
+            )
+            for (method, template), e in sorted(self._endpoints.items())
+        )
+
+        return MetricsSnapshot(
+            buckets=self.buckets,
+            endpoints=endpoints,
+            new_connections=self.new_connections,
+            reused_connections=self.reused_connections,
+            crumb_refreshes=self.crumb_refreshes,
+            retries=self.retries,
+        )
+
+    def reset(self) -> None:
+        self._endpoints.clear()
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.crumb_refreshes = 0
+        self.retries = 0
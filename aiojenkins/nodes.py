@@ -1,10 +1,10 @@
-import json
 import xml.etree.ElementTree
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from .exceptions import JenkinsError, JenkinsNotFoundError
-from .utils import construct_node_config, parse_build_url
+from .records import NodeRecord
+from .utils import TreeSpec, construct_node_config, parse_build_url
 
 
 def _parse_rss(rss: str) -> list:
@@ -39,10 +39,14 @@ class Nodes:
             return '(master)'
         return name
 
-    async def get_all(self) -> Dict[str, dict]:
+    async def get_all(self, *, typed: bool = False) -> Dict[str, Any]:
         """
         Get available nodes on server.
 
+        Args:
+            typed (bool):
+                Return compact `records.NodeRecord` objects instead of dicts.
+
         Returns:
             Dict[str, dict]: node name, and it`s detailed information.
 
@@ -56,15 +60,27 @@ class Nodes:
                 }
 
         """
-        response = await self.jenkins._request(
-            'GET',
-            '/computer/api/json'
-        )
-
-        nodes = await response.json()
-        return {v['displayName']: v for v in nodes['computer']}
-
-    async def get_info(self, name: str) -> dict:
+        async def fetch() -> Dict[str, dict]:
+            response = await self.jenkins._request(
+                'GET',
+                '/computer/api/json'
+            )
+
+            nodes = await self.jenkins._read_json(response)
+            return {v['displayName']: v for v in nodes['computer']}
+
+        nodes = await self.jenkins._cached('nodes', None, fetch)
+        if typed:
+            return {name: NodeRecord.from_json(node) for name, node in nodes.items()}
+
+        return nodes
+
+    async def get_info(self,
+                       name: str,
+                       *,
+                       tree: Optional[TreeSpec] = None,
+                       depth: Optional[int] = None
+                       ) -> dict:
         """
         Get node detailed information.
 
@@ -72,6 +88,14 @@ class Nodes:
             name (str):
                 Node name.
 
+            tree (Optional[TreeSpec]):
+                Fields to return instead of all, see `utils.construct_tree()`,
+                note that `_disconnected` is set only if `offline` and
+                `temporarilyOffline` are requested.
+
+            depth (Optional[int]):
+                Depth of returned nested objects.
+
         Returns:
             dict: detailed node information.
         """
@@ -79,14 +103,16 @@ class Nodes:
         response = await self.jenkins._request(
             'GET',
             f'/computer/{name}/api/json',
+            params=self.jenkins._get_api_params(tree, depth),
         )
 
-        info = await response.json()
+        info = await self.jenkins._read_json(response)
 
-        info['_disconnected'] = (
-            info['offline'] is True and
-            info['temporarilyOffline'] is False
-        )
+        if 'offline' in info and 'temporarilyOffline' in info:
+            info['_disconnected'] = (
+                info['offline'] is True and
+                info['temporarilyOffline'] is False
+            )
 
         return info
 
@@ -163,12 +189,7 @@ class Nodes:
             str: node config.
         """
         name = self._normalize_name(name)
-        response = await self.jenkins._request(
-            'GET',
-            f'/computer/{name}/config.xml'
-        )
-
-        return await response.text()
+        return await self.jenkins._get_config(f'/computer/{name}/config.xml')
 
     async def is_exists(self, name: str) -> bool:
         """
@@ -185,7 +206,7 @@ class Nodes:
             return False
 
         try:
-            await self.get_info(name)
+            await self.get_info(name, tree='displayName')
         except JenkinsNotFoundError:
             return False
         return True
@@ -225,7 +246,7 @@ class Nodes:
         params = {
             'name': name,
             'type': config['type'],
-            'json': json.dumps(config)
+            'json': self.jenkins._dump_json(config)
         }
 
         await self.jenkins._request(
@@ -233,6 +254,7 @@ class Nodes:
             '/computer/doCreateItem',
             params=params,
         )
+        self.jenkins._invalidate_cache('nodes')
 
     async def reconfigure(self, name: str, config: str) -> None:
         """
@@ -259,6 +281,7 @@ class Nodes:
             data=config,
             headers={'Content-Type': 'text/xml'},
         )
+        self.jenkins._invalidate_cache('nodes')
 
     async def delete(self, name: str) -> None:
         """
@@ -276,6 +299,7 @@ class Nodes:
             'POST',
             f'/computer/{name}/doDelete'
         )
+        self.jenkins._invalidate_cache('nodes')
 
     async def enable(self, name: str) -> None:
         """
@@ -288,7 +312,7 @@ class Nodes:
         Returns:
             None
         """
-        info = await self.get_info(name)
+        info = await self.get_info(name, tree='temporarilyOffline')
         if info['temporarilyOffline'] is False:
             return
 
@@ -297,6 +321,7 @@ class Nodes:
             'POST',
             f'/computer/{name}/toggleOffline'
         )
+        self.jenkins._invalidate_cache('nodes')
 
     async def disable(self, name: str, message: str = '') -> None:
         """
@@ -312,7 +337,7 @@ class Nodes:
         Returns:
             None
         """
-        info = await self.get_info(name)
+        info = await self.get_info(name, tree='temporarilyOffline')
         if info['temporarilyOffline'] is True:
             return
 
@@ -322,6 +347,7 @@ class Nodes:
             f'/computer/{name}/toggleOffline',
             params={'offlineMessage': message}
         )
+        self.jenkins._invalidate_cache('nodes')
 
     async def update_offline_reason(self, name: str, message: str) -> None:
         """
@@ -343,6 +369,7 @@ class Nodes:
             f'/computer/{name}/changeOfflineCause',
             params={'offlineMessage': message}
         )
+        self.jenkins._invalidate_cache('nodes')
 
     async def launch_agent(self, name: str) -> None:
         """
@@ -364,3 +391,4 @@ class Nodes:
             'POST',
             f'/computer/{name}/launchSlaveAgent'
         )
+        self.jenkins._invalidate_cache('nodes')
@@ -13,10 +13,13 @@ class Plugins:
         Returns:
             Dict[str, dict] - plugin name and plugin properties.
         """
-        response = await self.jenkins._request(
-            'GET',
-            f'/pluginManager/api/json?depth={depth}'
-        )
+        async def fetch() -> Dict[str, dict]:
+            response = await self.jenkins._request(
+                'GET',
+                f'/pluginManager/api/json?depth={depth}'
+            )
 
-        plugins = (await response.json())['plugins']
-        return {p['shortName']: p for p in plugins}
+            plugins = (await self.jenkins._read_json(response))['plugins']
+            return {p['shortName']: p for p in plugins}
+
+        return await self.jenkins._cached('plugins', depth, fetch)
@@ -0,0 +1,396 @@
+import collections
+import contextlib
+import contextvars
+import datetime
+import json
+import sys
+import time
+
+from types import FrameType, SimpleNamespace
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from aiohttp import TraceConfig
+from aiohttp import __version__ as aiohttp_version
+from yarl import URL
+
+from .metrics import get_endpoint_template
+
+_operation: contextvars.ContextVar = contextvars.ContextVar(
+    'aiojenkins_operation',
+    default=None,
+)
+
+# modules of transport level, which are never reported as operation
+_TRANSPORT_MODULES = (__name__, 'aiojenkins.session', 'aiojenkins.utils')
+
+
+class TimelinePhases(NamedTuple):
+    blocked: float
+    dns: float
+    connect: float
+    send: float
+    wait: float
+    receive: float
+
+
+def _find_operation() -> Optional[str]:
+    """
+    Find outermost public method of library on stack of current coroutine,
+    e.g. `Jobs.get_all`, or outermost private one if public isn`t found.
+    """
+    public = private = None
+
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+
+        if module.startswith('aiojenkins.') and module not in _TRANSPORT_MODULES:
+            name = frame.f_code.co_name
+            owner = frame.f_locals.get('self')
+            if owner is not None:
+                name = f'{type(owner).__name__}.{name}'
+
+            if frame.f_code.co_name.startswith('_'):
+                private = name
+            else:
+                public = name
+
+        frame = frame.f_back
+
+    return public or private
+
+
+def get_operation() -> Optional[str]:
+    """
+    Get name of high level operation which issues request: explicitly set by
+    `Profiler.operation()` or found on stack.
+    """
+    operation = _operation.get()
+    if operation is None:
+        operation = _find_operation()
+
+    return operation
+
+
+class TimelineEntry:
+    """
+    Timeline of one HTTP request, durations of phases are in seconds, -1 if
+    phase didn`t take place (e.g. DNS lookup for reused connection). TLS
+    handshake is part of connect phase, aiohttp doesn`t trace it separately.
+    """
+
+    def __init__(self, method: str, url: str, operation: Optional[str]) -> None:
+        self.method = method
+        self.url = url
+        self.operation = operation
+
+        self.started = time.time()
+        self.status: Optional[int] = None
+        self.size = 0
+        self.mime_type = ''
+        self.error: Optional[str] = None
+        self.reused_connection = False
+
+        self._marks: Dict[str, float] = {'start': time.monotonic()}
+
+    def mark(self, name: str) -> None:
+        self._marks[name] = time.monotonic()
+
+    def _span(self, start: str, end: str) -> float:
+        if start not in self._marks or end not in self._marks:
+            return -1
+
+        return max(0.0, self._marks[end] - self._marks[start])
+
+    @property
+    def phases(self) -> TimelinePhases:
+        marks = self._marks
+
+        dns = self._span('dns_start', 'dns_end')
+        connect = self._span('connect_start', 'connect_end')
+        if connect >= 0 and dns >= 0:
+            connect = max(0.0, connect - dns)
+
+        # connection is ready when it's created or taken from pool
+        ready = 'connect_end' if 'connect_end' in marks else 'reuse'
+        if ready not in marks:
+            ready = 'start'
+
+        sent = 'sent' if 'sent' in marks else ready
+        received = 'received' if 'received' in marks else 'response'
+
+        return TimelinePhases(
+            blocked=self._span('queued_start', 'queued_end'),
+            dns=dns,
+            connect=connect,
+            send=self._span(ready, sent),
+            wait=self._span(sent, 'response'),
+            receive=self._span('response', received),
+        )
+
+    @property
+    def elapsed(self) -> float:
+        marks = self._marks
+        end = max(marks.get('received', 0), marks.get('response', 0), marks.get('end', 0))
+        return max(0.0, end - marks['start'])
+
+    def __repr__(self) -> str:
+        return (
+            f'<TimelineEntry {self.method} {self.url} status={self.status} '
+            f'elapsed={self.elapsed:.3f}>'
+        )
+
+
+class Profiler:
+    """
+    Records timeline of requests for profiling: phases, status, size of
+    response and high level operation which issued request. Timeline can be
+    saved as HAR file or summarized as folded stacks for flame graph tools.
+
+    Only last `max_entries` requests are kept. Operation is detected
+    automatically by name of outermost method of library on stack (e.g.
+    `Jobs.get_all`) or can be set explicitly:
+
+    .. code-block:: python
+
+        with jenkins.profiler.operation('sync nodes'):
+            await jenkins.nodes.create(...)
+    """
+
+    def __init__(self, prefix: str = '', max_entries: int = 10000) -> None:
+        self.entries: Deque[TimelineEntry] = collections.deque(maxlen=max_entries)
+        self.recording = False
+
+        self._prefix = prefix.rstrip('/')
+
+        self.trace_config = TraceConfig()
+
+        signals: List[Tuple[Any, Any]] = [
+            (self.trace_config.on_request_start, self._on_request_start),
+            (self.trace_config.on_connection_queued_start, self._mark('queued_start')),
+            (self.trace_config.on_connection_queued_end, self._mark('queued_end')),
+            (self.trace_config.on_connection_create_start, self._mark('connect_start')),
+            (self.trace_config.on_connection_create_end, self._mark('connect_end')),
+            (self.trace_config.on_connection_reuseconn, self._on_connection_reuseconn),
+            (self.trace_config.on_dns_resolvehost_start, self._mark('dns_start')),
+            (self.trace_config.on_dns_resolvehost_end, self._mark('dns_end')),
+            (self.trace_config.on_request_headers_sent, self._mark('sent')),
+            (self.trace_config.on_request_chunk_sent, self._mark('sent')),
+            (self.trace_config.on_response_chunk_received, self._on_response_chunk_received),
+            (self.trace_config.on_request_end, self._on_request_end),
+            (self.trace_config.on_request_exception, self._on_request_exception),
+        ]
+        for signal, callback in signals:
+            signal.append(callback)
+
+    def start(self) -> None:
+        """
+        Start recording of requests.
+        """
+        self.recording = True
+
+    def stop(self) -> None:
+        """
+        Stop recording of requests, recorded timeline is kept.
+        """
+        self.recording = False
+
+    def clear(self) -> None:
+        """
+        Remove recorded timeline.
+        """
+        self.entries.clear()
+
+    def inherit_operation(self) -> None:
+        """
+        Hook of `spawn()`, which sets operation of current stack to context
+        of new task while recording, so requests of task are attributed to it.
+        """
+        if self.recording and _operation.get() is None:
+            _operation.set(_find_operation())
+
+    @staticmethod
+    @contextlib.contextmanager
+    def operation(name: str) -> Iterator[None]:
+        """
+        Set name of operation for all requests within block, including
+        requests of tasks created inside.
+        """
+        token = _operation.set(name)
+        try:
+            yield
+        finally:
+            _operation.reset(token)
+
+    @staticmethod
+    def _mark(name: str) -> Any:
+        async def callback(_: Any, ctx: SimpleNamespace, __: Any) -> None:
+            entry = getattr(ctx, 'entry', None)
+            if entry is not None:
+                entry.mark(name)
+
+        return callback
+
+    async def _on_request_start(self, _: Any, ctx: SimpleNamespace, params: Any) -> None:
+        if not self.recording:
+            return
+
+        ctx.entry = TimelineEntry(params.method.upper(), str(params.url), get_operation())
+        self.entries.append(ctx.entry)
+
+    async def _on_connection_reuseconn(self, _: Any, ctx: SimpleNamespace, __: Any) -> None:
+        entry = getattr(ctx, 'entry', None)
+        if entry is not None:
+            entry.reused_connection = True
+            entry.mark('reuse')
+
+    async def _on_response_chunk_received(self,
+                                          _: Any,
+                                          ctx: SimpleNamespace,
+                                          params: Any) -> None:
+        entry = getattr(ctx, 'entry', None)
+        if entry is not None:
+            entry.size += len(params.chunk)
+            entry.mark('received')
+
+    async def _on_request_end(self, _: Any, ctx: SimpleNamespace, params: Any) -> None:
+        entry = getattr(ctx, 'entry', None)
+        if entry is not None:
+            entry.status = params.response.status
+            entry.mime_type = params.response.content_type
+            entry.mark('response')
+
+    async def _on_request_exception(self, _: Any, ctx: SimpleNamespace, params: Any) -> None:
+        entry = getattr(ctx, 'entry', None)
+        if entry is not None:
+            entry.error = repr(params.exception)
+            entry.mark('end')
+
+    def _get_endpoint(self, url: str) -> str:
+        path = URL(url).path
+        if self._prefix and path.startswith(self._prefix):
+            path = path[len(self._prefix):]
+
+        return get_endpoint_template(path)
+
+    def to_har(self) -> dict:
+        """
+        Get recorded timeline in HAR 1.2 format, requests are grouped to pages
+        by operation. Headers aren`t recorded, because of credentials.
+
+        Returns:
+            dict: HAR log.
+        """
+        pages: Dict[str, dict] = {}
+        entries = []
+
+        for entry in self.entries:
+            started = datetime.datetime.fromtimestamp(
+                entry.started,
+                datetime.timezone.utc,
+            ).isoformat()
+
+            page = entry.operation or 'unknown'
+            if page not in pages:
+                pages[page] = {
+                    'startedDateTime': started,
+                    'id': page,
+                    'title': page,
+                    'pageTimings': {},
+                }
+
+            timings = {k: round(v * 1000, 3) if v >= 0 else -1
+                       for k, v in entry.phases._asdict().items()}
+            timings['ssl'] = -1
+
+            # only optional timings can be -1 by HAR spec
+            for key in ('send', 'wait', 'receive'):
+                timings[key] = max(0, timings[key])
+
+            entries.append({
+                'pageref': page,
+                'startedDateTime': started,
+                'time': round(entry.elapsed * 1000, 3),
+                'request': {
+                    'method': entry.method,
+                    'url': entry.url,
+                    'httpVersion': 'HTTP/1.1',
+                    'cookies': [],
+                    'headers': [],
+                    'queryString': [],
+                    'headersSize': -1,
+                    'bodySize': -1,
+                },
+                'response': {
+                    'status': entry.status or 0,
+                    'statusText': '',
+                    'httpVersion': 'HTTP/1.1',
+                    'cookies': [],
+                    'headers': [],
+                    'content': {'size': entry.size, 'mimeType': entry.mime_type},
+                    'redirectURL': '',
+                    'headersSize': -1,
+                    'bodySize': entry.size,
+                },
+                'cache': {},
+                'timings': timings,
+                '_error': entry.error,
+            })
+
+        return {'log': {
+            'version': '1.2',
+            'creator': {
+                'name': 'aiohttp',
+                'version': aiohttp_version,
+                'comment': 'aiojenkins profiler',
+            },
+            'pages': list(pages.values()),
+            'entries': entries,
+        }}
+
+    def save_har(self, path: str) -> None:
+        """
+        Save recorded timeline as HAR file.
+
+        Args:
+            path (str):
+                Path of file.
+
+        Returns:
+            None
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_har(), f, indent=2)
+
+    def get_flame_summary(self) -> str:
+        """
+        Get recorded timeline as folded stacks (operation, request and phase)
+        with total microseconds, suitable for flamegraph.pl or speedscope.
+
+        Returns:
+            str: lines like `Jobs.get_all;GET /job/{name}/api/json;wait 1200`.
+        """
+        totals: Dict[str, float] = {}
+
+        for entry in self.entries:
+            operation = entry.operation or 'unknown'
+            stack = f'{operation};{entry.method} {self._get_endpoint(entry.url)}'
+
+            for phase, value in entry.phases._asdict().items():
+                if value > 0:
+                    key = f'{stack};{phase}'
+                    totals[key] = totals.get(key, 0) + value
+
+        return '\n'.join(
+            f'{stack} {round(value * 1000000)}'
+            for stack, value in sorted(totals.items())
+        )
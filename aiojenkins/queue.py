@@ -1,4 +1,10 @@
-from typing import Dict
+import asyncio
+
+from typing import Any, Dict, Optional, Tuple
+
+from .exceptions import JenkinsError
+from .records import QueueItemRecord
+from .utils import TreeSpec, parse_build_url
 
 
 class Queue:
@@ -6,10 +12,15 @@ class Queue:
     def __init__(self, jenkins) -> None:
         self.jenkins = jenkins
 
-    async def get_all(self) -> Dict[int, dict]:
+    async def get_all(self, *, typed: bool = False) -> Dict[int, Any]:
         """
         Get server queue.
 
+        Args:
+            typed (bool):
+                Return compact `records.QueueItemRecord` objects instead of
+                dicts.
+
         Returns:
             Dict[int, dict]: id item in queue, and it's detailed information.
         """
@@ -18,10 +29,18 @@ class Queue:
             '/queue/api/json'
         )
 
-        items = (await response.json())['items']
+        items = (await self.jenkins._read_json(response))['items']
+        if typed:
+            return {item['id']: QueueItemRecord.from_json(item) for item in items}
+
         return {item['id']: item for item in items}
 
-    async def get_info(self, item_id: int) -> dict:
+    async def get_info(self,
+                       item_id: int,
+                       *,
+                       tree: Optional[TreeSpec] = None,
+                       depth: Optional[int] = None
+                       ) -> dict:
         """
         Get info about enqueued item (build) identifier.
 
@@ -29,15 +48,67 @@ class Queue:
             item_id (int):
                 enqueued item identifier.
 
+            tree (Optional[TreeSpec]):
+                Fields to return instead of all, see `utils.construct_tree()`.
+
+            depth (Optional[int]):
+                Depth of returned nested objects.
+
         Returns:
             dict: identifier information.
         """
         response = await self.jenkins._request(
             'GET',
             f'/queue/item/{item_id}/api/json',
+            params=self.jenkins._get_api_params(tree, depth),
         )
 
-        return await response.json()
+        return await self.jenkins._read_json(response)
+
+    async def wait_for_build(self,
+                             item_id: int,
+                             *,
+                             interval: float = 0.1,
+                             max_interval: float = 5.0
+                             ) -> Tuple[str, int]:
+        """
+        Wait until enqueued item (build) is started.
+
+        Polling delay is increased after each check starting from `interval`
+        up to `max_interval`, it's increased faster while item is blocked,
+        for example by another build of the same job.
+
+        Args:
+            item_id (int):
+                enqueued item identifier.
+
+            interval (float):
+                Initial delay between checks, default is 0.1 second.
+
+            max_interval (float):
+                Maximum delay between checks, default is 5 seconds.
+
+        Returns:
+            Tuple[str, int]: job name and build number.
+        """
+        while True:
+            item = await self.get_info(
+                item_id,
+                tree='cancelled,blocked,executable[number,url]',
+            )
+
+            if item.get('cancelled'):
+                raise JenkinsError(f'Queue item `{item_id}` is cancelled')
+
+            executable = item.get('executable')
+            if executable:
+                job_name, _ = parse_build_url(executable['url'])
+                return job_name, executable['number']
+
+            await asyncio.sleep(interval)
+
+            factor = 2 if item.get('blocked') else 1.5
+            interval = min(interval * factor, max_interval)
 
     async def cancel(self, item_id: int) -> None:
         """
@@ -0,0 +1,171 @@
+"""
+Compact typed records, which are returned by listing methods instead of dicts
+with `typed=True`. Records have `__slots__`, so they are several times smaller
+than dicts, and strings repeated across objects (`_class`, `color` etc) are
+interned, so every value is stored once. Records contain only listed fields,
+other properties of objects are dropped, use default mode or `get_info()` when
+they are needed.
+
+Example:
+
+.. code-block:: python
+
+    builds = await jenkins.builds.get_all('job', typed=True)
+    print(builds[0].number, builds[0].url)
+"""
+import sys
+
+from typing import Any, Dict, Optional, Tuple
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record:
+    """
+    Base of records, fields are declared by `__slots__` of subclass.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __init__(self, **kwargs: Any) -> None:
+        for name in self.__slots__:
+            setattr(self, name, kwargs.get(name))
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    __hash__ = None  # type: ignore
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get fields of record as dict.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class BuildRecord(Record):
+    """
+    Build of job: `number` and `url`.
+    """
+
+    __slots__ = ('number', 'url')
+
+    number: int
+    url: str
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'BuildRecord':
+        return cls(number=data['number'], url=data['url'])
+
+
+class JobRecord(Record):
+    """
+    Job or folder: short `name`, `url`, `class_name` (value of `_class`) and
+    `color` (None for folders).
+    """
+
+    __slots__ = ('name', 'url', 'class_name', 'color')
+
+    name: str
+    url: str
+    class_name: Optional[str]
+    color: Optional[str]
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'JobRecord':
+        return cls(
+            name=data['name'],
+            url=data['url'],
+            class_name=_intern(data.get('_class')),
+            color=_intern(data.get('color')),
+        )
+
+
+class QueueItemRecord(Record):
+    """
+    Item of queue: `id`, `url`, `class_name` (value of `_class`), `task_name`,
+    `why`, flags `blocked`, `buildable`, `stuck` and `in_queue_since` (ms).
+    """
+
+    __slots__ = (
+        'id',
+        'url',
+        'class_name',
+        'task_name',
+        'why',
+        'blocked',
+        'buildable',
+        'stuck',
+        'in_queue_since',
+    )
+
+    id: int
+    url: Optional[str]
+    class_name: Optional[str]
+    task_name: Optional[str]
+    why: Optional[str]
+    blocked: Optional[bool]
+    buildable: Optional[bool]
+    stuck: Optional[bool]
+    in_queue_since: Optional[int]
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'QueueItemRecord':
+        return cls(
+            id=data['id'],
+            url=data.get('url'),
+            class_name=_intern(data.get('_class')),
+            task_name=(data.get('task') or {}).get('name'),
+            why=_intern(data.get('why')),
+            blocked=data.get('blocked'),
+            buildable=data.get('buildable'),
+            stuck=data.get('stuck'),
+            in_queue_since=data.get('inQueueSince'),
+        )
+
+
+class NodeRecord(Record):
+    """
+    Node: `name` (display name), `class_name` (value of `_class`), flags
+    `offline`, `temporarily_offline`, `idle`, `num_executors` and
+    `offline_cause_reason`.
+    """
+
+    __slots__ = (
+        'name',
+        'class_name',
+        'offline',
+        'temporarily_offline',
+        'idle',
+        'num_executors',
+        'offline_cause_reason',
+    )
+
+    name: str
+    class_name: Optional[str]
+    offline: Optional[bool]
+    temporarily_offline: Optional[bool]
+    idle: Optional[bool]
+    num_executors: Optional[int]
+    offline_cause_reason: Optional[str]
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'NodeRecord':
+        return cls(
+            name=data['displayName'],
+            class_name=_intern(data.get('_class')),
+            offline=data.get('offline'),
+            temporarily_offline=data.get('temporarilyOffline'),
+            idle=data.get('idle'),
+            num_executors=data.get('numExecutors'),
+            offline_cause_reason=_intern(data.get('offlineCauseReason')),
+        )
@@ -0,0 +1,269 @@
+import asyncio
+import email.utils
+import io
+import random
+import ssl
+import time
+
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from aiohttp import (
+    ClientConnectorError,
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    CookieJar,
+    FormData,
+    TCPConnector,
+    TraceConfig,
+)
+
+from .exceptions import JenkinsError
+from .limiter import RateLimiter
+
+
+class ConnectionPoolStats(NamedTuple):
+    limit: int
+    limit_per_host: int
+    acquired: int
+    idle: int
+
+
+def validate_connector_argument(connector: dict) -> None:
+    for key in connector:
+        if key not in ('limit',
+                       'limit_per_host',
+                       'keepalive_timeout',
+                       'ttl_dns_cache',
+                       'ssl_context'):
+            raise JenkinsError('Unknown key in connector argument: ' + key)
+
+    for key in ('limit', 'limit_per_host'):
+        if connector.get(key, 0) < 0:
+            raise JenkinsError(f'Invalid `{key}` in connector argument must be >= 0')
+
+    ssl_context = connector.get('ssl_context')
+    if ssl_context is not None and not isinstance(ssl_context, ssl.SSLContext):
+        raise JenkinsError('Invalid `ssl_context` in connector argument')
+
+
+def create_connector(options: Optional[dict]) -> TCPConnector:
+    if not options:
+        return TCPConnector()
+
+    kwargs = {}  # type: dict
+    for key in ('limit', 'limit_per_host', 'keepalive_timeout', 'ttl_dns_cache'):
+        if key in options:
+            kwargs[key] = options[key]
+
+    if options.get('ssl_context'):
+        kwargs['ssl'] = options['ssl_context']
+
+    return TCPConnector(**kwargs)
+
+
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE')
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, date.timestamp() - time.time())
+
+
+def _is_replayable(data: Any) -> bool:
+    # form with files and streams are consumed by first attempt
+    return not isinstance(data, (FormData, io.IOBase)) and not hasattr(data, '__aiter__')
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast while server is considered down. Breaker is opened
+    after `threshold` consecutive failures, after `timeout` seconds one probe
+    request is allowed (half-open state), which closes breaker on success.
+    """
+
+    def __init__(self, threshold: int = 5, timeout: float = 30.0) -> None:
+        if threshold <= 0:
+            raise JenkinsError('Invalid `threshold` of circuit breaker must be > 0')
+
+        self.threshold = threshold
+        self.timeout = timeout
+
+        self.failures = 0
+        self.opened_at = None  # type: Optional[float]
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def before_request(self) -> None:
+        if self.opened_at is None:
+            return
+
+        if self._probing or time.monotonic() - self.opened_at < self.timeout:
+            raise JenkinsError('Circuit breaker is open, server is considered down')
+
+        self._probing = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+
+        if self._probing or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+        self._probing = False
+
+    def record_abort(self) -> None:
+        # unfinished probe (e.g. cancelled) is failure, otherwise breaker is
+        # never closed, other aborted requests say nothing about server
+        if self._probing:
+            self.record_failure()
+
+
+class RetryClientSession:
+
+    def __init__(self,
+                 options: dict,
+                 connector: Optional[TCPConnector] = None,
+                 trace_configs: Optional[List[TraceConfig]] = None,
+                 on_retry: Optional[Callable[[str, Any], None]] = None,
+                 limiter: Optional[RateLimiter] = None) -> None:
+        self._validate_retry_argument(options)
+
+        self.total = options['total']
+        self.factor = options.get('factor', 1)
+        self.max_delay = options.get('max_delay', 60)
+        self.statuses = options.get('statuses', [])
+        self.methods = [m.upper() for m in options.get('methods', IDEMPOTENT_METHODS)]
+
+        breaker = options.get('breaker')
+        if isinstance(breaker, dict):
+            breaker = CircuitBreaker(**breaker)
+        self.breaker = breaker  # type: Optional[CircuitBreaker]
+        self.on_retry = on_retry
+        self.limiter = limiter
+
+        # cookies of hosts specified by IP address are required for crumb
+        self.session = ClientSession(
+            connector=connector,
+            cookie_jar=CookieJar(unsafe=True),
+            trace_configs=trace_configs,
+        )
+
+    @property
+    def connector(self) -> Any:
+        return self.session.connector
+
+    @property
+    def cookie_jar(self) -> Any:
+        return self.session.cookie_jar
+
+    @staticmethod
+    def _validate_retry_argument(retry: dict) -> None:
+        for key in retry:
+            if key not in ('total', 'factor', 'max_delay', 'statuses', 'methods', 'breaker'):
+                raise JenkinsError('Unknown key in retry argument: ' + key)
+
+        if retry.get('total', 0) <= 0:
+            raise JenkinsError('Invalid `total` in retry argument must be > 0')
+
+        breaker = retry.get('breaker')
+        if breaker is not None and not isinstance(breaker, (dict, CircuitBreaker)):
+            raise JenkinsError('Invalid `breaker` in retry argument')
+
+    def _get_delay(self, attempt: int, response: Optional[ClientResponse]) -> float:
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_delay)
+
+        # full jitter prevents clients from retrying in lock-step
+        return random.uniform(0, min(self.max_delay, self.factor * 2 ** (attempt - 1)))
+
+    async def _send(self, method: str, *args: Any, **kwargs: Any) -> ClientResponse:
+        # every attempt is limited, so retries also take tokens and slots
+        if self.limiter is None:
+            return await self.session.request(method, *args, **kwargs)
+
+        await self.limiter.acquire(method)
+
+        response = None
+        try:
+            response = await self.session.request(method, *args, **kwargs)
+            return response
+        finally:
+            status = response.status if response is not None else None
+            self.limiter.release(method, status, response)
+
+    async def request(self,  # pylint: disable=too-many-branches
+                      method: str,
+                      *args: Any,
+                      **kwargs: Any) -> ClientResponse:
+        retry_method = method.upper() in self.methods
+        replayable = _is_replayable(kwargs.get('data'))
+
+        attempt = 0
+        while True:
+            attempt += 1
+            is_last = attempt == self.total
+
+            if self.breaker:
+                self.breaker.before_request()
+
+            try:
+                response = await self._send(method, *args, **kwargs)
+            except (ClientError, asyncio.TimeoutError) as e:
+                if self.breaker:
+                    self.breaker.record_failure()
+
+                # connection isn't established, so request wasn't sent
+                is_sent = not isinstance(e, ClientConnectorError)
+
+                if is_last or not replayable or (is_sent and not retry_method):
+                    raise JenkinsError from e
+
+                delay = self._get_delay(attempt, None)
+            except BaseException:
+                if self.breaker:
+                    self.breaker.record_abort()
+                raise
+            else:
+                if response.status not in self.statuses:
+                    if self.breaker:
+                        self.breaker.record_success()
+                    return response
+
+                if self.breaker:
+                    self.breaker.record_failure()
+
+                if is_last or not retry_method or not replayable:
+                    return response
+
+                delay = self._get_delay(attempt, response)
+                response.release()
+
+            if self.on_retry:
+                self.on_retry(method, args[0] if args else kwargs.get('url'))
+
+            await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        await self.session.close()
@@ -0,0 +1,335 @@
+import asyncio
+import gzip
+import io
+import os
+import re
+
+from contextlib import ExitStack
+from http import HTTPStatus
+from typing import IO, Any, AsyncIterator, List, Optional, Pattern, Tuple
+
+from aiohttp import ClientError, ClientResponse, FormData
+
+from .exceptions import JenkinsError
+from .utils import spawn
+
+
+def is_file(value: Any) -> bool:
+    return isinstance(value, (os.PathLike, io.IOBase)) or hasattr(value, '__aiter__')
+
+
+def construct_multipart(data: dict, stack: ExitStack) -> FormData:
+    form = FormData()
+
+    for key, value in data.items():
+        if isinstance(value, os.PathLike):
+            # file is closed by stack after request
+            file = open(value, 'rb')  # pylint: disable=consider-using-with
+            value = stack.enter_context(file)
+
+        if isinstance(value, io.IOBase) or hasattr(value, '__aiter__'):
+            filename = os.path.basename(str(getattr(value, 'name', '') or key))
+            form.add_field(
+                key,
+                value,
+                filename=filename,
+                content_type='application/octet-stream',
+            )
+        else:
+            form.add_field(key, str(value))
+
+    return form
+
+
+def open_output(dest: str, compression: Optional[str]) -> Any:
+    if compression is None:
+        return open(dest, 'wb')  # pylint: disable=consider-using-with
+
+    if compression == 'gzip':
+        return gzip.open(dest, 'wb')
+
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise JenkinsError(
+                'Package `zstandard` is required for zstd compression'
+            ) from e
+
+        file = open(dest, 'wb')  # pylint: disable=consider-using-with
+        return zstandard.ZstdCompressor().stream_writer(file, closefd=True)
+
+    raise JenkinsError('Unknown compression: ' + compression)
+
+
+# longer lines of output are truncated by search
+MAX_LINE_SIZE = 1024 * 1024
+
+
+async def iter_lines_blocks(chunks: AsyncIterator[bytes],
+                            max_line: int = MAX_LINE_SIZE) -> AsyncIterator[bytes]:
+    """
+    Join chunks of stream to blocks of complete lines, so line which is split
+    between chunks is in one block. Part of line carried over to next chunk
+    is limited by `max_line` bytes, rest of longer line is dropped.
+    """
+    parts: List[bytes] = []
+    size = 0
+
+    async for chunk in chunks:
+        end = chunk.rfind(b'\n') + 1
+
+        if not end:
+            if size < max_line:
+                parts.append(chunk[:max_line - size])
+            size += len(chunk)
+            continue
+
+        if size >= max_line:
+            # drop rest of too long line
+            parts.append(chunk[chunk.find(b'\n'):end])
+        else:
+            parts.append(chunk[:end])
+
+        yield b''.join(parts)
+
+        tail = chunk[end:]
+        parts = [tail[:max_line]]
+        size = len(tail)
+
+    block = b''.join(parts)
+    if block:
+        yield block
+
+
+# tokens of patterns which can match single line, but not block of lines
+LINE_ONLY_TOKENS = ('\\A', '\\Z', '(?!', '(?<!')
+
+
+def _is_block_searchable(pattern: Pattern) -> bool:
+    source = pattern.pattern
+    if isinstance(source, bytes):
+        source = source.decode('latin-1')
+
+    return not any(token in source for token in LINE_ONLY_TOKENS)
+
+
+async def search_lines(chunks: AsyncIterator[bytes],
+                       pattern: Pattern,
+                       first_only: bool) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Yield numbers (starting from 1) and lines of stream which match pattern,
+    lines are decoded unless pattern is bytes.
+    """
+    # whole block of lines is searched first, most of blocks don't match
+    block_pattern = None
+    if _is_block_searchable(pattern):
+        block_pattern = re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+
+    binary = isinstance(pattern.pattern, bytes)
+    newline: Any = b'\n' if binary else '\n'
+
+    line_number = 0
+
+    async for data in iter_lines_blocks(chunks):
+        block: Any = data if binary else data.decode(errors='replace')
+
+        if block_pattern is not None and block_pattern.search(block) is None:
+            line_number += data.count(b'\n')
+            continue
+
+        lines = block.split(newline)
+        if block.endswith(newline):
+            lines.pop()
+
+        for line in lines:
+            line_number += 1
+
+            if pattern.search(line):
+                yield line_number, line
+
+                if first_only:
+                    return
+
+
+def _get_full_size(response: ClientResponse, offset: int) -> Optional[int]:
+    content_range = response.headers.get('Content-Range', '')
+    if '/' in content_range:
+        total = content_range.rsplit('/', 1)[1]
+        return int(total) if total.isdigit() else None
+
+    if response.content_length is not None:
+        return offset + response.content_length
+
+    return None
+
+
+async def get_size(jenkins: Any, path: str) -> Tuple[Optional[int], bool]:
+    """
+    Get size of file and flag if range requests are supported.
+    """
+    response = await jenkins._request('HEAD', path)
+    response.release()
+
+    accept_ranges = response.headers.get('Accept-Ranges') == 'bytes'
+    return response.content_length, accept_ranges
+
+
+async def fetch_range(jenkins: Any,
+                      path: str,
+                      file: IO[bytes],
+                      start: int,
+                      end: Optional[int],
+                      chunk_size: int,
+                      retries: int) -> Optional[int]:
+    """
+    Write bytes from start to end (inclusive, None means end of file) to the
+    same offset of file, interrupted or short transfer is continued by range
+    request. Returns full size of file if it's known.
+    """
+    position = start
+    attempt = 0
+
+    while True:
+        headers = {}
+        if position or end is not None:
+            headers['Range'] = f'bytes={position}-{"" if end is None else end}'
+
+        try:
+            response = await jenkins._request('GET', path, headers=headers, coalesce=False)
+        except JenkinsError as e:
+            # requested range is after end, so file is received
+            if e.status == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE and end is None:
+                return (await get_size(jenkins, path))[0]
+            raise
+
+        try:
+            if headers and response.status != HTTPStatus.PARTIAL_CONTENT:
+                if end is not None:
+                    raise JenkinsError('Server doesn`t support range requests')
+
+                # range is ignored, so file is received from beginning
+                position = 0
+                file.truncate(0)
+
+            size = _get_full_size(response, position)
+
+            file.seek(position)
+            async for chunk in response.content.iter_chunked(chunk_size):
+                file.write(chunk)
+                position += len(chunk)
+
+            # pre-allocated file has right size anyway, so bytes are counted
+            if end is None or position == end + 1:
+                return size
+
+            if position > end + 1:
+                raise JenkinsError('Server sent more bytes than requested range')
+        except (ClientError, asyncio.TimeoutError) as e:
+            attempt += 1
+            if attempt > retries:
+                raise JenkinsError('Download is interrupted') from e
+            continue
+        finally:
+            response.release()
+
+        # range is received partially, rest of it is requested again
+        attempt += 1
+        if attempt > retries:
+            raise JenkinsError(
+                f'Range of file from {start} byte is received partially, '
+                f'{position - start} bytes'
+            )
+
+
+def get_artifact_dest(dest: str, relative_path: str) -> str:
+    """
+    Join relative path of artifact, which is received from server, to
+    destination directory, path which points outside of it is rejected.
+    """
+    segments = relative_path.replace('\\', '/').split('/')
+    file_path = os.path.join(dest, *segments)
+
+    root = os.path.realpath(dest)
+    inside = os.path.commonpath([root, os.path.realpath(file_path)]) == root
+
+    if os.path.isabs(relative_path) or '..' in segments or not inside:
+        raise JenkinsError(f'Invalid path of artifact `{relative_path}`')
+
+    return file_path
+
+
+async def fetch_parts(jenkins: Any,
+                      path: str,
+                      dest: str,
+                      size: int,
+                      parts: int,
+                      chunk_size: int,
+                      retries: int) -> None:
+    """
+    Write file by parts in parallel to pre-allocated dest, which is removed
+    if any part is failed, because it has holes and can`t be resumed.
+    """
+    with open(dest, 'wb') as f:
+        f.truncate(size)
+
+    part_size = -(-size // parts)
+
+    async def fetch(start: int) -> None:
+        with open(dest, 'r+b') as f:
+            end = min(start + part_size, size) - 1
+            await fetch_range(jenkins, path, f, start, end, chunk_size, retries)
+
+    tasks = [spawn(fetch(start), jenkins._spawn_hook) for start in range(0, size, part_size)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        os.remove(dest)
+        raise
+
+
+async def fetch_file(jenkins: Any,
+                     path: str,
+                     dest: str,
+                     chunk_size: int,
+                     retries: int) -> Optional[int]:
+    # partially received file of previous call is continued
+    offset = os.path.getsize(dest) if os.path.exists(dest) else 0
+
+    with open(dest, 'r+b' if offset else 'wb') as f:
+        return await fetch_range(jenkins, path, f, offset, None, chunk_size, retries)
+
+
+async def fetch_temp_file(jenkins: Any,
+                          path: str,
+                          dest: str,
+                          parts: int,
+                          chunk_size: int,
+                          retries: int) -> Tuple[str, Optional[int]]:
+    """
+    Download file to temporary file near dest, file is downloaded by parts
+    in parallel if it's possible. Returns path of temporary file and full
+    size of file if it's known.
+    """
+    part_dest = dest + '.part'
+
+    size, accept_ranges = None, False
+    if parts > 1:
+        size, accept_ranges = await get_size(jenkins, path)
+
+    if not size or not accept_ranges or size < parts * chunk_size:
+        return part_dest, await fetch_file(jenkins, path, part_dest, chunk_size, retries)
+
+    # pre-allocated file has holes until all parts are received, so it's
+    # never resumed as `.part` file
+    parts_dest = dest + '.parts'
+    await fetch_parts(jenkins, path, parts_dest, size, parts, chunk_size, retries)
+
+    if os.path.exists(part_dest):
+        os.remove(part_dest)
+
+    return parts_dest, size
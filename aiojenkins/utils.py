@@ -1,6 +1,20 @@
+import asyncio
+import contextvars
 import re
 
-from typing import List, Optional, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from xml.dom import minidom
 from xml.etree.ElementTree import Element, SubElement, tostring
 
@@ -10,6 +24,64 @@ JOB_BUILD_URL_RE = re.compile(
     r'/job/(?P<job_name>.+)/(?P<build_number>\d+)'
 )
 
+TreeSpec = Union[str, Sequence[Any], Dict[str, Any]]
+
+
+def spawn(coro: Awaitable[Any], hook: Optional[Callable[[], None]] = None) -> asyncio.Future:
+    """
+    Schedule coroutine as task. Hook is called within copy of current context
+    which is inherited by task, e.g. to set context variables of task.
+    """
+    if hook is None:
+        return asyncio.ensure_future(coro)
+
+    context = contextvars.copy_context()
+    context.run(hook)
+
+    # task copies current context, so it's created within prepared one
+    return context.run(asyncio.ensure_future, coro)
+
+
+async def _iter_concurrently(func: Callable[[Any], Awaitable[Any]],
+                             items: Iterable[Any],
+                             concurrency: int,
+                             hook: Optional[Callable[[], None]] = None
+                             ) -> AsyncIterator[Tuple[int, Any, Any, Optional[Exception]]]:
+    """
+    Call coroutine function for each item with bounded concurrency and yield
+    index, item, result and exception as soon as each call is completed.
+    """
+    if concurrency <= 0:
+        raise JenkinsError('Invalid `concurrency` must be > 0')
+
+    results: asyncio.Queue = asyncio.Queue()
+    iterator = enumerate(items)
+
+    async def worker() -> None:
+        try:
+            for index, item in iterator:
+                try:
+                    results.put_nowait((index, item, await func(item), None))
+                except Exception as e:  # pylint: disable=broad-except
+                    results.put_nowait((index, item, None, e))
+        finally:
+            results.put_nowait(None)
+
+    workers = [spawn(worker(), hook) for _ in range(concurrency)]
+    try:
+        running = len(workers)
+        while running:
+            result = await results.get()
+            if result is None:
+                running -= 1
+            else:
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+
+        await asyncio.gather(*workers, return_exceptions=True)
+
 
 def _construct_commands_block(parent, commands: List[str]) -> None:
     SubElement(parent, 'command').text = '\n'.join(commands)
@@ -164,3 +236,33 @@ def parse_build_url(build_url: str) -> Tuple[str, int]:
     ))
 
     return name, int(match.group('build_number'))
+
+
+def construct_tree(spec: TreeSpec) -> str:
+    """
+    Construct value of `tree` query parameter from nested fields spec.
+
+    Args:
+        spec (TreeSpec):
+            Ready to use string, list of fields or dict where key is field
+            and value is spec of its nested fields.
+
+            Example:
+
+            .. code-block:: python
+
+                >>> construct_tree(['name', {'lastBuild': ['number', 'result']}])
+                'name,lastBuild[number,result]'
+
+    Returns:
+        str: tree query value.
+    """
+    if isinstance(spec, str):
+        return spec
+
+    if isinstance(spec, dict):
+        return ','.join(
+            f'{field}[{construct_tree(nested)}]' for field, nested in spec.items()
+        )
+
+    return ','.join(construct_tree(field) for field in spec)
@@ -15,8 +15,17 @@ class Views:
         Returns:
             Dict[str, dict] - plugin name and plugin properties.
         """
-        status = await self.jenkins.get_status()
-        return {v['name']: v for v in status['views']}
+        async def fetch() -> Dict[str, dict]:
+            response = await self.jenkins._request(
+                'GET',
+                '/api/json',
+                params={'tree': 'views[_class,name,url]'},
+            )
+
+            status = await self.jenkins._read_json(response)
+            return {v['name']: v for v in status['views']}
+
+        return await self.jenkins._cached('views', None, fetch)
 
     async def is_exists(self, name: str) -> bool:
         """
@@ -43,12 +52,7 @@ class Views:
         Returns:
             str: XML config of view.
         """
-        response = await self.jenkins._request(
-            'GET',
-            f'/view/{name}/config.xml'
-        )
-
-        return await response.text()
+        return await self.jenkins._get_config(f'/view/{name}/config.xml')
 
     async def create(self, name: str, config: str) -> None:
         """
@@ -77,6 +81,7 @@ class Views:
             params=params,
             headers=headers,
         )
+        self.jenkins._invalidate_cache('views', 'status')
 
     async def reconfigure(self, name: str, config: str) -> None:
         """
@@ -98,6 +103,7 @@ class Views:
             data=config,
             headers={'Content-Type': 'text/xml'},
         )
+        self.jenkins._invalidate_cache('views', 'status')
 
     async def delete(self, name: str) -> None:
         """
@@ -111,3 +117,4 @@ class Views:
             None
         """
         await self.jenkins._request('POST', f'/view/{name}/doDelete')
+        self.jenkins._invalidate_cache('views', 'status')
@@ -0,0 +1,413 @@
+import asyncio
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .exceptions import JenkinsError, JenkinsNotFoundError
+from .utils import spawn
+
+EVENT_KINDS = ('jobs', 'nodes', 'queue')
+
+MAX_PENDING_EVENTS = 1000
+
+
+class BuildStarted(NamedTuple):
+    job: str
+    number: int
+
+
+class BuildFinished(NamedTuple):
+    job: str
+    number: int
+    result: Optional[str]
+
+
+class NodeOffline(NamedTuple):
+    node: str
+    reason: Optional[str]
+
+
+class NodeOnline(NamedTuple):
+    node: str
+
+
+class QueueItemAdded(NamedTuple):
+    item_id: int
+    job: Optional[str]
+
+
+class QueueItemLeft(NamedTuple):
+    item_id: int
+    job: Optional[str]
+
+
+def _diff_jobs(old: Dict[str, dict], new: Dict[str, dict]) -> List[Any]:
+    events: List[Any] = []
+
+    for job, builds in new.items():
+        previous = old.get(job, {})
+
+        for number, (building, result) in sorted(builds.items()):
+            if number not in previous:
+                events.append(BuildStarted(job, number))
+            elif not previous[number][0]:
+                continue
+
+            if not building:
+                events.append(BuildFinished(job, number, result))
+
+    return events
+
+
+def _diff_nodes(old: Dict[str, tuple], new: Dict[str, tuple]) -> List[Any]:
+    events: List[Any] = []
+
+    for node, (offline, reason) in new.items():
+        was_offline = old.get(node, (False, None))[0]
+
+        if offline and not was_offline:
+            events.append(NodeOffline(node, reason))
+        elif was_offline and not offline:
+            events.append(NodeOnline(node))
+
+    return events
+
+
+def _diff_queue(old: Dict[int, str], new: Dict[int, str]) -> List[Any]:
+    events: List[Any] = []
+
+    for item_id in new.keys() - old.keys():
+        events.append(QueueItemAdded(item_id, new[item_id]))
+
+    for item_id in old.keys() - new.keys():
+        events.append(QueueItemLeft(item_id, old[item_id]))
+
+    return events
+
+
+class BuildWatcher:
+    """
+    Waits for completion of builds. Watched builds are grouped by job, so all
+    builds of one job are refreshed within one request per poll.
+    """
+
+    def __init__(self, jenkins, interval: float = 5.0) -> None:
+        self.jenkins = jenkins
+        self.interval = interval
+
+        self._watched: Dict[str, Dict[int, List[asyncio.Future]]] = {}
+        self._ranges: Dict[str, int] = {}
+        self._task: Optional[asyncio.Future] = None
+
+    async def wait(self, name: str, build_id: int) -> dict:
+        """
+        Wait until specified build is completed.
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number.
+
+        Returns:
+            dict: build number, building, result and duration.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        builds = self._watched.setdefault(name, {})
+        builds.setdefault(build_id, []).append(future)
+
+        if self._task is None or self._task.done():
+            self._task = spawn(self._poll(), self.jenkins._spawn_hook)
+
+        try:
+            return await future
+        finally:
+            self._forget(name, build_id, future)
+
+    def _forget(self, name: str, build_id: int, future: asyncio.Future) -> None:
+        builds = self._watched.get(name, {})
+        futures = builds.get(build_id, [])
+
+        if future in futures:
+            futures.remove(future)
+
+        if not futures:
+            builds.pop(build_id, None)
+
+        if not builds:
+            self._watched.pop(name, None)
+            self._ranges.pop(name, None)
+
+    @staticmethod
+    def _resolve(futures: List[asyncio.Future],
+                 result: Optional[dict] = None,
+                 exception: Optional[Exception] = None) -> None:
+        for future in futures:
+            if future.done():
+                continue
+
+            if exception:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+    async def _poll(self) -> None:
+        try:
+            while self._watched:
+                await asyncio.gather(*[self._refresh(name) for name in list(self._watched)])
+
+                if self._watched:
+                    await asyncio.sleep(self.interval)
+        except Exception as e:  # pylint: disable=broad-except
+            # waiters must not hang if poller is broken
+            for builds in list(self._watched.values()):
+                for futures in list(builds.values()):
+                    self._resolve(futures, exception=e)
+
+    async def _fetch(self, name: str, count: int) -> Optional[List[dict]]:
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+
+        try:
+            # `builds` is limited by 100 newest builds, `allBuilds` isn`t
+            response = await self.jenkins._request(
+                'GET',
+                f'/{folder_name}/job/{job_name}/api/json',
+                params={'tree': f'allBuilds[number,building,result,duration]{{0,{count}}}'},
+            )
+            return (await self.jenkins._read_json(response))['allBuilds']
+        except JenkinsNotFoundError as e:
+            for futures in list(self._watched.get(name, {}).values()):
+                self._resolve(futures, exception=e)
+        except Exception:  # pylint: disable=broad-except
+            # temporary problem (error, timeout, malformed response), try
+            # again on next poll
+            pass
+
+        return None
+
+    async def _refresh(self, name: str) -> None:
+        builds = self._watched.get(name)
+        if not builds:
+            return
+
+        count = self._ranges.get(name, max(builds) - min(builds) + 10)
+
+        found = await self._fetch(name, count)
+        if found is None:
+            return
+
+        numbers = {build['number']: build for build in found}
+
+        if len(found) == count and min(builds) < min(numbers):
+            # oldest watched build is out of requested range, newest number
+            # gives needed range at once, with margin for just started builds
+            count = max(numbers) - min(builds) + 10
+            self._ranges[name] = count
+
+            found = await self._fetch(name, count)
+            if found is None:
+                return
+
+            numbers = {build['number']: build for build in found}
+
+        newest = max(numbers, default=0)
+        oldest = min(numbers, default=0)
+
+        for number, futures in list(builds.items()):
+            build = numbers.get(number)
+
+            if build is not None:
+                if not build['building']:
+                    self._resolve(futures, build)
+            elif number <= newest and (number > oldest or len(found) < count):
+                self._resolve(futures, exception=JenkinsNotFoundError(
+                    f'Build `{name}` #{number} isn`t found'
+                ))
+
+    async def close(self) -> None:
+        """
+        Stop watching, all waiting calls are cancelled.
+
+        Returns:
+            None
+        """
+        if self._task:
+            self._task.cancel()
+
+        for builds in list(self._watched.values()):
+            for futures in list(builds.values()):
+                for future in futures:
+                    future.cancel()
+
+
+class EventFeed:
+    """
+    Polls compact snapshots of jobs, nodes and queue and yields difference
+    between them as events to all subscribers.
+    """
+
+    def __init__(self, jenkins, interval: float = 5.0, builds_count: int = 5) -> None:
+        self.jenkins = jenkins
+        self.interval = interval
+        self.builds_count = builds_count
+
+        self._subscribers: List[Tuple[asyncio.Queue, Set[str]]] = []
+        self._snapshots: Dict[str, dict] = {}
+        self._task: Optional[asyncio.Future] = None
+
+    def subscribe(self,
+                  kinds: Iterable[str] = EVENT_KINDS,
+                  max_events: int = MAX_PENDING_EVENTS) -> AsyncIterator[Any]:
+        """
+        Iterate over events of specified kinds: `jobs` (BuildStarted,
+        BuildFinished), `nodes` (NodeOffline, NodeOnline) and `queue`
+        (QueueItemAdded, QueueItemLeft). Subscriber which has `max_events`
+        not consumed events is finished by JenkinsError.
+        """
+        # arguments are checked before iteration is started
+        subscribed = set(kinds)
+        for kind in subscribed:
+            if kind not in EVENT_KINDS:
+                raise JenkinsError('Unknown kind of events: ' + kind)
+
+        if max_events <= 0:
+            raise JenkinsError('Invalid `max_events` must be > 0')
+
+        return self._iter_events(subscribed, max_events)
+
+    async def _iter_events(self, kinds: Set[str], max_events: int) -> AsyncIterator[Any]:
+        # last place is reserved for end of iteration or error
+        queue: asyncio.Queue = asyncio.Queue(max_events + 1)
+        subscriber = (queue, kinds)
+        self._subscribers.append(subscriber)
+
+        if self._task is None or self._task.done():
+            self._task = spawn(self._poll(), self.jenkins._spawn_hook)
+
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+        finally:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+            if not self._subscribers:
+                await self.close()
+
+    async def _get_jobs(self) -> Dict[str, dict]:
+        fields = f'builds[number,building,result]{{0,{self.builds_count}}}'
+
+        return {
+            name: {b['number']: (b['building'], b['result']) for b in job.get('builds', [])}
+            async for name, job in self.jenkins.jobs.iter_all(tree_depth=2, fields=fields)
+        }
+
+    async def _get_nodes(self) -> Dict[str, tuple]:
+        response = await self.jenkins._request(
+            'GET',
+            '/computer/api/json',
+            params={'tree': 'computer[displayName,offline,offlineCauseReason]'},
+        )
+
+        return {
+            c['displayName']: (c['offline'], c.get('offlineCauseReason'))
+            for c in (await self.jenkins._read_json(response))['computer']
+        }
+
+    async def _get_queue(self) -> Dict[int, str]:
+        response = await self.jenkins._request(
+            'GET',
+            '/queue/api/json',
+            params={'tree': 'items[id,task[name]]'},
+        )
+
+        return {
+            item['id']: item.get('task', {}).get('name')
+            for item in (await self.jenkins._read_json(response))['items']
+        }
+
+    async def _poll_kind(self, kind: str) -> None:
+        getters: Dict[str, Any] = {
+            'jobs': (self._get_jobs, _diff_jobs),
+            'nodes': (self._get_nodes, _diff_nodes),
+            'queue': (self._get_queue, _diff_queue),
+        }
+        get, diff = getters[kind]
+
+        try:
+            snapshot = await get()
+        except Exception:  # pylint: disable=broad-except
+            # temporary problem (error, timeout, malformed response), try
+            # again on next poll
+            return
+
+        # first snapshot is baseline without events
+        if kind in self._snapshots:
+            for event in diff(self._snapshots[kind], snapshot):
+                self._publish(kind, event)
+
+        self._snapshots[kind] = snapshot
+
+    def _publish(self, kind: str, event: Any) -> None:
+        for subscriber in list(self._subscribers):
+            queue, kinds = subscriber
+            if kind not in kinds:
+                continue
+
+            if queue.qsize() < queue.maxsize - 1:
+                queue.put_nowait(event)
+                continue
+
+            # subscriber doesn't keep up with events, it's finished instead
+            # of losing events silently
+            self._subscribers.remove(subscriber)
+            queue.put_nowait(JenkinsError('Queue of events is full, subscriber is too slow'))
+
+    def _finish(self, item: Optional[Exception]) -> None:
+        for queue, _ in self._subscribers:
+            if not queue.full():
+                queue.put_nowait(item)
+
+    async def _poll(self) -> None:
+        try:
+            while self._subscribers:
+                kinds = set().union(*(k for _, k in self._subscribers))
+
+                for kind in set(self._snapshots) - kinds:
+                    del self._snapshots[kind]
+
+                await asyncio.gather(*[self._poll_kind(kind) for kind in sorted(kinds)])
+                await asyncio.sleep(self.interval)
+        except Exception as e:  # pylint: disable=broad-except
+            # subscribers must not hang if poller is broken
+            self._finish(e)
+
+    async def close(self) -> None:
+        """
+        Stop polling, iteration of all subscribers is finished.
+
+        Returns:
+            None
+        """
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+        self._snapshots.clear()
+        self._finish(None)
@@ -0,0 +1,130 @@
+"""
+Compare JSON decoders on large payloads similar to Jenkins responses.
+
+Usage:
+
+    python -m benchmarks.bench_json [--number 20]
+"""
+import argparse
+import asyncio
+import functools
+import importlib
+import json
+import time
+import timeit
+
+from typing import Any, Callable, Dict, List, Tuple
+
+from aiojenkins import Jenkins
+
+
+def make_plugins(count: int = 300) -> dict:
+    # plugins list at depth 2 with dependencies
+    return {'plugins': [{
+        'active': True,
+        'shortName': f'plugin-{i}',
+        'longName': f'Plugin number {i}',
+        'version': f'{i}.{i % 10}.{i % 7}',
+        'url': f'https://plugins.jenkins.io/plugin-{i}',
+        'dependencies': [
+            {'shortName': f'plugin-{j}', 'version': f'{j}.0', 'optional': j % 2 == 0}
+            for j in range(i % 15)
+        ],
+    } for i in range(count)]}
+
+
+def make_builds(count: int = 20000) -> dict:
+    return {'allBuilds': [{
+        'number': i,
+        'url': f'http://localhost:8080/job/project/{i}/',
+        'result': 'SUCCESS' if i % 3 else 'FAILURE',
+        'building': False,
+        'duration': i * 1000,
+        'timestamp': 1600000000000 + i,
+    } for i in range(count)]}
+
+
+def make_computers(count: int = 2000) -> dict:
+    return {'computer': [{
+        'displayName': f'node-{i}',
+        'offline': i % 5 == 0,
+        'offlineCauseReason': 'maintenance' if i % 5 == 0 else '',
+        'numExecutors': 4,
+        'executors': [{'idle': bool(j % 2), 'number': j} for j in range(4)],
+        'monitorData': {'hudson.node_monitors.ArchitectureMonitor': 'Linux (amd64)'},
+    } for i in range(count)]}
+
+
+def get_decoders() -> List[Tuple[str, Callable[[bytes], Any]]]:
+    decoders: List[Tuple[str, Callable[[bytes], Any]]] = [('json', json.loads)]
+
+    for name in ('orjson', 'ujson', 'rapidjson'):
+        try:
+            decoders.append((name, importlib.import_module(name).loads))
+        except ImportError:
+            pass
+
+    return decoders
+
+
+class _Response:
+    # minimal response for `Jenkins._read_json()` without network
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+async def time_client(loads: Callable[[bytes], Any], payload: bytes, number: int) -> float:
+    """
+    Time decoding through client configured with `json_loads`.
+    """
+    async with Jenkins('http://localhost:8080', json_loads=loads) as jenkins:
+        response: Any = _Response(payload)
+
+        started = time.perf_counter()
+        for _ in range(number):
+            await jenkins._read_json(response)
+
+        return (time.perf_counter() - started) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    payloads: Dict[str, bytes] = {
+        'plugins': json.dumps(make_plugins()).encode(),
+        'allBuilds': json.dumps(make_builds()).encode(),
+        'computer': json.dumps(make_computers()).encode(),
+    }
+
+    decoders = get_decoders()
+
+    header = f'{"payload":<20}{"size":>10}' + ''.join(f'{n:>12}' for n, _ in decoders)
+    print(header)
+
+    for payload_name, payload in payloads.items():
+        timings = [
+            timeit.timeit(functools.partial(func, payload), number=args.number) / args.number
+            for _, func in decoders
+        ]
+
+        # the same decoders through client, as they are used by API methods
+        client_timings = [
+            asyncio.run(time_client(func, payload, args.number))
+            for _, func in decoders
+        ]
+
+        for name, row_timings in ((payload_name, timings),
+                                  (payload_name + ' (client)', client_timings)):
+            row = f'{name:<20}{len(payload) // 1024:>8}KB'
+            row += ''.join(f'{t * 1000:>10.2f}ms' for t in row_timings)
+            print(row)
+
+
+if __name__ == '__main__':
+    main()
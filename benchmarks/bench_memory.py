@@ -0,0 +1,102 @@
+"""
+Compare memory retained by results of listing methods as plain dicts and as
+compact typed records (`typed=True`).
+
+Usage:
+
+    python -m benchmarks.bench_memory [--count 20000]
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from typing import Any, Callable, Dict, Tuple
+
+from aiojenkins.records import (
+    BuildRecord,
+    JobRecord,
+    NodeRecord,
+    QueueItemRecord,
+)
+from benchmarks.bench_json import make_builds, make_computers
+
+Converter = Callable[[dict], Any]
+
+
+def make_jobs(count: int) -> dict:
+    return {'jobs': [{
+        '_class': 'hudson.model.FreeStyleProject',
+        'name': f'job-{i}',
+        'url': f'http://localhost:8080/job/job-{i}/',
+        'color': 'blue' if i % 4 else 'red',
+    } for i in range(count)]}
+
+
+def make_queue(count: int) -> dict:
+    return {'items': [{
+        '_class': 'hudson.model.Queue$BuildableItem',
+        'blocked': False,
+        'buildable': True,
+        'id': i,
+        'inQueueSince': 1600000000000 + i,
+        'stuck': False,
+        'task': {
+            '_class': 'hudson.model.FreeStyleProject',
+            'name': f'job-{i}',
+            'url': f'http://localhost:8080/job/job-{i}/',
+            'color': 'blue_anime',
+        },
+        'url': f'queue/item/{i}/',
+        'why': 'Waiting for next available executor',
+    } for i in range(count)]}
+
+
+def measure(payload: bytes, key: str, convert: Converter) -> Tuple[int, int]:
+    """
+    Get bytes retained by list of objects decoded from payload as dicts and
+    as records.
+    """
+    sizes = []
+
+    for typed in (False, True):
+        gc.collect()
+        tracemalloc.start()
+
+        items = json.loads(payload)[key]
+        if typed:
+            items = [convert(item) for item in items]
+
+        gc.collect()
+        sizes.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+
+        del items
+
+    return sizes[0], sizes[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=20000, help='objects in listing')
+    args = parser.parse_args()
+
+    listings: Dict[str, Tuple[dict, str, Converter]] = {
+        'builds': (make_builds(args.count), 'allBuilds', BuildRecord.from_json),
+        'jobs': (make_jobs(args.count), 'jobs', JobRecord.from_json),
+        'queue': (make_queue(args.count), 'items', QueueItemRecord.from_json),
+        'nodes': (make_computers(args.count), 'computer', NodeRecord.from_json),
+    }
+
+    print(f'{"listing":<12}{"dicts":>12}{"records":>12}{"saved":>10}')
+
+    for name, (data, key, convert) in listings.items():
+        dicts, records = measure(json.dumps(data).encode(), key, convert)
+        print(f'{name:<12}'
+              f'{dicts // 1024:>10}KB'
+              f'{records // 1024:>10}KB'
+              f'{(1 - records / dicts) * 100:>9.1f}%')
+
+
+if __name__ == '__main__':
+    main()
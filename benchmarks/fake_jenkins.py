@@ -0,0 +1,179 @@
+"""
+In-process fake Jenkins server for benchmarks, it implements only endpoints
+used by aiojenkins with generated data of configurable size.
+"""
+import asyncio
+import itertools
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from aiohttp import web
+
+FOLDER_CLASS = 'com.cloudbees.hudson.plugins.folder.Folder'
+JOB_CLASS = 'hudson.model.FreeStyleProject'
+
+
+class FakeJenkinsConfig(NamedTuple):
+    folders: int = 10
+    jobs: int = 20
+    builds: int = 50
+    nodes: int = 50
+    queue_items: int = 20
+    output_lines: int = 5000
+    latency: float = 0.0
+
+
+class FakeJenkins:
+    """
+    Fake server with flat folders, each contains `jobs` jobs, plus `jobs`
+    jobs in root. Every request is delayed by `latency` seconds.
+
+    Example:
+
+    .. code-block:: python
+
+        async with FakeJenkins(FakeJenkinsConfig(latency=0.01)) as server:
+            async with Jenkins(server.url) as jenkins:
+                await jenkins.jobs.get_all()
+    """
+
+    def __init__(self, config: FakeJenkinsConfig = FakeJenkinsConfig()) -> None:
+        self.config = config
+        self.requests = 0
+        self.url = ''
+
+        self._queue_ids = itertools.count(1)
+        self._runner: Optional[web.AppRunner] = None
+
+        line = 'Building in workspace /var/lib/jenkins/workspace/project\n'
+        self._output = (line * config.output_lines).encode()
+
+    async def __aenter__(self) -> 'FakeJenkins':
+        app = web.Application()
+        app.router.add_route('*', '/{path:.*}', self._handle)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+
+        port = self._runner.addresses[0][1]
+        self.url = f'http://127.0.0.1:{port}'
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+
+    def _job_url(self, *names: str) -> str:
+        return self.url + ''.join(f'/job/{name}' for name in names) + '/'
+
+    def _list_jobs(self, folder: Optional[str], tree: str = '') -> List[dict]:
+        prefix = (folder,) if folder else ()
+
+        jobs: List[Dict[str, Any]] = [
+            {'_class': JOB_CLASS, 'name': f'job{i}', 'url': self._job_url(*prefix, f'job{i}')}
+            for i in range(self.config.jobs)
+        ]
+
+        if folder is None:
+            jobs += [
+                {'_class': FOLDER_CLASS, 'name': f'folder{i}', 'url': self._job_url(f'folder{i}')}
+                for i in range(self.config.folders)
+            ]
+
+            # jobs of folders are nested if requested by tree query
+            if tree.count('jobs[') > 1:
+                for job in jobs[self.config.jobs:]:
+                    job['jobs'] = self._list_jobs(job['name'])
+
+        return jobs
+
+    def _get_job(self, names: List[str]) -> dict:
+        builds = [
+            {'number': n, 'url': self._job_url(*names) + f'{n}/', 'result': 'SUCCESS',
+             'building': False, 'duration': 1000}
+            for n in range(self.config.builds, 0, -1)
+        ]
+
+        return {
+            '_class': JOB_CLASS,
+            'name': names[-1],
+            'url': self._job_url(*names),
+            'builds': builds,
+            'allBuilds': builds,
+        }
+
+    def _get_nodes(self) -> Dict[str, list]:
+        return {'computer': [
+            {'displayName': f'node{i}', 'offline': False, 'numExecutors': 2,
+             'offlineCauseReason': '', 'temporarilyOffline': False}
+            for i in range(self.config.nodes)
+        ]}
+
+    def _get_queue(self) -> Dict[str, list]:
+        return {'items': [
+            {'id': i, 'task': {'name': f'job{i}'}, 'why': 'Waiting for next available executor'}
+            for i in range(self.config.queue_items)
+        ]}
+
+    def _handle_job(self, request: web.Request, names: List[str], rest: List[str]) -> web.Response:
+        if rest == ['api', 'json']:
+            if names[0].startswith('folder') and len(names) == 1:
+                return web.json_response({'jobs': self._list_jobs(names[0])})
+            return web.json_response(self._get_job(names))
+
+        if rest in (['build'], ['buildWithParameters']) and request.method == 'POST':
+            location = f'{self.url}/queue/item/{next(self._queue_ids)}/'
+            return web.Response(status=201, headers={'Location': location})
+
+        if rest[1:] == ['api', 'json']:
+            return web.json_response({'number': int(rest[0]), 'building': False})
+
+        if rest[1:] == ['consoleText']:
+            return web.Response(body=self._output, content_type='text/plain')
+
+        if rest[1:] == ['logText', 'progressiveText']:
+            start = int(request.query.get('start', 0))
+            # builds are finished, so rest of output is returned at once
+            return web.Response(body=self._output[start:], content_type='text/plain', headers={
+                'X-Text-Size': str(len(self._output)),
+            })
+
+        raise web.HTTPNotFound()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+
+        segments = [s for s in request.path.split('/') if s]
+
+        names = []
+        while segments[:1] == ['job'] and len(segments) > 1:
+            names.append(segments[1])
+            segments = segments[2:]
+
+        if names:
+            return self._handle_job(request, names, segments)
+
+        routes = {
+            'api/json': lambda: {
+                'mode': 'NORMAL',
+                'jobs': self._list_jobs(None, request.query.get('tree', '')),
+            },
+            'crumbIssuer/api/json': lambda: {
+                'crumbRequestField': 'Jenkins-Crumb',
+                'crumb': 'fake',
+            },
+            'computer/api/json': self._get_nodes,
+            'queue/api/json': self._get_queue,
+        }
+
+        route = routes.get('/'.join(segments))
+        if route is None:
+            raise web.HTTPNotFound()
+
+        return web.json_response(route())
@@ -0,0 +1,189 @@
+"""
+Benchmarks of aiojenkins against in-process fake Jenkins server, results are
+saved as JSON and can be compared with results of previous version.
+
+Usage:
+
+    python -m benchmarks.run --latency 0.005 --save results.json
+    python -m benchmarks.run --compare benchmarks/results/0.8.0.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from typing import Any, Awaitable, Callable, Dict, List
+
+import aiohttp
+
+from aiojenkins import Jenkins, __version__
+from benchmarks.fake_jenkins import FakeJenkins, FakeJenkinsConfig
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+Scenario = Callable[[Jenkins, argparse.Namespace], Awaitable[Any]]
+
+
+async def start_burst(jenkins: Jenkins, args: argparse.Namespace) -> None:
+    await asyncio.gather(*[jenkins.builds.start('job0') for _ in range(args.burst)])
+
+
+async def iter_output(jenkins: Jenkins, _: argparse.Namespace) -> None:
+    async for _line in jenkins.builds.iter_output('job0', 1):
+        pass
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    'get_status': lambda jenkins, _: jenkins.get_status(),
+    'jobs.get_all': lambda jenkins, _: jenkins.jobs.get_all(),
+    'jobs.get_all(tree_depth=1)': lambda jenkins, _: jenkins.jobs.get_all(tree_depth=1),
+    'builds.get_all': lambda jenkins, _: jenkins.builds.get_all('folder0/job0'),
+    'builds.get_output': lambda jenkins, _: jenkins.builds.get_output('job0', 1),
+    'builds.iter_output': iter_output,
+    'builds.start(burst)': start_burst,
+    'nodes.get_all': lambda jenkins, _: jenkins.nodes.get_all(),
+    'queue.get_all': lambda jenkins, _: jenkins.queue.get_all(),
+}
+
+
+def summarize(durations: List[float], requests: int) -> Dict[str, float]:
+    durations = sorted(durations)
+
+    return {
+        'mean': statistics.mean(durations),
+        'median': statistics.median(durations),
+        'p95': durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+        'min': durations[0],
+        'ops_per_sec': len(durations) / sum(durations),
+        'requests': requests / len(durations),
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    config = FakeJenkinsConfig(
+        folders=args.folders,
+        jobs=args.jobs,
+        builds=args.builds,
+        nodes=args.nodes,
+        queue_items=args.queue_items,
+        output_lines=args.output_lines,
+        latency=args.latency,
+    )
+
+    results: Dict[str, Any] = {}
+
+    async with FakeJenkins(config) as server:
+        async with Jenkins(server.url, prefetch_crumb=True) as jenkins:
+            for name, scenario in SCENARIOS.items():
+                if args.only and name not in args.only:
+                    continue
+
+                # warm up connections before measurement
+                await scenario(jenkins, args)
+
+                requests = server.requests
+                durations = []
+
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    await scenario(jenkins, args)
+                    durations.append(time.perf_counter() - started)
+
+                results[name] = summarize(durations, server.requests - requests)
+
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'aiohttp': aiohttp.__version__,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {**config._asdict(), 'repeat': args.repeat, 'burst': args.burst},
+        'results': results,
+    }
+
+
+def print_results(report: Dict[str, Any]) -> None:
+    print(f'aiojenkins {report["version"]}, python {report["python"]}, '
+          f'aiohttp {report["aiohttp"]}')
+    print(f'{"scenario":<30}{"mean":>10}{"p95":>10}{"ops/s":>10}{"requests":>10}')
+
+    for name, result in report['results'].items():
+        print(f'{name:<30}'
+              f'{result["mean"] * 1000:>8.2f}ms'
+              f'{result["p95"] * 1000:>8.2f}ms'
+              f'{result["ops_per_sec"]:>10.1f}'
+              f'{result["requests"]:>10.1f}')
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> bool:
+    """
+    Print change of median time against baseline, returns false if some
+    scenario is slower more than threshold (in percents).
+    """
+    print(f'\ncompared with {baseline["version"]} ({baseline["date"]})')
+    print(f'{"scenario":<30}{"before":>10}{"after":>10}{"change":>10}')
+
+    ok = True
+    for name, result in report['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+
+        change = (result['median'] / before['median'] - 1) * 100
+        regression = change > threshold
+        ok = ok and not regression
+
+        print(f'{name:<30}'
+              f'{before["median"] * 1000:>8.2f}ms'
+              f'{result["median"] * 1000:>8.2f}ms'
+              f'{change:>+9.1f}%'
+              f'{"  REGRESSION" if regression else ""}')
+
+    return ok
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmarks of aiojenkins')
+    parser.add_argument('--folders', type=int, default=10)
+    parser.add_argument('--jobs', type=int, default=20, help='jobs in root and each folder')
+    parser.add_argument('--builds', type=int, default=50)
+    parser.add_argument('--nodes', type=int, default=50)
+    parser.add_argument('--queue-items', type=int, default=20)
+    parser.add_argument('--output-lines', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.0, help='server latency, seconds')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--burst', type=int, default=50, help='builds started at once')
+    parser.add_argument('--only', nargs='*', help='names of scenarios to run')
+    parser.add_argument('--save', help='path of results file, default is results/VERSION.json')
+    parser.add_argument('--compare', help='path of baseline results file')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='allowed slowdown against baseline, percents')
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(run(args))
+
+    print_results(report)
+
+    path = args.save or os.path.join(RESULTS_DIR, f'{__version__}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        if not compare(report, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -47,7 +47,12 @@ install_requires = [
     'aiohttp<4.0'
 ]
 
+extras_require = {
+    'zstd': ['zstandard'],
+}
+
 if __name__ == '__main__':
     setup(install_requires=install_requires,
+          extras_require=extras_require,
           python_requires='>=3.8',
           **setup_args)
@@ -0,0 +1,31 @@
+import json
+
+from benchmarks.bench_json import time_client
+from benchmarks.run import SCENARIOS, compare, parse_args, run
+
+
+async def test_benchmarks():
+    args = parse_args([
+        '--folders', '2',
+        '--jobs', '2',
+        '--builds', '2',
+        '--nodes', '2',
+        '--queue-items', '2',
+        '--output-lines', '10',
+        '--repeat', '2',
+        '--burst', '2',
+    ])
+
+    report = await run(args)
+    assert set(report['results']) == set(SCENARIOS)
+
+    results = report['results']
+    assert results['jobs.get_all']['requests'] == 3
+    assert results['jobs.get_all(tree_depth=1)']['requests'] == 1
+    assert results['builds.start(burst)']['requests'] == 2
+
+    assert compare(report, report, threshold=0)
+
+
+async def test_bench_json_client():
+    assert await time_client(json.loads, b'{"jobs": []}', 2) > 0
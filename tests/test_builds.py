@@ -1,8 +1,17 @@
 import asyncio
+import gzip
+import os
+import re
+import sys
 
 import pytest
 
-from aiojenkins.exceptions import JenkinsError
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aiojenkins.exceptions import JenkinsError, JenkinsNotFoundError
+from aiojenkins.jenkins import Jenkins
+from aiojenkins.transfer import iter_lines_blocks
 from tests import CreateJob
 
 
@@ -120,3 +129,477 @@ async def test_build_delay(jenkins):
         info = await jenkins.jobs.get_info(job_name)
         builds = await jenkins.builds.get_all(job_name)
         assert (info['inQueue'] is True and len(builds) == 0)
+
+
+async def test_build_iter_output(jenkins, aiohttp_mock):
+    url = re.compile(r'.+/job/job/1/logText/progressiveText\?start=\d+')
+    text = 'привет\n'.encode()
+
+    aiohttp_mock.get(
+        url,
+        body=text[:3],
+        headers={'X-Text-Size': '3', 'X-More-Data': 'true'},
+    )
+    aiohttp_mock.get(
+        url,
+        body=text[3:],
+        headers={'X-Text-Size': str(len(text))},
+    )
+
+    jenkins.crumb = False
+    chunks = [c async for c in jenkins.builds.iter_output('job', 1, follow=True, interval=0)]
+    assert ''.join(chunks) == text.decode()
+
+    requests = [str(url) for _, url in aiohttp_mock.requests]
+    assert requests[1].endswith('progressiveText?start=3')
+
+
+async def test_build_iter_all(jenkins, aiohttp_mock):
+    def builds(*numbers):
+        return {'allBuilds': [{'number': n, 'result': 'SUCCESS'} for n in numbers]}
+
+    url = re.compile(r'.+/job/job/api/json\?tree=.+')
+    aiohttp_mock.get(url, payload=builds(10, 9))
+    aiohttp_mock.get(url, payload=builds(8, 7))
+    aiohttp_mock.get(url, payload=builds(6))
+
+    jenkins.crumb = False
+    numbers = [
+        b['number'] async for b in jenkins.builds.iter_all('job', page_size=2, fields='result')
+    ]
+    assert numbers == [10, 9, 8, 7, 6]
+
+    requests = [url.query['tree'] for _, url in aiohttp_mock.requests]
+    assert requests == [
+        'allBuilds[number,result]{0,2}',
+        'allBuilds[number,result]{2,4}',
+        'allBuilds[number,result]{4,6}',
+    ]
+
+    aiohttp_mock.get(url, payload=builds(12, 11))
+    aiohttp_mock.get(url, payload=builds(10, 9))
+
+    numbers = [
+        b['number'] async for b in jenkins.builds.iter_all('job', page_size=2, newer_than=9)
+    ]
+    assert numbers == [12, 11, 10]
+
+    assert jenkins.builds._construct_builds_tree(None) == 'number,url'
+    assert jenkins.builds._construct_builds_tree(
+        ['url', {'changeSet': ['number']}]
+    ) == 'number,url,changeSet[number]'
+    assert jenkins.builds._construct_builds_tree('url,number') == 'url,number'
+
+
+async def test_build_start_many(jenkins, aiohttp_mock):
+    aiohttp_mock.post(
+        re.compile(r'.+/job/a/build\?delay=0sec'),
+        headers={'location': 'http://localhost:8080/queue/item/1/'},
+    )
+    aiohttp_mock.post(
+        re.compile(r'.+/job/b/buildWithParameters\?delay=5sec'),
+        headers={'location': 'http://localhost:8080/queue/item/2/'},
+    )
+    aiohttp_mock.post(
+        re.compile(r'.+/job/c/build\?delay=0sec'),
+        status=500,
+    )
+    aiohttp_mock.post(
+        re.compile(r'.+/job/d/buildWithParameters\?delay=0sec'),
+        headers={'location': 'http://localhost:8080/queue/item/4/'},
+    )
+
+    jenkins.crumb = False
+    items = ['a', ('b', {'arg': 1}, 5), ('c',), ('d', {'arg': 1})]
+
+    results = [r async for r in jenkins.builds.start_many(items, concurrency=2)]
+    results.sort(key=lambda r: r.position)
+
+    assert [(r.name, r.queue_id) for r in results] == [
+        ('a', 1), ('b', 2), ('c', None), ('d', 4),
+    ]
+    assert isinstance(results[2].error, JenkinsError)
+
+
+class ArtifactServer(TestServer):
+    """
+    Serves artifacts of build `project` #1 with support of range requests,
+    first responses can be interrupted in the middle of body.
+    """
+
+    def __init__(self, artifacts, interrupts=0, accept_ranges=True, short=0):
+        self.artifacts = artifacts
+        self.interrupts = interrupts
+        self.accept_ranges = accept_ranges
+        self.short = short
+        self.ranges = []
+
+        app = web.Application()
+        # path of job without folder starts with double slash
+        app.router.add_get('//job/project/1/api/json', self.list_artifacts)
+        app.router.add_get('//job/project/1/artifact/{path:.+}', self.get_artifact)
+        super().__init__(app)
+
+    async def list_artifacts(self, _):
+        return web.json_response({'artifacts': [
+            {'fileName': path.rsplit('/')[-1], 'relativePath': path, 'displayPath': path}
+            for path in self.artifacts
+        ]})
+
+    async def get_artifact(self, request):
+        data = self.artifacts[request.match_info['path']]
+        headers = {'Accept-Ranges': 'bytes'} if self.accept_ranges else {}
+
+        start, end, status = 0, len(data) - 1, 200
+
+        if 'Range' in request.headers and request.method == 'GET' and self.accept_ranges:
+            self.ranges.append(request.headers['Range'])
+
+            first, last = request.headers['Range'][len('bytes='):].split('-')
+            start, end, status = int(first), int(last or end), 206
+            headers['Content-Range'] = f'bytes {start}-{end}/{len(data)}'
+
+        body = data[start:end + 1]
+
+        # range is completed without error, but body is shorter
+        if self.short and status == 206:
+            self.short -= 1
+            body = body[:len(body) // 2]
+            headers['Content-Range'] = f'bytes {start}-{start + len(body) - 1}/{len(data)}'
+
+        if self.interrupts and request.method == 'GET':
+            self.interrupts -= 1
+
+            response = web.StreamResponse(status=status, headers=headers)
+            response.content_length = len(body)
+            await response.prepare(request)
+            await response.write(body[:len(body) // 3])
+            request.transport.close()
+            return response
+
+        return web.Response(status=status, body=body, headers=headers)
+
+
+async def test_build_download_artifact(tmp_path):
+    data = os.urandom(300000)
+
+    async with ArtifactServer({'dist/app.bin': data}, interrupts=1) as server:
+        async with Jenkins(str(server.make_url(''))) as jenkins:
+            jenkins.crumb = False
+
+            dest = tmp_path / 'app.bin'
+            size = await jenkins.builds.download_artifact(
+                'project', 1, 'dist/app.bin', str(dest))
+
+            assert size == len(data)
+            assert dest.read_bytes() == data
+            assert not os.path.exists(str(dest) + '.part')
+
+            # transfer is continued after interruption
+            assert server.ranges == [f'bytes={len(data) // 3}-']
+
+            # previous partial download is resumed
+            server.ranges.clear()
+            (tmp_path / 'resumed.bin.part').write_bytes(data[:1000])
+
+            dest = tmp_path / 'resumed.bin'
+            await jenkins.builds.download_artifact('project', 1, 'dist/app.bin', str(dest))
+
+            assert dest.read_bytes() == data
+            assert server.ranges == ['bytes=1000-']
+
+
+async def test_build_download_artifact_parts(tmp_path):
+    data = os.urandom(300000)
+
+    async with ArtifactServer({'app.bin': data}) as server:
+        async with Jenkins(str(server.make_url(''))) as jenkins:
+            jenkins.crumb = False
+
+            dest = tmp_path / 'app.bin'
+            await jenkins.builds.download_artifact(
+                'project', 1, 'app.bin', str(dest), parts=3, chunk_size=1024)
+
+            assert dest.read_bytes() == data
+            assert sorted(server.ranges) == [
+                'bytes=0-99999',
+                'bytes=100000-199999',
+                'bytes=200000-299999',
+            ]
+
+            with pytest.raises(JenkinsError):
+                await jenkins.builds.download_artifact(
+                    'project', 1, 'app.bin', str(dest), parts=0)
+
+
+async def test_build_download_artifact_parts_short(tmp_path):
+    data = os.urandom(300000)
+
+    async with ArtifactServer({'app.bin': data}, short=1) as server:
+        async with Jenkins(str(server.make_url(''))) as jenkins:
+            jenkins.crumb = False
+
+            # TC: rest of short range is requested again
+            dest = tmp_path / 'app.bin'
+            await jenkins.builds.download_artifact(
+                'project', 1, 'app.bin', str(dest), parts=3, chunk_size=1024)
+
+            assert dest.read_bytes() == data
+            assert len(server.ranges) == 4
+
+            # TC: short range isn't reported as success
+            server.short = 1
+            dest = tmp_path / 'short.bin'
+            with pytest.raises(JenkinsError):
+                await jenkins.builds.download_artifact(
+                    'project', 1, 'app.bin', str(dest), parts=3, chunk_size=1024, retries=0)
+
+            assert not dest.exists()
+
+
+async def test_build_download_artifact_parts_failed(tmp_path):
+    data = os.urandom(300000)
+
+    async with ArtifactServer({'app.bin': data}, interrupts=1) as server:
+        async with Jenkins(str(server.make_url(''))) as jenkins:
+            jenkins.crumb = False
+
+            dest = tmp_path / 'app.bin'
+            with pytest.raises(JenkinsError):
+                await jenkins.builds.download_artifact(
+                    'project', 1, 'app.bin', str(dest), parts=3, chunk_size=1024, retries=0)
+
+            # TC: file with holes isn't left to be resumed
+            assert os.listdir(tmp_path) == []
+
+            await jenkins.builds.download_artifact('project', 1, 'app.bin', str(dest))
+            assert dest.read_bytes() == data
+
+
+async def test_build_download_artifact_ranges_ignored(tmp_path):
+    data = os.urandom(300000)
+
+    async with ArtifactServer({'app.bin': data}, accept_ranges=False) as server:
+        async with Jenkins(str(server.make_url(''))) as jenkins:
+            jenkins.crumb = False
+
+            # TC: partial file is downloaded again if server ignores range
+            dest = tmp_path / 'app.bin'
+            (tmp_path / 'app.bin.part').write_bytes(b'x' * 1000)
+
+            await jenkins.builds.download_artifact('project', 1, 'app.bin', str(dest))
+            assert dest.read_bytes() == data
+            assert os.listdir(tmp_path) == ['app.bin']
+
+
+async def test_build_download_artifacts(tmp_path):
+    artifacts = {'a.txt': b'a' * 100, 'logs/b.txt': b'b' * 200}
+
+    async with ArtifactServer(artifacts) as server:
+        async with Jenkins(str(server.make_url(''))) as jenkins:
+            jenkins.crumb = False
+
+            assert [a['relativePath'] for a in
+                    await jenkins.builds.list_artifacts('project', 1)] == list(artifacts)
+
+            results = {
+                r.path: r async for r in
+                jenkins.builds.download_artifacts('project', 1, str(tmp_path))
+            }
+
+    for path, data in artifacts.items():
+        assert results[path].error is None
+        assert results[path].size == len(data)
+        assert (tmp_path / path).read_bytes() == data
+
+
+async def test_build_download_artifacts_outside(tmp_path):
+    artifacts = {'../evil.txt': b'evil', '/tmp/abs.txt': b'abs', 'ok.txt': b'ok'}
+    dest = tmp_path / 'dest'
+
+    async with ArtifactServer(artifacts) as server:
+        async with Jenkins(str(server.make_url(''))) as jenkins:
+            jenkins.crumb = False
+
+            results = {
+                r.path: r async for r in
+                jenkins.builds.download_artifacts('project', 1, str(dest))
+            }
+
+    # TC: paths from server can't point outside of destination
+    assert isinstance(results['../evil.txt'].error, JenkinsError)
+    assert isinstance(results['/tmp/abs.txt'].error, JenkinsError)
+    assert results['ok.txt'].error is None
+    assert sorted(os.listdir(tmp_path)) == ['dest']
+    assert os.listdir(dest) == ['ok.txt']
+
+
+async def test_build_start_file_parameters(tmp_path):
+    received = {}
+
+    async def build_with_parameters(request):
+        reader = await request.multipart()
+        async for part in reader:
+            received[part.name] = (part.filename, await part.read())
+
+        return web.Response(status=201, headers={'Location': '/queue/item/7/'})
+
+    app = web.Application()
+    app.router.add_post('//job/project/buildWithParameters', build_with_parameters)
+
+    bundle = tmp_path / 'bundle.tar.gz'
+    bundle.write_bytes(b'bundle' * 10000)
+
+    async def stream():
+        for _ in range(3):
+            yield b'chunk'
+
+    async with TestServer(app) as server:
+        async with Jenkins(str(server.make_url(''))) as jenkins:
+            jenkins.crumb = False
+
+            queue_id = await jenkins.builds.start(
+                'project',
+                {'bundle': bundle, 'notes': stream()},
+                version=2,
+            )
+
+    assert queue_id == 7
+    assert received['bundle'] == ('bundle.tar.gz', b'bundle' * 10000)
+    assert received['notes'] == ('notes', b'chunk' * 3)
+    assert received['version'] == (None, b'2')
+    assert b'"file": "bundle"' in received['json'][1]
+
+
+async def test_build_start_file_parameters_retry(tmp_path):
+    requests = []
+
+    async def build_with_parameters(request):
+        requests.append(await request.read())
+        return web.Response(status=503)
+
+    app = web.Application()
+    app.router.add_post('//job/project/buildWithParameters', build_with_parameters)
+
+    bundle = tmp_path / 'bundle.tar.gz'
+    bundle.write_bytes(b'bundle')
+
+    retry = {'total': 3, 'factor': 0, 'statuses': [503], 'methods': ['post']}
+
+    # TC: form with files can't be sent twice, so it isn't retried
+    async with TestServer(app) as server:
+        url = str(server.make_url(''))
+
+        async with Jenkins(url, retry=retry) as jenkins:
+            jenkins.crumb = False
+
+            with pytest.raises(JenkinsError):
+                await jenkins.builds.start('project', {'bundle': bundle})
+
+    assert len(requests) == 1
+
+    # TC: server is down, request isn't sent
+    async with Jenkins(url, retry=retry) as jenkins:
+        jenkins.crumb = False
+
+        with pytest.raises(JenkinsError):
+            await jenkins.builds.start('project', {'bundle': bundle})
+
+
+async def test_build_save_output(tmp_path, monkeypatch, aiohttp_mock):
+    output = b'Started by user admin\n' * 10000
+    url = re.compile(r'.+/job/project/1/consoleText')
+
+    async with Jenkins('http://localhost:8080') as jenkins:
+        jenkins.crumb = False
+
+        aiohttp_mock.get(url, body=output)
+        dest = str(tmp_path / 'output.txt')
+        assert await jenkins.builds.save_output('project', 1, dest) == len(output)
+        assert (tmp_path / 'output.txt').read_bytes() == output
+
+        aiohttp_mock.get(url, body=output)
+        dest = str(tmp_path / 'output.txt.gz')
+        size = await jenkins.builds.save_output('project', 1, dest, compression='gzip')
+        assert size == os.path.getsize(dest) < len(output)
+        assert gzip.decompress((tmp_path / 'output.txt.gz').read_bytes()) == output
+
+        with pytest.raises(JenkinsError):
+            await jenkins.builds.save_output('project', 1, dest, compression='bz2')
+
+        monkeypatch.setitem(sys.modules, 'zstandard', None)
+        with pytest.raises(JenkinsError):
+            await jenkins.builds.save_output('project', 1, dest, compression='zstd')
+
+        # existing file is kept and partially written file is removed
+        aiohttp_mock.get(url, status=404)
+        dest = str(tmp_path / 'output.txt')
+        with pytest.raises(JenkinsError):
+            await jenkins.builds.save_output('project', 1, dest)
+
+        assert (tmp_path / 'output.txt').read_bytes() == output
+        assert sorted(os.listdir(tmp_path)) == ['output.txt', 'output.txt.gz']
+
+
+async def test_build_search_output(aiohttp_mock):
+    outputs = {
+        1: b'Started\nBUILD SUCCESS\n',
+        2: b'Started\n' * 5000 + b'java.lang.OutOfMemoryError: heap\nretry\nOutOfMemoryError\n',
+        3: 'Started\nошибка OutOfMemoryError'.encode(),
+    }
+
+    for build_id, output in outputs.items():
+        aiohttp_mock.get(
+            re.compile(rf'.+/job/project/{build_id}/consoleText'),
+            body=output,
+            repeat=True,
+        )
+
+    jenkins = Jenkins('http://localhost:8080')
+    jenkins.crumb = False
+
+    builds = [('project', build_id) for build_id in outputs]
+
+    matches = [m async for m in jenkins.builds.search_output(
+        'OutOfMemoryError', builds, chunk_size=7)]
+    assert sorted(matches) == [
+        ('project', 2, 5001, 'java.lang.OutOfMemoryError: heap', None),
+        ('project', 2, 5003, 'OutOfMemoryError', None),
+        ('project', 3, 2, 'ошибка OutOfMemoryError', None),
+    ]
+
+    matches = [m async for m in jenkins.builds.search_output(
+        re.compile(rb'^OutOfMemory'), builds, first_only=True)]
+    assert matches == [('project', 2, 5003, b'OutOfMemoryError', None)]
+
+    # TC: anchors of whole string match each line
+    matches = [m async for m in jenkins.builds.search_output(
+        r'\AOutOfMemoryError\Z', builds, chunk_size=7)]
+    assert matches == [('project', 2, 5003, 'OutOfMemoryError', None)]
+
+    await jenkins.close()
+
+
+async def test_iter_lines_blocks():
+    async def chunks():
+        for chunk in (b'a', b'b' * 10, b'c\nd', b'e\nf\n', b'g'):
+            yield chunk
+
+    blocks = [b async for b in iter_lines_blocks(chunks(), max_line=4)]
+    assert blocks == [b'abbb\n', b'de\nf\n', b'g']
+
+
+async def test_build_search_output_errors(aiohttp_mock):
+    aiohttp_mock.get(re.compile(r'.+/job/project/1/consoleText'), body=b'failed\n')
+    aiohttp_mock.get(re.compile(r'.+/job/project/2/consoleText'), status=404)
+
+    async with Jenkins('http://localhost:8080') as jenkins:
+        jenkins.crumb = False
+
+        builds = [('project', 1), ('project', 2)]
+        matches = [m async for m in jenkins.builds.search_output('failed', builds)]
+
+    matches.sort(key=lambda m: m.build_id)
+    assert matches[0] == ('project', 1, 1, 'failed', None)
+    assert matches[1][:4] == ('project', 2, 0, '')
+    assert isinstance(matches[1].error, JenkinsNotFoundError)
@@ -0,0 +1,98 @@
+import asyncio
+import re
+
+import pytest
+
+from aiojenkins.cache import ResponseCache
+from aiojenkins.exceptions import JenkinsError
+from aiojenkins.jenkins import Jenkins
+from tests import get_host
+
+COMPUTER_URL = re.compile(r'.+/computer/api/json')
+
+
+async def test_nodes_cache(aiohttp_mock):
+    cache = {'ttl': {'nodes': 60}}
+
+    async with Jenkins(get_host(), cache=cache) as jenkins:
+        jenkins.crumb = False
+
+        aiohttp_mock.get(COMPUTER_URL, payload={'computer': [{'displayName': 'a'}]})
+        aiohttp_mock.get(COMPUTER_URL, payload={'computer': [{'displayName': 'b'}]})
+        aiohttp_mock.post(re.compile(r'.+/computer/a/doDelete'))
+
+        assert list(await jenkins.nodes.get_all()) == ['a']
+        assert list(await jenkins.nodes.get_all()) == ['a']
+        assert jenkins.get_cache_stats() == (1, 1, 1)
+
+        # TC: mutation must invalidate endpoint
+        await jenkins.nodes.delete('a')
+        assert list(await jenkins.nodes.get_all()) == ['b']
+        assert jenkins.get_cache_stats() == (1, 2, 1)
+
+
+async def test_cache_disabled_endpoint(aiohttp_mock):
+    async with Jenkins(get_host(), cache={'ttl': {'views': 60}}) as jenkins:
+        jenkins.crumb = False
+
+        aiohttp_mock.get(COMPUTER_URL, payload={'computer': []}, repeat=True)
+
+        await jenkins.nodes.get_all()
+        await jenkins.nodes.get_all()
+        assert jenkins.get_cache_stats() == (0, 0, 0)
+
+
+async def test_cache_ttl_and_eviction():
+    cache = ResponseCache({'maxsize': 2, 'ttl': {'nodes': 0.05, 'plugins': 60}})
+
+    cache.set('plugins', 1, 'one', 0)
+    cache.set('plugins', 2, 'two', 0)
+    assert cache.get('plugins', 1) == (True, 'one')
+
+    # TC: least recently used must be evicted
+    cache.set('plugins', 3, 'three', 0)
+    assert cache.get('plugins', 2) == (False, None)
+    assert cache.get('plugins', 1) == (True, 'one')
+
+    # TC: expired value
+    cache.set('nodes', None, 'nodes', 0)
+    await asyncio.sleep(0.1)
+    assert cache.get('nodes', None) == (False, None)
+
+    # TC: value requested before invalidation must not be stored
+    generation = cache.generation('plugins')
+    cache.invalidate('plugins')
+    cache.set('plugins', 1, 'stale', generation)
+    assert cache.get('plugins', 1) == (False, None)
+
+
+def test_cache_validation():
+    with pytest.raises(JenkinsError):
+        Jenkins(get_host(), cache={'size': 1})
+
+    with pytest.raises(JenkinsError):
+        Jenkins(get_host(), cache={'maxsize': 0})
+
+    with pytest.raises(JenkinsError):
+        Jenkins(get_host(), cache={'ttl': {'jobs': 1}})
+
+    with pytest.raises(JenkinsError):
+        Jenkins(get_host(), cache={'configs': -1})
+
+
+async def test_config_cache(aiohttp_mock):
+    config_url = re.compile(r'.+/job/job/config.xml')
+    config = '<project/>'
+
+    async with Jenkins(get_host(), cache={'configs': 10}) as jenkins:
+        jenkins.crumb = False
+
+        aiohttp_mock.get(config_url, body=config, headers={'ETag': '"1"'})
+        aiohttp_mock.get(config_url, status=304)
+
+        assert await jenkins.jobs.get_config('job') == config
+        assert await jenkins.jobs.get_config('job') == config
+        assert jenkins.get_config_cache_stats() == (1, 1, 1, len(config))
+
+        request = list(aiohttp_mock.requests.values())[0][1]
+        assert request.kwargs['headers']['If-None-Match'] == '"1"'
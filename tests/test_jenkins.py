@@ -1,4 +1,7 @@
 import asyncio
+import json
+import re
+import ssl
 import time
 
 from collections import namedtuple
@@ -106,6 +109,8 @@ async def test_retry_client(monkeypatch):
 
         response.text = text
         response.json = text
+        response.headers = {}
+        response.release = lambda: None
 
         return response
 
@@ -183,3 +188,115 @@ async def test_make_jenkins_version(jenkins, aiohttp_mock):
     )
     version = await jenkins.get_version()
     assert version == JenkinsVersion(major=2, minor=346, patch=1, build=4)
+
+
+async def test_connector_options(aiohttp_mock):
+    connector = {
+        'limit': 50,
+        'limit_per_host': 20,
+        'keepalive_timeout': 60,
+        'ttl_dns_cache': 300,
+        'ssl_context': ssl.create_default_context(),
+    }
+
+    async with Jenkins(get_host(), connector=connector) as jenkins:
+        assert jenkins.get_connection_pool_stats() == (0, 0, 0, 0)
+
+        jenkins.crumb = False
+        aiohttp_mock.get(
+            re.compile(r'.+/api/json'),
+            payload={'mode': 'NORMAL'},
+        )
+        await jenkins.get_status()
+
+        stats = jenkins.get_connection_pool_stats()
+        assert stats.limit == 50
+        assert stats.limit_per_host == 20
+
+    with pytest.raises(JenkinsError):
+        Jenkins(get_host(), connector={'limits': 50})
+
+    with pytest.raises(JenkinsError):
+        Jenkins(get_host(), connector={'ssl_context': True})
+
+
+async def test_crumb_single_flight(aiohttp_mock):
+    aiohttp_mock.get(
+        re.compile(r'.+/crumbIssuer/api/json'),
+        payload={'crumbRequestField': 'Jenkins-Crumb', 'crumb': '1'},
+    )
+    aiohttp_mock.get(
+        re.compile(r'.+:8080/api/json'),
+        payload={'mode': 'NORMAL'},
+        repeat=True,
+    )
+
+    async with Jenkins(get_host(), prefetch_crumb=True) as jenkins:
+        assert jenkins.crumb == {'Jenkins-Crumb': '1'}
+        assert jenkins.crumb_refreshes == 1
+
+    async with Jenkins(get_host()) as jenkins:
+        aiohttp_mock.get(
+            re.compile(r'.+/crumbIssuer/api/json'),
+            payload={'crumbRequestField': 'Jenkins-Crumb', 'crumb': '2'},
+        )
+
+        await asyncio.gather(*[jenkins.get_status() for _ in range(10)])
+        assert jenkins.crumb == {'Jenkins-Crumb': '2'}
+        assert jenkins.crumb_refreshes == 1
+
+
+async def test_crumb_refresh_on_forbidden(aiohttp_mock):
+    crumb_url = re.compile(r'.+/crumbIssuer/api/json')
+    status_url = re.compile(r'.+:8080/api/json')
+
+    aiohttp_mock.get(crumb_url, payload={'crumbRequestField': 'Jenkins-Crumb', 'crumb': '1'})
+    aiohttp_mock.get(crumb_url, payload={'crumbRequestField': 'Jenkins-Crumb', 'crumb': '2'})
+    aiohttp_mock.get(status_url, payload={})
+    aiohttp_mock.get(status_url, status=HTTPStatus.FORBIDDEN)
+    aiohttp_mock.get(status_url, payload={})
+
+    async with Jenkins(get_host()) as jenkins:
+        await jenkins.get_status()
+        await jenkins.get_status()
+
+        assert jenkins.crumb == {'Jenkins-Crumb': '2'}
+        assert jenkins.crumb_refreshes == 2
+
+
+async def test_coalesce_requests(aiohttp_mock):
+    status_url = re.compile(r'.+:8080/api/json')
+    aiohttp_mock.get(status_url, payload={'mode': 'NORMAL'})
+
+    async with Jenkins(get_host(), coalesce=True) as jenkins:
+        jenkins.crumb = False
+
+        statuses = await asyncio.gather(*[jenkins.get_status() for _ in range(10)])
+        assert statuses == [{'mode': 'NORMAL'}] * 10
+        assert jenkins.coalesced_requests == 9
+        assert sum(len(calls) for calls in aiohttp_mock.requests.values()) == 1
+
+        # finished request isn`t shared anymore
+        aiohttp_mock.get(status_url, payload={'mode': 'EXCLUSIVE'})
+        assert await jenkins.get_status() == {'mode': 'EXCLUSIVE'}
+
+
+async def test_json_hooks(aiohttp_mock):
+    calls = []
+
+    def loads(data):
+        calls.append('loads')
+        return json.loads(data)
+
+    def dumps(obj):
+        calls.append('dumps')
+        return json.dumps(obj).encode()
+
+    aiohttp_mock.get(re.compile(r'.+:8080/api/json'), payload={'mode': 'NORMAL'})
+
+    async with Jenkins(get_host(), json_loads=loads, json_dumps=dumps) as jenkins:
+        jenkins.crumb = False
+
+        assert await jenkins.get_status() == {'mode': 'NORMAL'}
+        assert jenkins._dump_json({'a': 1}) == '{"a": 1}'
+        assert calls == ['loads', 'dumps']
@@ -1,9 +1,10 @@
 import contextlib
+import re
 import time
 
 import pytest
 
-from aiojenkins.exceptions import JenkinsNotFoundError
+from aiojenkins.exceptions import JenkinsError, JenkinsNotFoundError
 from aiojenkins.utils import construct_job_config
 from tests import CreateJob
 
@@ -167,3 +168,71 @@ async def test_folder(jenkins):
     finally:
         with contextlib.suppress(JenkinsNotFoundError):
             await jenkins.jobs.delete(FOLDER_NAME)
+
+
+async def test_get_all_concurrently(jenkins, aiohttp_mock):
+    folder_class = 'com.cloudbees.hudson.plugins.folder.Folder'
+    job_class = 'hudson.model.FreeStyleProject'
+
+    aiohttp_mock.get(
+        re.compile(r'.+:8080/api/json'),
+        payload={'jobs': [
+            {'_class': job_class, 'name': 'job', 'url': 'http://localhost:8080/job/job/'},
+            {'_class': folder_class, 'name': 'f1', 'url': 'http://localhost:8080/job/f1/'},
+            {'_class': folder_class, 'name': 'f2', 'url': 'http://localhost:8080/job/f2/'},
+        ]},
+    )
+    aiohttp_mock.get(
+        re.compile(r'.+/job/f1//api/json'),
+        payload={'jobs': [
+            {'_class': job_class, 'name': 'a', 'url': 'http://localhost:8080/job/f1/job/a/'},
+        ]},
+    )
+    aiohttp_mock.get(
+        re.compile(r'.+/job/f2//api/json'),
+        payload={'jobs': []},
+    )
+
+    jenkins.crumb = False
+    jobs = await jenkins.jobs.get_all(concurrency=2)
+    assert sorted(jobs) == ['f1', 'f1/a', 'f2', 'job']
+
+    with pytest.raises(JenkinsError):
+        await jenkins.jobs.get_all(concurrency=0)
+
+
+async def test_get_all_tree(jenkins, aiohttp_mock):
+    folder_class = 'com.cloudbees.hudson.plugins.folder.Folder'
+    job_class = 'hudson.model.FreeStyleProject'
+
+    aiohttp_mock.get(
+        re.compile(r'.+:8080/api/json\?tree=.+'),
+        payload={'jobs': [
+            {'_class': job_class, 'name': 'job', 'url': '', 'color': 'blue'},
+            {'_class': folder_class, 'name': 'f1', 'url': '', 'jobs': [
+                {
+                    '_class': folder_class,
+                    'name': 'f2',
+                    'url': 'http://localhost:8080/job/f1/job/f2/',
+                },
+            ]},
+        ]},
+    )
+    aiohttp_mock.get(
+        re.compile(r'.+/job/f1/job/f2//api/json\?tree=.+'),
+        payload={'jobs': [
+            {'_class': job_class, 'name': 'a', 'url': '', 'color': 'red'},
+        ]},
+    )
+
+    jenkins.crumb = False
+    jobs = await jenkins.jobs.get_all(tree_depth=1, fields='color')
+    assert sorted(jobs) == ['f1', 'f1/f2', 'f1/f2/a', 'job']
+    assert jobs['f1/f2/a']['color'] == 'red'
+    assert 'jobs' not in jobs['f1']
+
+    tree = jenkins.jobs._construct_jobs_tree(1, ['color', {'lastBuild': ['number']}])
+    assert tree == (
+        'jobs[_class,name,url,color,lastBuild[number],'
+        'jobs[_class,name,url,color,lastBuild[number]]]'
+    )
@@ -0,0 +1,119 @@
+import asyncio
+import re
+import time
+
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aiojenkins.exceptions import JenkinsError
+from aiojenkins.jenkins import Jenkins
+from aiojenkins.limiter import TokenBucket
+from tests import get_host
+
+
+async def test_rate_limit(aiohttp_mock):
+    rate_limit = {
+        'rate': 100,
+        'burst': 1,
+        'methods': {'post': {'max_in_flight': 1}},
+    }
+
+    async with Jenkins(get_host(), rate_limit=rate_limit) as jenkins:
+        jenkins.crumb = False
+
+        aiohttp_mock.get(re.compile(r'.+/api/json'), payload={}, repeat=True)
+
+        started = time.monotonic()
+        await asyncio.gather(*[jenkins.get_status() for _ in range(10)])
+        assert time.monotonic() - started >= 0.08
+
+        bucket = jenkins._limiter.get_bucket('POST')
+        assert bucket.max_in_flight == 1
+        assert bucket.current_rate is None
+
+
+async def test_rate_limit_in_flight_streaming():
+    events = []
+
+    async def slow(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b'first')
+        await asyncio.sleep(0.1)
+        await response.write(b'last')
+        events.append('slow')
+        return response
+
+    async def fast(_):
+        events.append('fast')
+        return web.Response(body=b'fast')
+
+    app = web.Application()
+    app.router.add_get('/slow', slow)
+    app.router.add_get('/fast', fast)
+
+    rate_limit = {'max_in_flight': 1}
+
+    async with TestServer(app) as server:
+        async with Jenkins(str(server.make_url('')), rate_limit=rate_limit) as jenkins:
+            jenkins.crumb = False
+
+            async def read(path):
+                response = await jenkins._request('GET', path, coalesce=False)
+                return await response.read()
+
+            # TC: request is in flight until its body is received
+            slow_task = asyncio.ensure_future(read('/slow'))
+            await asyncio.sleep(0.05)
+            assert await asyncio.gather(slow_task, read('/fast')) == [b'firstlast', b'fast']
+            assert events == ['slow', 'fast']
+
+            # TC: released response frees slot
+            response = await jenkins._request('GET', '/slow', coalesce=False)
+            response.release()
+            assert await asyncio.wait_for(read('/fast'), 1) == b'fast'
+
+
+async def test_rate_limit_throttling():
+    bucket = TokenBucket(rate=10)
+
+    bucket.adjust_rate(429)
+    assert bucket.current_rate == 5
+
+    bucket.adjust_rate(503)
+    bucket.adjust_rate(503)
+    assert bucket.current_rate == 1.25
+
+    bucket.adjust_rate(503)
+    assert bucket.current_rate == 1
+
+    bucket.adjust_rate(200)
+    assert bucket.current_rate == 1.5
+
+
+async def test_rate_limit_retry(aiohttp_mock):
+    retry = {'total': 2, 'factor': 0, 'statuses': [429]}
+
+    aiohttp_mock.get(re.compile(r'.+/api/json'), status=429)
+    aiohttp_mock.get(re.compile(r'.+/api/json'), payload={})
+
+    async with Jenkins(get_host(), retry=retry, rate_limit={'rate': 100}) as jenkins:
+        jenkins.crumb = False
+        await jenkins.get_status()
+
+        # TC: throttled attempt, which is retried, slows down rate
+        bucket = jenkins._limiter.get_bucket('GET')
+        assert bucket.current_rate == 100 / 2 + 100 * 0.05
+
+
+def test_rate_limit_validation():
+    with pytest.raises(JenkinsError):
+        Jenkins(get_host(), rate_limit={'rps': 1})
+
+    with pytest.raises(JenkinsError):
+        Jenkins(get_host(), rate_limit={'rate': 0})
+
+    with pytest.raises(JenkinsError):
+        Jenkins(get_host(), rate_limit={'methods': {'GET': {'methods': {}}}})
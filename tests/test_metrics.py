@@ -0,0 +1,116 @@
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aiojenkins.exceptions import JenkinsError
+from aiojenkins.jenkins import Jenkins
+from aiojenkins.metrics import get_endpoint_template
+
+
+@pytest.mark.parametrize('path, template', [
+    ('/api/json', '/api/json'),
+    ('/job/project/api/json', '/job/{name}/api/json'),
+    ('/job/folder/job/project/12/api/json', '/job/{name}/{build}/api/json'),
+    ('/job/project/lastBuild/consoleText', '/job/{name}/{build}/consoleText'),
+    ('/job/project/3/artifact/dist/app.zip', '/job/{name}/{build}/artifact/{path}'),
+    ('/job/folder/createItem', '/job/{name}/createItem'),
+    ('/computer/api/json', '/computer/api/json'),
+    ('/computer/doCreateItem', '/computer/doCreateItem'),
+    ('/computer/node/toggleOffline', '/computer/{node}/toggleOffline'),
+    ('/queue/item/5/api/json', '/queue/item/{id}/api/json'),
+    ('/view/all/config.xml', '/view/{view}/config.xml'),
+])
+def test_endpoint_template(path, template):
+    assert get_endpoint_template(path) == template
+
+
+async def test_metrics_validation():
+    with pytest.raises(JenkinsError):
+        Jenkins('http://localhost:8080', metrics={'unknown': 1})
+
+    with pytest.raises(JenkinsError):
+        Jenkins('http://localhost:8080', metrics={'buckets': (1, 0.5)})
+
+    with pytest.raises(JenkinsError):
+        Jenkins('http://localhost:8080', metrics={'exporter': 1})
+
+
+async def test_metrics():
+    attempts = []
+
+    async def build_info(request):
+        return web.json_response({'number': int(request.match_info['number'])})
+
+    async def unavailable(request):
+        attempts.append(request.path)
+        return web.Response(status=503 if len(attempts) == 1 else 200)
+
+    app = web.Application()
+    # path of job without folder starts with double slash
+    app.router.add_get('//job/{name}/{number}/api/json', build_info)
+    app.router.add_post('/quietDown', unavailable)
+
+    exported = []
+
+    async with TestServer(app) as server:
+        jenkins = Jenkins(
+            str(server.make_url('')),
+            retry={'total': 2, 'factor': 0, 'statuses': [503], 'methods': ['POST']},
+            metrics={'exporter': exported.append, 'buckets': (1, 10)},
+        )
+
+        async with jenkins:
+            for number in (1, 2, 3):
+                info = await jenkins.builds.get_info('project', number)
+                assert info == {'number': number}
+
+            await jenkins.quiet_down()
+
+            metrics = jenkins.get_metrics()
+
+    assert metrics.buckets == (1, 10)
+    assert metrics.new_connections == 1
+    assert metrics.reused_connections == len(exported) - 1
+    assert metrics.crumb_refreshes == 0
+    assert metrics.retries == 1
+
+    endpoints = {(e.method, e.endpoint): e for e in metrics.endpoints}
+
+    builds = endpoints['GET', '/job/{name}/{build}/api/json']
+    assert builds.requests == 3
+    assert builds.errors == 0
+    assert builds.histogram == (3, 0, 0)
+    assert builds.response_bytes == len(b'{"number": 1}') * 3
+
+    quiet_down = endpoints['POST', '/quietDown']
+    assert quiet_down.requests == 2
+    assert quiet_down.errors == 1
+    assert quiet_down.retries == 1
+
+    assert [m.status for m in exported if m.endpoint == '/quietDown'] == [503, 200]
+
+
+async def test_metrics_disabled():
+    assert Jenkins('http://localhost:8080').get_metrics() == ((), (), 0, 0, 0, 0)
+
+
+async def test_metrics_exporter_error(caplog):
+    def exporter(_):
+        raise ValueError('exporter is broken')
+
+    async def status(_):
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get('/api/json', status)
+
+    async with TestServer(app) as server:
+        async with Jenkins(str(server.make_url('')), metrics={'exporter': exporter}) as jenkins:
+            jenkins.crumb = False
+            assert await jenkins.get_status() == {}
+
+            metrics = jenkins.get_metrics()
+
+    assert metrics.endpoints[0].requests == 1
+    assert 'Metrics exporter failed' in caplog.text
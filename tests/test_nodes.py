@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import re
 
 import pytest
 
@@ -159,3 +160,21 @@ async def test_get_failed_builds(jenkins):
         assert (len(post_failed_builds) - len(pre_failed_builds)) > 0
 
         assert post_failed_builds[-1]['job_name'] == job_name
+
+
+async def test_get_node_info_tree(jenkins, aiohttp_mock):
+    aiohttp_mock.get(
+        re.compile(r'.+/computer/node/api/json\?tree=offline'),
+        payload={'offline': True},
+    )
+    aiohttp_mock.get(
+        re.compile(r'.+/computer/node/api/json\?tree=offline,temporarilyOffline'),
+        payload={'offline': True, 'temporarilyOffline': False},
+    )
+
+    jenkins.crumb = False
+    info = await jenkins.nodes.get_info('node', tree='offline')
+    assert info == {'offline': True}
+
+    info = await jenkins.nodes.get_info('node', tree=['offline', 'temporarilyOffline'])
+    assert info['_disconnected'] is True
@@ -0,0 +1,103 @@
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aiojenkins.jenkins import Jenkins
+from aiojenkins.profiler import Profiler, TimelineEntry
+
+
+async def test_profiler(tmp_path):
+    async def root_jobs(request):
+        url = f'http://{request.host}/job/folder/'
+        return web.json_response({'jobs': [
+            {'_class': 'com.cloudbees.hudson.plugins.folder.Folder', 'name': 'folder', 'url': url},
+            {'_class': 'hudson.model.FreeStyleProject', 'name': 'project', 'url': ''},
+        ]})
+
+    async def folder_jobs(_):
+        return web.json_response({'jobs': [
+            {'_class': 'hudson.model.FreeStyleProject', 'name': 'nested', 'url': ''},
+        ]})
+
+    app = web.Application()
+    app.router.add_get('/api/json', root_jobs)
+    app.router.add_get('/job/folder//api/json', folder_jobs)
+
+    async with TestServer(app) as server:
+        async with Jenkins(str(server.make_url('')), profile=True) as jenkins:
+            jenkins.crumb = False
+
+            jobs = await jenkins.jobs.get_all()
+            assert set(jobs) == {'folder', 'project', 'folder/nested'}
+
+            with Profiler.operation('status'):
+                await jenkins.get_status()
+
+    profiler = jenkins.profiler
+    assert not profiler.recording
+    assert [e.operation for e in profiler.entries] == ['Jobs.get_all', 'Jobs.get_all', 'status']
+
+    for entry in profiler.entries:
+        assert entry.status == 200
+        assert entry.size > 0
+        assert entry.phases.wait >= 0
+
+    assert not profiler.entries[0].reused_connection
+    assert profiler.entries[1].reused_connection
+    assert profiler.entries[1].phases.connect == -1
+
+    path = tmp_path / 'jobs.har'
+    profiler.save_har(str(path))
+
+    har = json.loads(path.read_text())['log']
+    assert [p['id'] for p in har['pages']] == ['Jobs.get_all', 'status']
+    assert [e['pageref'] for e in har['entries']] == ['Jobs.get_all', 'Jobs.get_all', 'status']
+    assert har['entries'][0]['response']['content']['mimeType'] == 'application/json'
+
+    stacks = {line.rsplit(' ', 1)[0] for line in profiler.get_flame_summary().splitlines()}
+    assert 'Jobs.get_all;GET /api/json;wait' in stacks
+    assert 'Jobs.get_all;GET /job/{name}/api/json;wait' in stacks
+    assert 'status;GET /api/json;wait' in stacks
+
+    for entry in har['entries']:
+        assert min(entry['timings'][k] for k in ('send', 'wait', 'receive')) >= 0
+
+    profiler.clear()
+    assert len(profiler.entries) == 0
+
+
+async def test_profiler_per_client(monkeypatch):
+    async def root_jobs(_):
+        return web.json_response({'jobs': []})
+
+    app = web.Application()
+    app.router.add_get('/api/json', root_jobs)
+
+    calls = []
+
+    def find_operation():
+        calls.append(1)
+
+    monkeypatch.setattr('aiojenkins.profiler._find_operation', find_operation)
+
+    async with TestServer(app) as server:
+        # TC: client which isn't closed doesn't make other clients inspect stack
+        profiling = Jenkins(str(server.make_url('')), profile=True)
+
+        async with Jenkins(str(server.make_url(''))) as jenkins:
+            jenkins.crumb = False
+            await jenkins.jobs.get_all()
+
+        assert not calls
+
+        await profiling.close()
+
+
+def test_profiler_max_entries():
+    profiler = Profiler(max_entries=2)
+
+    for i in range(3):
+        profiler.entries.append(TimelineEntry('GET', f'/{i}', None))
+
+    assert [e.url for e in profiler.entries] == ['/1', '/2']
@@ -1,5 +1,9 @@
 import re
 
+import pytest
+
+from aiojenkins.exceptions import JenkinsError
+
 QUEUE_JSON = """
 {
   "_class" : "hudson.model.Queue",
@@ -108,3 +112,32 @@ async def test_cancel(jenkins, aiohttp_mock):
 
     jenkins.crumb = False
     assert await jenkins.queue.cancel(16) is None
+
+
+async def test_get_info_tree(jenkins, aiohttp_mock):
+    aiohttp_mock.get(
+        re.compile(r'.+/queue/item/16/api/json\?depth=1&tree=id,task%5Bname%5D'),
+        payload={'id': 16, 'task': {'name': 'test'}},
+    )
+
+    jenkins.crumb = False
+    item = await jenkins.queue.get_info(16, tree=['id', {'task': ['name']}], depth=1)
+    assert item == {'id': 16, 'task': {'name': 'test'}}
+
+
+async def test_wait_for_build(jenkins, aiohttp_mock):
+    url = re.compile(r'.+/queue/item/16/api/json\?tree=.+')
+
+    aiohttp_mock.get(url, payload={'blocked': True})
+    aiohttp_mock.get(url, payload={'blocked': False})
+    aiohttp_mock.get(url, payload={
+        'blocked': False,
+        'executable': {'number': 3, 'url': 'http://localhost:8080/job/f/job/test/3/'},
+    })
+
+    jenkins.crumb = False
+    assert await jenkins.queue.wait_for_build(16, interval=0.01) == ('f/test', 3)
+
+    aiohttp_mock.get(url, payload={'cancelled': True})
+    with pytest.raises(JenkinsError):
+        await jenkins.queue.wait_for_build(16, interval=0.01)
@@ -0,0 +1,121 @@
+import re
+
+import pytest
+
+from aiojenkins.exceptions import JenkinsError
+from aiojenkins.records import (
+    BuildRecord,
+    JobRecord,
+    NodeRecord,
+    QueueItemRecord,
+)
+
+
+def test_record():
+    build = BuildRecord(number=1, url='http://localhost/job/test/1/')
+
+    assert not hasattr(build, '__dict__')
+    assert build == BuildRecord.from_json({'number': 1, 'url': 'http://localhost/job/test/1/'})
+    assert build != BuildRecord(number=2, url='http://localhost/job/test/2/')
+    assert build.to_dict() == {'number': 1, 'url': 'http://localhost/job/test/1/'}
+    assert repr(build) == "BuildRecord(number=1, url='http://localhost/job/test/1/')"
+
+
+def test_record_interned_strings():
+    records = [
+        JobRecord.from_json({
+            '_class': ''.join(['hudson.model.', 'FreeStyleProject']),
+            'name': f'job{i}',
+            'url': f'http://localhost/job/job{i}/',
+            'color': ''.join(['bl', 'ue']),
+        })
+        for i in range(2)
+    ]
+
+    assert records[0].class_name is records[1].class_name
+    assert records[0].color is records[1].color
+
+
+async def test_builds_get_all_typed(jenkins, aiohttp_mock):
+    aiohttp_mock.get(
+        re.compile(r'.+/job/test/api/json.*'),
+        payload={'allBuilds': [
+            {'number': 2, 'url': 'http://localhost/job/test/2/'},
+            {'number': 1, 'url': 'http://localhost/job/test/1/'},
+        ]}
+    )
+
+    jenkins.crumb = False
+    builds = await jenkins.builds.get_all('test', typed=True)
+    assert [b.number for b in builds] == [2, 1]
+    assert builds[1].url == 'http://localhost/job/test/1/'
+
+
+async def test_jobs_get_all_typed(jenkins, aiohttp_mock):
+    aiohttp_mock.get(
+        re.compile(r'.+/api/json.*'),
+        payload={'jobs': [{
+            '_class': 'hudson.model.FreeStyleProject',
+            'name': 'test',
+            'url': 'http://localhost/job/test/',
+            'color': 'blue',
+        }]}
+    )
+
+    jenkins.crumb = False
+    jobs = await jenkins.jobs.get_all(typed=True)
+    assert jobs == {'test': JobRecord(
+        name='test',
+        url='http://localhost/job/test/',
+        class_name='hudson.model.FreeStyleProject',
+        color='blue',
+    )}
+
+    with pytest.raises(JenkinsError):
+        await jenkins.jobs.get_all(fields=['color'], typed=True)
+
+
+async def test_queue_get_all_typed(jenkins, aiohttp_mock):
+    aiohttp_mock.get(
+        re.compile(r'.+/queue/api/json'),
+        payload={'items': [{
+            '_class': 'hudson.model.Queue$BlockedItem',
+            'blocked': True,
+            'buildable': False,
+            'id': 14,
+            'inQueueSince': 1662756642196,
+            'stuck': False,
+            'task': {'name': 'test', 'url': 'http://localhost/job/test/'},
+            'url': 'queue/item/14/',
+            'why': 'Build #9 is already in progress',
+        }]}
+    )
+
+    jenkins.crumb = False
+    queue = await jenkins.queue.get_all(typed=True)
+    item = queue[14]
+    assert isinstance(item, QueueItemRecord)
+    assert item.task_name == 'test'
+    assert item.blocked is True
+    assert item.in_queue_since == 1662756642196
+
+
+async def test_nodes_get_all_typed(jenkins, aiohttp_mock):
+    aiohttp_mock.get(
+        re.compile(r'.+/computer/api/json'),
+        payload={'computer': [{
+            '_class': 'hudson.model.Hudson$MasterComputer',
+            'displayName': 'master',
+            'idle': True,
+            'numExecutors': 2,
+            'offline': False,
+            'offlineCauseReason': '',
+            'temporarilyOffline': False,
+        }]}
+    )
+
+    jenkins.crumb = False
+    nodes = await jenkins.nodes.get_all(typed=True)
+    assert isinstance(nodes['master'], NodeRecord)
+    assert nodes['master'].num_executors == 2
+    assert nodes['master'].offline is False
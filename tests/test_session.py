@@ -0,0 +1,137 @@
+import asyncio
+import re
+import time
+
+from email.utils import formatdate
+from http import HTTPStatus
+
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from aiojenkins.exceptions import JenkinsError
+from aiojenkins.jenkins import Jenkins
+from aiojenkins.session import CircuitBreaker, _parse_retry_after
+from tests import get_host
+
+STATUS_URL = re.compile(r'.+/api/json')
+
+
+async def test_retry_after(aiohttp_mock):
+    retry = {'total': 3, 'statuses': [HTTPStatus.SERVICE_UNAVAILABLE]}
+
+    aiohttp_mock.get(STATUS_URL, status=503, headers={'Retry-After': '0.1'})
+    aiohttp_mock.get(STATUS_URL, payload={'mode': 'NORMAL'})
+
+    async with Jenkins(get_host(), retry=retry) as jenkins:
+        jenkins.crumb = False
+
+        started = time.monotonic()
+        assert await jenkins.get_status() == {'mode': 'NORMAL'}
+        assert time.monotonic() - started >= 0.1
+
+
+async def test_retry_methods(aiohttp_mock):
+    retry = {'total': 3, 'factor': 0, 'statuses': [HTTPStatus.INTERNAL_SERVER_ERROR]}
+
+    # TC: POST isn't retried by default
+    aiohttp_mock.post(re.compile(r'.+/quietDown'), status=500)
+    aiohttp_mock.post(re.compile(r'.+/quietDown'))
+
+    async with Jenkins(get_host(), retry=retry) as jenkins:
+        jenkins.crumb = False
+
+        with pytest.raises(JenkinsError):
+            await jenkins.quiet_down()
+
+    aiohttp_mock.post(re.compile(r'.+/quietDown'), status=500)
+    aiohttp_mock.post(re.compile(r'.+/quietDown'))
+
+    async with Jenkins(get_host(), retry={**retry, 'methods': ['post']}) as jenkins:
+        jenkins.crumb = False
+        await jenkins.quiet_down()
+
+
+async def test_circuit_breaker(aiohttp_mock):
+    retry = {
+        'total': 2,
+        'factor': 0,
+        'statuses': [HTTPStatus.BAD_GATEWAY],
+        'breaker': {'threshold': 2, 'timeout': 0.1},
+    }
+
+    aiohttp_mock.get(STATUS_URL, status=502, repeat=True)
+
+    async with Jenkins(get_host(), retry=retry) as jenkins:
+        jenkins.crumb = False
+
+        with pytest.raises(JenkinsError, match='502'):
+            await jenkins.get_status()
+
+        # TC: breaker is open, request isn't sent
+        with pytest.raises(JenkinsError, match='Circuit breaker'):
+            await jenkins.get_status()
+
+        assert sum(len(calls) for calls in aiohttp_mock.requests.values()) == 2
+
+
+def test_circuit_breaker_states():
+    breaker = CircuitBreaker(threshold=1, timeout=0)
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.is_open is True
+
+    # TC: half-open allows only one probe
+    breaker.before_request()
+    with pytest.raises(JenkinsError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.is_open is False
+
+    # TC: aborted probe opens breaker again
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_abort()
+    assert breaker.is_open is True
+    breaker.before_request()
+
+    with pytest.raises(JenkinsError):
+        CircuitBreaker(threshold=0)
+
+
+async def test_circuit_breaker_cancelled_probe():
+    breaker = CircuitBreaker(threshold=1, timeout=0)
+    breaker.record_failure()
+
+    delays = [10]
+
+    async def handler(_):
+        if delays:
+            await asyncio.sleep(delays.pop())
+        return web.json_response({'mode': 'NORMAL'})
+
+    app = web.Application()
+    app.router.add_get('/api/json', handler)
+
+    async with TestServer(app) as server:
+        retry = {'total': 1, 'breaker': breaker}
+
+        async with Jenkins(str(server.make_url('')), retry=retry) as jenkins:
+            jenkins.crumb = False
+
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(jenkins.get_status(), 0.1)
+
+            # TC: breaker isn't stuck in half-open state after cancelled probe
+            assert await jenkins.get_status() == {'mode': 'NORMAL'}
+            assert breaker.is_open is False
+
+
+def test_parse_retry_after():
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after('5') == 5
+    assert _parse_retry_after('invalid') is None
+    assert 0 < _parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
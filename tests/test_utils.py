@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 
 from aiojenkins.exceptions import JenkinsError
+from aiojenkins.utils import _iter_concurrently, construct_tree
 
 
 def test_build_start(jenkins):
@@ -18,3 +21,29 @@ def test_build_start(jenkins):
 
     with pytest.raises(JenkinsError):
         jenkins.builds.parse_url('xxx')
+
+
+def test_construct_tree():
+    assert construct_tree('name,url') == 'name,url'
+    assert construct_tree(['name', 'url']) == 'name,url'
+    assert construct_tree(
+        ['name', {'lastBuild': ['number', 'result'], 'jobs': 'name'}]
+    ) == 'name,lastBuild[number,result],jobs[name]'
+
+
+async def test_iter_concurrently_close():
+    cancelled = []
+
+    async def func(item):
+        try:
+            await asyncio.sleep(item)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    results = _iter_concurrently(func, [0, 10, 10], concurrency=3)
+    assert (await results.__anext__())[1] == 0
+
+    # TC: workers are cancelled and awaited when iteration is stopped
+    await results.aclose()
+    assert cancelled == [10, 10]
@@ -0,0 +1,184 @@
+import asyncio
+import itertools
+import re
+
+import pytest
+
+from aioresponses import CallbackResult
+
+from aiojenkins.exceptions import JenkinsError, JenkinsNotFoundError
+from aiojenkins.watcher import (
+    BuildFinished,
+    BuildStarted,
+    NodeOffline,
+    QueueItemAdded,
+    QueueItemLeft,
+    _diff_jobs,
+)
+
+
+def builds(*items):
+    return {'allBuilds': [
+        {'number': n, 'building': building, 'result': result, 'duration': 1}
+        for n, building, result in items
+    ]}
+
+
+async def test_wait_for_completion(jenkins, aiohttp_mock):
+    url = re.compile(r'.+/job/job/api/json\?tree=.+')
+
+    aiohttp_mock.get(url, payload=builds((3, True, None), (2, True, None)))
+    aiohttp_mock.get(url, payload=builds((3, True, None), (2, False, 'SUCCESS')))
+    aiohttp_mock.get(url, payload=builds((4, True, None), (3, False, 'FAILURE')))
+
+    jenkins.crumb = False
+    jenkins.watcher.interval = 0.01
+
+    results = await asyncio.gather(
+        jenkins.builds.wait_for_completion('job', 2),
+        jenkins.builds.wait_for_completion('job', 3),
+        jenkins.builds.wait_for_completion('job', 3),
+    )
+
+    assert [r['result'] for r in results] == ['SUCCESS', 'FAILURE', 'FAILURE']
+    assert sum(len(calls) for calls in aiohttp_mock.requests.values()) == 3
+
+
+async def test_wait_for_missing_build(jenkins, aiohttp_mock):
+    url = re.compile(r'.+/job/job/api/json\?tree=.+')
+
+    aiohttp_mock.get(url, payload=builds((3, False, 'SUCCESS'), (1, False, 'SUCCESS')))
+
+    jenkins.crumb = False
+    with pytest.raises(JenkinsNotFoundError):
+        await jenkins.builds.wait_for_completion('job', 2)
+
+    aiohttp_mock.get(url, status=404)
+    with pytest.raises(JenkinsNotFoundError):
+        await jenkins.builds.wait_for_completion('job', 2)
+
+
+async def test_wait_for_old_build(jenkins, aiohttp_mock):
+    def callback(url, **_):
+        start, end = map(int, re.search(r'\{(\d+),(\d+)\}', url.query['tree']).groups())
+        # 300 finished builds, newest first
+        numbers = range(300, 0, -1)[start:end]
+        return CallbackResult(payload=builds(*[(n, False, 'SUCCESS') for n in numbers]))
+
+    aiohttp_mock.get(re.compile(r'.+/job/job/api/json\?tree=.+'), callback=callback, repeat=True)
+
+    jenkins.crumb = False
+    jenkins.watcher.interval = 0.01
+
+    build = await jenkins.builds.wait_for_completion('job', 5)
+    assert build['number'] == 5
+
+    # TC: range is sized by newest build, so old build is found by one refresh
+    assert sum(len(calls) for calls in aiohttp_mock.requests.values()) == 2
+
+
+async def test_wait_for_completion_malformed_response(jenkins, aiohttp_mock):
+    url = re.compile(r'.+/job/job/api/json\?tree=.+')
+
+    aiohttp_mock.get(url, payload={})
+    aiohttp_mock.get(url, exception=asyncio.TimeoutError())
+    aiohttp_mock.get(url, payload=builds((2, False, 'SUCCESS')))
+
+    jenkins.crumb = False
+    jenkins.watcher.interval = 0.01
+
+    build = await asyncio.wait_for(jenkins.builds.wait_for_completion('job', 2), 5)
+    assert build['result'] == 'SUCCESS'
+
+
+async def test_watch_events(jenkins, aiohttp_mock):
+    computer_url = re.compile(r'.+/computer/api/json\?tree=.+')
+    queue_url = re.compile(r'.+/queue/api/json\?tree=.+')
+
+    aiohttp_mock.get(computer_url, payload={'computer': [
+        {'displayName': 'node', 'offline': False},
+    ]})
+    aiohttp_mock.get(computer_url, payload={'computer': [
+        {'displayName': 'node', 'offline': True, 'offlineCauseReason': 'test'},
+    ]})
+    aiohttp_mock.get(queue_url, payload={'items': [
+        {'id': 1, 'task': {'name': 'a'}},
+    ]})
+    aiohttp_mock.get(queue_url, payload={'items': [
+        {'id': 2, 'task': {'name': 'b'}},
+    ]})
+
+    jenkins.crumb = False
+    events = []
+
+    async for event in jenkins.watch(interval=0.01, kinds=['nodes', 'queue']):
+        events.append(event)
+        if len(events) == 3:
+            break
+
+    assert set(events) == {
+        NodeOffline('node', 'test'),
+        QueueItemAdded(2, 'b'),
+        QueueItemLeft(1, 'a'),
+    }
+
+
+async def test_watch_events_poll_errors(jenkins, aiohttp_mock, monkeypatch):
+    computer_url = re.compile(r'.+/computer/api/json\?tree=.+')
+
+    aiohttp_mock.get(computer_url, payload={})
+    aiohttp_mock.get(computer_url, exception=asyncio.TimeoutError())
+    aiohttp_mock.get(computer_url, payload={'computer': [
+        {'displayName': 'node', 'offline': False},
+    ]})
+    aiohttp_mock.get(computer_url, payload={'computer': [
+        {'displayName': 'node', 'offline': True, 'offlineCauseReason': 'test'},
+    ]}, repeat=True)
+
+    jenkins.crumb = False
+
+    async for event in jenkins.watch(interval=0.01, kinds=['nodes']):
+        assert event == NodeOffline('node', 'test')
+        break
+
+    def diff(*_):
+        raise ValueError('broken')
+
+    # subscriber gets error of broken poller instead of waiting forever
+    monkeypatch.setattr('aiojenkins.watcher._diff_nodes', diff)
+
+    with pytest.raises(ValueError):
+        async for _ in jenkins.watch(interval=0.01, kinds=['nodes']):
+            pass
+
+
+async def test_watch_events_slow_subscriber(jenkins, aiohttp_mock):
+    ids = itertools.count()
+
+    def callback(*_, **__):
+        return CallbackResult(payload={'items': [{'id': next(ids), 'task': {'name': 'a'}}]})
+
+    aiohttp_mock.get(re.compile(r'.+/queue/api/json\?tree=.+'), callback=callback, repeat=True)
+
+    jenkins.crumb = False
+
+    with pytest.raises(JenkinsError):
+        jenkins.watch(kinds=['builds'])
+
+    with pytest.raises(JenkinsError):
+        jenkins.watch(max_events=0)
+
+    # TC: subscriber which doesn't consume events is finished by error
+    with pytest.raises(JenkinsError):
+        async for _ in jenkins.watch(interval=0.01, kinds=['queue'], max_events=3):
+            await asyncio.sleep(0.1)
+
+
+def test_diff_jobs():
+    old = {'job': {1: (True, None), 2: (False, 'SUCCESS')}}
+    new = {'job': {1: (False, 'FAILURE'), 2: (False, 'SUCCESS'), 3: (True, None)}}
+
+    assert _diff_jobs(old, new) == [
+        BuildFinished('job', 1, 'FAILURE'),
+        BuildStarted('job', 3),
+    ]